@@ -0,0 +1,299 @@
+"""
+Suite de benchmarks - Gestor de Países
+Responsabilidad: Medir tiempos, throughput y memoria de los caminos críticos
+
+Uso:
+    python -m benchmarks.ejecutar [--filas 1000 100000] [--repeticiones 5]
+                                  [--salida resultados.json]
+                                  [--comparar base.json --tolerancia 0.2]
+                                  [--casos filtrar ordenar]
+
+Con --comparar, termina con código 1 si algún caso es más lento que la base
+por encima de la tolerancia.
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics as estadistica
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+from benchmarks.generador import generar_csv
+from src.models.coleccion import ColeccionPaises
+from src.services import pais_service
+from src.utils import statistics
+from src.utils.cache import limpiar_caches
+from src.utils.csv_handler import (
+    cargar_paises, cargar_paises_con_snapshot, cargar_paises_paralelo, guardar_cambios, guardar_paises, iter_paises,
+)
+from src.utils.registro_cambios import borrar_registro
+
+
+TAMANOS = (1_000, 10_000, 100_000)
+HILOS_LECTORES = 4
+CAMBIOS_POR_GUARDADO = 100
+
+
+# -----------------------
+# Casos
+# -----------------------
+# Cada caso recibe el contexto (tabla cargada, rutas) y ejecuta una operación.
+def _leer_en_paralelo(estrategia):
+    def caso(ctx):
+        coleccion = ColeccionPaises(ctx["paises"], estrategia)
+        hilos = [
+            threading.Thread(target=coleccion.leer, args=(statistics.estadisticas_por_continente,))
+            for _ in range(HILOS_LECTORES)
+        ]
+        for hilo in hilos:
+            hilo.start()
+        for hilo in hilos:
+            hilo.join()
+    return caso
+
+
+def _recorrer_lotes(ctx):
+    for _ in iter_paises(ctx["csv"]):
+        pass
+
+
+def _guardar_cambios(ctx):
+    """Modifica unas filas y las guarda por el registro de cambios, sin reescribir el CSV."""
+    # Sin el registro de la llamada anterior, para que ninguna repetición dispare la compactación
+    borrar_registro(ctx["incremental"])
+    paises = ctx["paises"]
+    for i in range(min(CAMBIOS_POR_GUARDADO, len(paises))):
+        paises[i]["poblacion"] += 1
+    guardar_cambios(paises, ctx["incremental"])
+
+
+CASOS = {
+    # Carga y guardado
+    "cargar_paises": lambda ctx: cargar_paises(ctx["csv"]),
+    "cargar_paises_con_snapshot": lambda ctx: cargar_paises_con_snapshot(ctx["csv"], ctx["snapshot"]),
+    "cargar_paises_paralelo": lambda ctx: cargar_paises_paralelo(ctx["csv"], umbral_bytes=0),
+    "iter_paises": _recorrer_lotes,
+    "guardar_paises": lambda ctx: guardar_paises(ctx["paises"], ctx["salida"]),
+    "guardar_cambios": _guardar_cambios,
+    # pais_service
+    "filtrar_por_continente": lambda ctx: pais_service.filtrar_por_continente(ctx["paises"], "Asia"),
+    "filtrar_por_poblacion": lambda ctx: pais_service.filtrar_por_poblacion(ctx["paises"], 1_000_000, 50_000_000),
+    "filtrar_por_superficie": lambda ctx: pais_service.filtrar_por_superficie(ctx["paises"], 10_000, 1_000_000),
+    "buscar_pais": lambda ctx: pais_service.buscar_pais(ctx["paises"], "ara"),
+    "autocompletar_pais": lambda ctx: pais_service.autocompletar_pais(ctx["paises"], "ca"),
+    "ordenar_por_nombre": lambda ctx: pais_service.ordenar_por_nombre(ctx["paises"]),
+    "ordenar_por_poblacion": lambda ctx: pais_service.ordenar_por_poblacion(ctx["paises"]),
+    "ordenar_por_superficie": lambda ctx: pais_service.ordenar_por_superficie(ctx["paises"]),
+    "ordenar_por_poblacion_top10": lambda ctx: pais_service.ordenar_por_poblacion(ctx["paises"], limite=10),
+    # statistics
+    "promedio_poblacion": lambda ctx: statistics.promedio_poblacion(ctx["paises"]),
+    "promedio_superficie": lambda ctx: statistics.promedio_superficie(ctx["paises"]),
+    "pais_mas_poblado": lambda ctx: statistics.pais_mas_poblado(ctx["paises"]),
+    "pais_menos_poblado": lambda ctx: statistics.pais_menos_poblado(ctx["paises"]),
+    "pais_mas_grande": lambda ctx: statistics.pais_mas_grande(ctx["paises"]),
+    "pais_mas_pequeno": lambda ctx: statistics.pais_mas_pequeno(ctx["paises"]),
+    "estadisticas_continente": lambda ctx: statistics.estadisticas_continente(ctx["paises"], "Europa"),
+    "estadisticas_por_continente": lambda ctx: statistics.estadisticas_por_continente(ctx["paises"]),
+    "cantidad_por_continente": lambda ctx: statistics.cantidad_por_continente(ctx["paises"]),
+    "obtener_continentes": lambda ctx: statistics.obtener_continentes(ctx["paises"]),
+    "resumen_estadistico": lambda ctx: statistics.resumen_estadistico(ctx["paises"]),
+    "agrupar_por": lambda ctx: statistics.agrupar_por(ctx["paises"], "continente"),
+    "densidades": lambda ctx: statistics.densidades(ctx["paises"]),
+    "densidad_poblacional": lambda ctx: [statistics.densidad_poblacional(p) for p in ctx["paises"]],
+    # statistics en streaming (leen el CSV por lotes, sin la tabla)
+    "promedio_poblacion_lotes": lambda ctx: statistics.promedio_poblacion_lotes(iter_paises(ctx["csv"])),
+    "pais_mas_poblado_lotes": lambda ctx: statistics.pais_mas_poblado_lotes(iter_paises(ctx["csv"])),
+    "estadisticas_continente_lotes":
+        lambda ctx: statistics.estadisticas_continente_lotes(iter_paises(ctx["csv"]), "Europa"),
+    # Concurrencia (ver ColeccionPaises)
+    "lectura_paralela_cerrojo": _leer_en_paralelo("cerrojo"),
+    "lectura_paralela_copia": _leer_en_paralelo("copia"),
+}
+
+
+# -----------------------
+# Medición
+# -----------------------
+def _con_tabla_nueva(ctx):
+    """Contexto con una copia de la tabla, sin índices, agregados ni resultados guardados."""
+    return dict(ctx, paises=ctx["paises"].copiar())
+
+
+def _cronometrar(caso, ctx):
+    inicio = time.perf_counter()
+    caso(ctx)
+    return time.perf_counter() - inicio
+
+
+def medir(caso, ctx, repeticiones):
+    """
+    Ejecuta un caso varias veces y mide tiempo y memoria pico.
+
+    Cada repetición mide dos llamadas sobre una copia nueva de la tabla:
+
+    - en frío (mejor_s, mediana_s): la primera llamada, que incluye construir
+      los índices, permutaciones y agregados que use el caso;
+    - en caliente (mejor_caliente_s, mediana_caliente_s): una segunda llamada
+      con esas estructuras ya construidas, vaciando antes las caches
+      versionadas para medir el cálculo y no un acierto de cache.
+
+    La memoria se mide en una ejecución en frío aparte con tracemalloc, que no
+    cuenta para los tiempos.
+
+    Returns:
+        dict: mejor_s, mediana_s, mejor_caliente_s, mediana_caliente_s y memoria_pico_bytes
+    """
+    frio, caliente = [], []
+    for _ in range(repeticiones):
+        ctx_repeticion = _con_tabla_nueva(ctx)
+        frio.append(_cronometrar(caso, ctx_repeticion))
+        limpiar_caches()
+        caliente.append(_cronometrar(caso, ctx_repeticion))
+
+    ctx_repeticion = _con_tabla_nueva(ctx)
+    tracemalloc.start()
+    try:
+        caso(ctx_repeticion)
+        _, pico = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "mejor_s": min(frio),
+        "mediana_s": estadistica.median(frio),
+        "mejor_caliente_s": min(caliente),
+        "mediana_caliente_s": estadistica.median(caliente),
+        "memoria_pico_bytes": pico,
+    }
+
+
+def ejecutar(tamanos=TAMANOS, repeticiones=5, casos=None, semilla=42, informar=print):
+    """
+    Corre la suite para cada tamaño de dataset.
+
+    Args:
+        tamanos (iterable): Cantidades de filas a generar
+        repeticiones (int): Repeticiones por caso
+        casos (iterable, optional): Subcadenas para elegir casos (por defecto, todos)
+        semilla (int): Semilla del generador
+        informar (callable): Recibe una línea de progreso por caso
+
+    Returns:
+        dict: Resultados con metadatos del entorno, listos para guardar en JSON
+    """
+    elegidos = {
+        nombre: caso for nombre, caso in CASOS.items()
+        if not casos or any(patron in nombre for patron in casos)
+    }
+    resultados = []
+    with tempfile.TemporaryDirectory() as directorio:
+        for filas in tamanos:
+            ctx = {
+                "csv": generar_csv(os.path.join(directorio, f"paises_{filas}.csv"), filas, semilla),
+                "snapshot": os.path.join(directorio, f"paises_{filas}.snap"),
+                "salida": os.path.join(directorio, f"salida_{filas}.csv"),
+                "incremental": os.path.join(directorio, f"incremental_{filas}.csv"),
+            }
+            # guardar_cambios escribe el registro junto a su propia copia, no junto al CSV que leen los demás casos
+            shutil.copyfile(ctx["csv"], ctx["incremental"])
+            ctx["paises"] = cargar_paises(ctx["csv"])
+            for nombre, caso in elegidos.items():
+                medicion = medir(caso, ctx, repeticiones)
+                medicion.update({
+                    "caso": nombre,
+                    "filas": filas,
+                    "repeticiones": repeticiones,
+                    "filas_por_s": filas / medicion["mejor_s"] if medicion["mejor_s"] else None,
+                })
+                resultados.append(medicion)
+                informar(
+                    f"{nombre:<30} {filas:>10,} filas  {medicion['mejor_s'] * 1000:>10.3f} ms"
+                    f"  (caliente {medicion['mejor_caliente_s'] * 1000:>10.3f} ms)"
+                    f"  {medicion['memoria_pico_bytes'] / 1024:>10.1f} KiB"
+                )
+
+    return {
+        "fecha": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "plataforma": platform.platform(),
+        "semilla": semilla,
+        "resultados": resultados,
+    }
+
+
+MEDIDAS = ("mejor_s", "mejor_caliente_s")
+
+
+def comparar(actual, base, tolerancia=0.2, minimo_s=0.0005):
+    """
+    Compara dos corridas caso por caso, usando el mejor tiempo en frío y en caliente.
+
+    Args:
+        actual (dict): Resultado de ejecutar()
+        base (dict): Resultado guardado de una corrida anterior
+        tolerancia (float): Empeoramiento relativo permitido (0.2 = 20 %)
+        minimo_s (float): Diferencia absoluta por debajo de la cual se considera ruido
+
+    Returns:
+        list: Regresiones como dicts con caso, filas, medida, base_s, actual_s y relacion
+    """
+    resultados_base = {(r["caso"], r["filas"]): r for r in base["resultados"]}
+    regresiones = []
+    for resultado in actual["resultados"]:
+        previo = resultados_base.get((resultado["caso"], resultado["filas"]), {})
+        for medida in MEDIDAS:
+            anterior, tiempo = previo.get(medida), resultado.get(medida)
+            if not anterior or tiempo is None:
+                continue
+            relacion = tiempo / anterior
+            if relacion > 1 + tolerancia and tiempo - anterior > minimo_s:
+                regresiones.append({
+                    "caso": resultado["caso"],
+                    "filas": resultado["filas"],
+                    "medida": medida,
+                    "base_s": anterior,
+                    "actual_s": tiempo,
+                    "relacion": relacion,
+                })
+    return regresiones
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Benchmarks del gestor de países")
+    parser.add_argument("--filas", type=int, nargs="+", default=list(TAMANOS),
+                        help="Tamaños de dataset (por ejemplo 1000 1000000 10000000)")
+    parser.add_argument("--repeticiones", type=int, default=5)
+    parser.add_argument("--semilla", type=int, default=42)
+    parser.add_argument("--casos", nargs="+", help="Subcadenas de los casos a correr")
+    parser.add_argument("--salida", help="Archivo JSON donde guardar los resultados")
+    parser.add_argument("--comparar", help="JSON de una corrida anterior para detectar regresiones")
+    parser.add_argument("--tolerancia", type=float, default=0.2)
+    opciones = parser.parse_args(argumentos)
+
+    resultado = ejecutar(opciones.filas, opciones.repeticiones, opciones.casos, opciones.semilla)
+    if opciones.salida:
+        with open(opciones.salida, "w", encoding="utf-8") as archivo:
+            json.dump(resultado, archivo, indent=2, ensure_ascii=False)
+        print(f"✓ Resultados guardados en {opciones.salida}")
+
+    if opciones.comparar:
+        with open(opciones.comparar, encoding="utf-8") as archivo:
+            base = json.load(archivo)
+        regresiones = comparar(resultado, base, opciones.tolerancia)
+        for r in regresiones:
+            print(f"✗ {r['caso']} ({r['filas']:,} filas, {r['medida']}): {r['base_s'] * 1000:.3f} ms -> "
+                  f"{r['actual_s'] * 1000:.3f} ms (x{r['relacion']:.2f})")
+        if regresiones:
+            return 1
+        print("✓ Sin regresiones respecto de la base")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
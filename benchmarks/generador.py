@@ -0,0 +1,61 @@
+"""
+Generador de datos sintéticos
+Responsabilidad: Crear archivos con el formato de paises.csv y el tamaño que se pida
+"""
+import csv
+import random
+
+from src.utils.validations import CONTINENTES_VALIDOS
+
+
+SILABAS = (
+    "ar", "be", "ca", "do", "el", "fi", "ga", "hu", "is", "ja", "ke", "li", "mo", "na",
+    "ñu", "or", "pe", "qui", "ro", "sa", "tá", "ú", "ve", "xi", "yo", "zé",
+)
+
+
+def nombre_sintetico(numero, generador):
+    """Nombre pronunciable, con tildes y único gracias al sufijo numérico."""
+    silabas = "".join(generador.choice(SILABAS) for _ in range(generador.randint(2, 4)))
+    return f"{silabas.capitalize()} {numero}"
+
+
+def generar_paises(filas, semilla=42):
+    """
+    Genera países sintéticos de forma reproducible.
+
+    Args:
+        filas (int): Cantidad de países
+        semilla (int): Semilla del generador aleatorio
+
+    Returns:
+        generator: Diccionarios con nombre, poblacion, superficie y continente
+    """
+    generador = random.Random(semilla)
+    for numero in range(filas):
+        yield {
+            "nombre": nombre_sintetico(numero, generador),
+            # Distribución sesgada como la real: muchos países chicos y pocos enormes
+            "poblacion": int(generador.lognormvariate(15.5, 2.0)) + 1,
+            "superficie": int(generador.lognormvariate(11.5, 2.2)) + 1,
+            "continente": generador.choice(CONTINENTES_VALIDOS),
+        }
+
+
+def generar_csv(path_csv, filas, semilla=42):
+    """
+    Escribe un CSV sintético fila por fila (sirve también para 10^7 filas).
+
+    Args:
+        path_csv (str): Ruta del archivo a crear
+        filas (int): Cantidad de países
+        semilla (int): Semilla del generador aleatorio
+
+    Returns:
+        str: La ruta del archivo creado
+    """
+    with open(path_csv, "w", encoding="utf-8", newline="") as archivo:
+        writer = csv.DictWriter(archivo, fieldnames=["nombre", "poblacion", "superficie", "continente"])
+        writer.writeheader()
+        writer.writerows(generar_paises(filas, semilla))
+    return path_csv
@@ -0,0 +1,26 @@
+"""
+Punto de entrada - Gestor de Países
+
+Uso:
+    python -m src                      menú interactivo (igual que python src/main.py)
+    python -m src menu [--page-size N] menú interactivo
+    python -m src <comando> ...        list, search, filter, sort, stats, import (ver src/cli.py)
+
+Cada comando importa solo los módulos que necesita.
+"""
+import sys
+
+
+def main(argumentos=None):
+    argumentos = sys.argv[1:] if argumentos is None else list(argumentos)
+
+    if not argumentos or argumentos[0] == "menu":
+        from src.main import main as menu
+        return menu(argumentos[1:])
+
+    from src.cli import main as cli
+    return cli(argumentos)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
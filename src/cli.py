@@ -0,0 +1,255 @@
+"""
+Modo de comandos - Gestor de Países
+Responsabilidad: Ejecutar consultas sin menú y escribir los resultados en streaming
+
+Uso (ver python -m src <comando> --help):
+    python -m src list
+    python -m src search ARG
+    python -m src filter --continent Asia --min-pop 50000000
+    python -m src sort --by poblacion --desc --limit 10
+    python -m src stats [--by-continent]
+    python -m src import nuevos.csv
+
+Los países se escriben en NDJSON (una línea JSON por país, por defecto), CSV
+o tabla, a medida que se generan, sin armar antes todo el resultado.
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+
+from src.utils.serializacion import a_json
+
+
+RUTA_CSV = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "paises.csv")
+CAMPOS = ("nombre", "poblacion", "superficie", "continente")
+FORMATOS = ("ndjson", "csv", "table")
+
+
+# -----------------------
+# Salida
+# -----------------------
+def _plano(registro):
+    """Para CSV: los países anidados (p. ej. pais_mas_poblado) se reducen a su nombre."""
+    return {
+        clave: valor["nombre"] if hasattr(valor, "keys") else valor
+        for clave, valor in registro.items()
+    }
+
+
+def escribir_ndjson(registros, salida):
+    """Escribe un objeto JSON por línea, a medida que se recorren los registros."""
+    codificar = json.JSONEncoder(ensure_ascii=False, default=a_json).encode
+    salida.writelines(codificar(dict(r)) + "\n" for r in registros)
+
+
+def escribir_csv(registros, salida, campos=CAMPOS):
+    """Escribe los registros como CSV con encabezado, a medida que se recorren."""
+    writer = csv.DictWriter(salida, fieldnames=campos, extrasaction="ignore", lineterminator="\n")
+    writer.writeheader()
+    writer.writerows(_plano(r) for r in registros)
+
+
+def escribir_paises(paises, formato, salida=None):
+    """
+    Escribe países en el formato pedido.
+
+    Args:
+        paises (iterable): Países (puede ser un iterador perezoso)
+        formato (str): ndjson, csv o table
+        salida (file, optional): Stream de texto (por defecto, sys.stdout)
+    """
+    salida = salida or sys.stdout
+    if formato == "csv":
+        escribir_csv(paises, salida)
+    elif formato == "table":
+        from src.utils.render import escribir_tabla
+        # La tabla necesita todas las filas para calcular los anchos
+        escribir_tabla(paises if hasattr(paises, "__len__") else list(paises), salida)
+    else:
+        escribir_ndjson(paises, salida)
+
+
+def _cargar(opciones):
+    from src.utils.csv_handler import cargar_paises_con_snapshot
+    return cargar_paises_con_snapshot(opciones.csv)
+
+
+# -----------------------
+# Comandos
+# -----------------------
+def comando_list(opciones):
+    escribir_paises(_cargar(opciones), opciones.format)
+
+
+def comando_search(opciones):
+    from src.services.pais_service import buscar_pais
+    escribir_paises(buscar_pais(_cargar(opciones), opciones.nombre), opciones.format)
+
+
+def comando_filter(opciones):
+    from src.services.consultas import Consulta
+
+    consulta = Consulta.con_filtros(
+        _cargar(opciones),
+        continente=opciones.continent,
+        min_poblacion=opciones.min_pop,
+        max_poblacion=opciones.max_pop,
+        min_superficie=opciones.min_area,
+        max_superficie=opciones.max_area,
+    )
+    # La consulta es perezosa: cada país se escribe apenas cumple los filtros
+    escribir_paises(iter(consulta), opciones.format)
+
+
+def comando_sort(opciones):
+    from src.services import pais_service
+
+    ordenar = {
+        "nombre": pais_service.ordenar_por_nombre,
+        "poblacion": pais_service.ordenar_por_poblacion,
+        "superficie": pais_service.ordenar_por_superficie,
+    }[opciones.by]
+    paises = ordenar(_cargar(opciones), opciones.desc, opciones.limit, opciones.offset)
+    escribir_paises(paises, opciones.format)
+
+
+def comando_stats(opciones):
+    from src.utils.statistics import estadisticas_por_continente, resumen_estadistico
+
+    paises = _cargar(opciones)
+    if opciones.by_continent:
+        registros = list(estadisticas_por_continente(paises).values())
+    else:
+        registros = [resumen_estadistico(paises)]
+
+    if opciones.format == "ndjson":
+        escribir_ndjson(registros, sys.stdout)
+    elif opciones.format == "table":
+        from src.utils.render import escribir_registros
+        escribir_registros(registros, sys.stdout)
+    else:
+        escribir_csv(registros, sys.stdout, campos=list(registros[0]) if registros else [])
+
+
+def _leer_json(linea, posicion, errores):
+    try:
+        return json.loads(linea.strip())
+    except json.JSONDecodeError as e:
+        # Se informa junto con los errores de validación; None no pasa la validación
+        errores[posicion] = [f"JSON inválido: {e}"]
+        return None
+
+
+def _leer_filas(archivo, formato, errores):
+    """
+    Returns:
+        iterable: Registros leídos; en NDJSON, las líneas que no son JSON válido
+        quedan como None y su error se guarda en `errores` (posición -> mensajes)
+    """
+    if formato == "ndjson":
+        lineas = (linea for linea in archivo if linea.strip())
+        return (_leer_json(linea, posicion, errores) for posicion, linea in enumerate(lineas))
+    return csv.DictReader(archivo)
+
+
+def comando_import(opciones):
+    """
+    Agrega los países de un CSV o NDJSON al dataset, todos o ninguno.
+    Los errores se informan en NDJSON por stderr, con el número de registro.
+    """
+    from src.services.pais_service import agregar_paises_lote
+    from src.utils.csv_handler import guardar_cambios
+
+    paises = _cargar(opciones)
+    errores_lectura = {}
+    if opciones.archivo == "-":
+        filas = _leer_filas(sys.stdin, opciones.from_format, errores_lectura)
+        exito, cantidad, errores = agregar_paises_lote(paises, filas)
+    else:
+        with open(opciones.archivo, encoding="utf-8", newline="") as archivo:
+            filas = _leer_filas(archivo, opciones.from_format, errores_lectura)
+            exito, cantidad, errores = agregar_paises_lote(paises, filas)
+
+    if not exito:
+        escribir_ndjson((
+            {"registro": posicion + 1, "errores": errores_lectura.get(posicion, mensajes)}
+            for posicion, mensajes in errores
+        ), sys.stderr)
+        print(f"❌ Importación cancelada: {len(errores)} registros con errores", file=sys.stderr)
+        return 1
+    if not guardar_cambios(paises, opciones.csv):
+        return 1
+    print(f"✅ Se importaron {cantidad} países", file=sys.stderr)
+    return 0
+
+
+# -----------------------
+# Argumentos
+# -----------------------
+def crear_parser():
+    parser = argparse.ArgumentParser(prog="python -m src", description="Gestor de países (modo comandos)")
+    comunes = argparse.ArgumentParser(add_help=False)
+    comunes.add_argument("--csv", default=RUTA_CSV, help="Archivo CSV de países")
+    comunes.add_argument("--format", choices=FORMATOS, default="ndjson", help="Formato de salida")
+
+    subcomandos = parser.add_subparsers(dest="comando", required=True)
+    subcomandos.add_parser("menu", help="Menú interactivo")
+
+    subcomandos.add_parser("list", parents=[comunes], help="Todos los países").set_defaults(funcion=comando_list)
+
+    search = subcomandos.add_parser("search", parents=[comunes], help="Búsqueda parcial por nombre")
+    search.add_argument("nombre")
+    search.set_defaults(funcion=comando_search)
+
+    filtro = subcomandos.add_parser("filter", parents=[comunes], help="Filtrar por continente y rangos")
+    filtro.add_argument("--continent")
+    filtro.add_argument("--min-pop", type=int)
+    filtro.add_argument("--max-pop", type=int)
+    filtro.add_argument("--min-area", type=int)
+    filtro.add_argument("--max-area", type=int)
+    filtro.set_defaults(funcion=comando_filter)
+
+    orden = subcomandos.add_parser("sort", parents=[comunes], help="Ordenar por un campo")
+    orden.add_argument("--by", choices=("nombre", "poblacion", "superficie"), default="nombre")
+    orden.add_argument("--desc", action="store_true")
+    orden.add_argument("--limit", type=int)
+    orden.add_argument("--offset", type=int, default=0)
+    orden.set_defaults(funcion=comando_sort)
+
+    stats = subcomandos.add_parser("stats", parents=[comunes], help="Estadísticas generales")
+    stats.add_argument("--by-continent", action="store_true", help="Una fila por continente")
+    stats.set_defaults(funcion=comando_stats)
+
+    importar = subcomandos.add_parser("import", parents=[comunes], help="Agregar países desde un archivo")
+    importar.add_argument("archivo", help="CSV o NDJSON a importar ('-' para leer de stdin)")
+    importar.add_argument("--from-format", choices=("csv", "ndjson"), default="csv")
+    importar.set_defaults(funcion=comando_import)
+    return parser
+
+
+def main(argumentos=None):
+    """
+    Returns:
+        int: Código de salida (0 si todo salió bien)
+    """
+    opciones = crear_parser().parse_args(argumentos)
+    if opciones.comando == "menu":
+        from src.main import main as menu
+        return menu([])
+
+    try:
+        return opciones.funcion(opciones) or 0
+    except BrokenPipeError:
+        # La salida se cerró antes de tiempo (p. ej. "| head"): no es un error
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 0
+    except (OSError, ValueError) as e:
+        # Archivo inexistente o ilegible: se informa sin traceback
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
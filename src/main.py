@@ -2,28 +2,82 @@
 Aplicación principal - Gestor de Países
 TP Integrador - Programación 1
 """
+import argparse
 import os
 import sys
+import threading
 
-# Agregar el directorio padre al path para importar módulos
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RUTA_CSV = os.path.join(RAIZ, 'data', 'paises.csv')
 
-from src.utils.csv_handler import cargar_paises, guardar_paises
-from src.services.pais_service import (
-    listar_paises, filtrar_por_continente, ordenar_por_poblacion, 
-    ordenar_por_superficie, ordenar_por_nombre, buscar_pais,
-    filtrar_por_poblacion, filtrar_por_superficie, agregar_pais, actualizar_pais
-)
-from src.utils.statistics import (
-    promedio_poblacion, promedio_superficie, pais_mas_poblado, 
-    pais_menos_poblado, pais_mas_grande, pais_mas_pequeno, obtener_continentes
-)
-from src.utils.validations import validar_datos_pais, validar_entero_positivo
+# Ejecutado como script (python src/main.py): agregar el directorio padre al path
+if not __package__:
+    sys.path.insert(0, RAIZ)
+
+# Los módulos de servicios, estadísticas y validaciones se importan dentro de
+# cada opción del menú: el menú aparece sin esperar a cargarlos.
+
+
+class CargaEnSegundoPlano:
+    """Carga el CSV en un hilo aparte mientras se muestra el menú."""
+
+    def __init__(self, ruta_csv):
+        self.ruta_csv = ruta_csv
+        self._paises = None
+        self._error = None
+        self._hilo = threading.Thread(target=self._cargar, name="carga-paises", daemon=True)
+        self._hilo.start()
+
+    def _cargar(self):
+        try:
+            from src.utils.csv_handler import cargar_paises_con_snapshot
+            self._paises = cargar_paises_con_snapshot(self.ruta_csv)
+        except Exception as e:
+            self._error = e
+
+    def paises(self):
+        """
+        Espera a que termine la carga y devuelve los países.
+
+        Raises:
+            Exception: El error que haya ocurrido durante la carga
+        """
+        self._hilo.join()
+        if self._error is not None:
+            raise self._error
+        return self._paises
+
+
+def esperar_carga(carga):
+    """Espera la carga e informa el resultado; devuelve None si falló"""
+    try:
+        paises = carga.paises()
+    except Exception as e:
+        print(f"❌ Error al cargar los datos: {e}")
+        return None
+    
+    if not paises:
+        print("❌ No se pudieron cargar los datos de países.")
+        return None
+    
+    print(f"✅ Se cargaron {len(paises)} países exitosamente.")
+    return paises
 
 
 def limpiar_pantalla():
-    """Limpia la pantalla de la consola"""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    """Limpia la pantalla de la consola con códigos ANSI (sin lanzar un subproceso)"""
+    print("\033[2J\033[H", end="", flush=True)
+
+
+def mostrar_paises(paises, tamano_pagina=None):
+    """Muestra países en tabla; pagina solo si se pidió y la salida es una terminal"""
+    from src.services.pais_service import listar_paises
+    from src.utils.render import paginar
+    
+    if tamano_pagina and sys.stdout.isatty():
+        paginar(paises, tamano_pagina)
+    else:
+        listar_paises(paises)
 
 
 def pausar():
@@ -48,8 +102,12 @@ def mostrar_menu_principal():
     print("=" * 60)
 
 
-def menu_filtros(paises):
+def menu_filtros(paises, tamano_pagina=None):
     """Submenú para filtrar países"""
+    from src.services.pais_service import (
+        filtrar_por_continente, filtrar_por_poblacion, filtrar_por_superficie
+    )
+    
     while True:
         print("\n" + "=" * 60)
         print("                    FILTROS")
@@ -83,7 +141,7 @@ def menu_filtros(paises):
             if paises_filtrados:
                 print(f"\n🌍 PAÍSES DE {continente_elegido.upper()}:")
                 print("-" * 60)
-                listar_paises(paises_filtrados)
+                mostrar_paises(paises_filtrados, tamano_pagina)
             else:
                 print(f"❌ No se encontraron países en {continente_elegido}")
 
@@ -101,7 +159,7 @@ def menu_filtros(paises):
                 if paises_filtrados:
                     print(f"\n👥 PAÍSES CON POBLACIÓN ENTRE {min_poblacion:,} Y {max_poblacion:,}:")
                     print("-" * 60)
-                    listar_paises(paises_filtrados)
+                    mostrar_paises(paises_filtrados, tamano_pagina)
                 else:
                     print("❌ No se encontraron países con ese rango de población")
             except ValueError:
@@ -121,7 +179,7 @@ def menu_filtros(paises):
                 if paises_filtrados:
                     print(f"\n🗺️  PAÍSES CON SUPERFICIE ENTRE {min_superficie:,} Y {max_superficie:,} km²:")
                     print("-" * 60)
-                    listar_paises(paises_filtrados)
+                    mostrar_paises(paises_filtrados, tamano_pagina)
                 else:
                     print("❌ No se encontraron países con ese rango de superficie")
             except ValueError:
@@ -135,8 +193,10 @@ def menu_filtros(paises):
         pausar()
 
 
-def menu_ordenar(paises):
+def menu_ordenar(paises, tamano_pagina=None):
     """Submenú para ordenar países"""
+    from src.services.pais_service import ordenar_por_nombre, ordenar_por_poblacion, ordenar_por_superficie
+    
     while True:
         print("\n" + "=" * 60)
         print("                    ORDENAR PAÍSES")
@@ -153,18 +213,21 @@ def menu_ordenar(paises):
             orden = input("¿Orden ascendente (A) o descendente (D)? ").strip().upper()
             descendente = (orden == "D")
             
+            cantidad = input("Cantidad de países a mostrar (Enter para todos): ").strip()
+            limite = int(cantidad) if cantidad.isdigit() else None
+            
             if opcion == "1":
-                paises_ordenados = ordenar_por_nombre(paises, descendente)
+                paises_ordenados = ordenar_por_nombre(paises, descendente, limite)
                 print("\n📝 PAÍSES ORDENADOS POR NOMBRE:")
             elif opcion == "2":
-                paises_ordenados = ordenar_por_poblacion(paises, descendente)
+                paises_ordenados = ordenar_por_poblacion(paises, descendente, limite)
                 print("\n👥 PAÍSES ORDENADOS POR POBLACIÓN:")
             else:
-                paises_ordenados = ordenar_por_superficie(paises, descendente)
+                paises_ordenados = ordenar_por_superficie(paises, descendente, limite)
                 print("\n🗺️  PAÍSES ORDENADOS POR SUPERFICIE:")
             
             print("-" * 60)
-            listar_paises(paises_ordenados)
+            mostrar_paises(paises_ordenados, tamano_pagina)
             
         elif opcion == "4":
             break
@@ -176,42 +239,42 @@ def menu_ordenar(paises):
 
 def menu_estadisticas(paises):
     """Muestra todas las estadísticas disponibles"""
+    from src.utils.statistics import cantidad_por_continente, resumen_estadistico
+    
     print("\n" + "=" * 60)
     print("                    ESTADÍSTICAS GENERALES")
     print("=" * 60)
     
+    # Todas las estadísticas generales en una sola pasada
+    resumen = resumen_estadistico(paises)
+    
     # Población
     print("\n📊 POBLACIÓN:")
-    promedio_pob = promedio_poblacion(paises)
-    print(f"  • Promedio mundial: {promedio_pob:,.0f} habitantes")
+    print(f"  • Promedio mundial: {resumen['promedio_poblacion']:,.0f} habitantes")
     
-    mas_poblado = pais_mas_poblado(paises)
+    mas_poblado = resumen["pais_mas_poblado"]
     if mas_poblado:
         print(f"  • País más poblado: {mas_poblado['nombre']} ({mas_poblado['poblacion']:,} hab.)")
     
-    menos_poblado = pais_menos_poblado(paises)
+    menos_poblado = resumen["pais_menos_poblado"]
     if menos_poblado:
         print(f"  • País menos poblado: {menos_poblado['nombre']} ({menos_poblado['poblacion']:,} hab.)")
     
     # Superficie
     print("\n🗺️  SUPERFICIE:")
-    promedio_sup = promedio_superficie(paises)
-    print(f"  • Promedio mundial: {promedio_sup:,.0f} km²")
+    print(f"  • Promedio mundial: {resumen['promedio_superficie']:,.0f} km²")
     
-    mas_grande = pais_mas_grande(paises)
+    mas_grande = resumen["pais_mas_grande"]
     if mas_grande:
         print(f"  • País más grande: {mas_grande['nombre']} ({mas_grande['superficie']:,} km²)")
     
-    mas_pequeno = pais_mas_pequeno(paises)
+    mas_pequeno = resumen["pais_mas_pequeno"]
     if mas_pequeno:
         print(f"  • País más pequeño: {mas_pequeno['nombre']} ({mas_pequeno['superficie']:,} km²)")
     
     # Países por continente
     print("\n🌍 DISTRIBUCIÓN POR CONTINENTE:")
-    continentes = {}
-    for pais in paises:
-        cont = pais['continente']
-        continentes[cont] = continentes.get(cont, 0) + 1
+    continentes = cantidad_por_continente(paises)
     
     for continente, cantidad in sorted(continentes.items()):
         print(f"  • {continente}: {cantidad} países")
@@ -219,48 +282,54 @@ def menu_estadisticas(paises):
     print(f"\n📈 Total de países en el sistema: {len(paises)}")
 
 
-def main():
+def main(argumentos=None):
     """Función principal de la aplicación"""
+    parser = argparse.ArgumentParser(description="Gestor de países")
+    parser.add_argument("--page-size", type=int, default=None,
+                        help="Cantidad de países por página en los listados")
+    parser.add_argument("--profile", action="store_true",
+                        help="Medir las funciones de carga, servicio y estadísticas (reporte al salir)")
+    opciones = parser.parse_args(argumentos)
+    tamano_pagina = opciones.page_size
+    if opciones.profile or os.environ.get("PAISES_PROFILE", "") not in ("", "0"):
+        from src.utils import profiling
+        profiling.activar_desde_entorno()
+    
     print("=" * 60)
     print("         GESTOR DE PAÍSES - PROGRAMACIÓN 1")
     print("=" * 60)
     
-    # Cargar datos
-    try:
-        ruta_csv = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'paises.csv')
-        paises = cargar_paises(ruta_csv)
-        
-        if not paises:
-            print("❌ No se pudieron cargar los datos de países.")
-            return
-        
-        print(f"✅ Se cargaron {len(paises)} países exitosamente.")
-        
-    except Exception as e:
-        print(f"❌ Error al cargar los datos: {e}")
-        return
+    # Cargar datos en segundo plano: el menú se muestra sin esperar al CSV
+    carga = CargaEnSegundoPlano(RUTA_CSV)
+    paises = None
     
     # Menú principal
     while True:
         mostrar_menu_principal()
         opcion = input("\nSeleccione una opción (1-9): ").strip()
         
+        if paises is None and opcion in ("1", "2", "3", "4", "5", "6", "7", "8"):
+            paises = esperar_carga(carga)
+            if paises is None:
+                return
+        
         if opcion == "1":
             # Listar todos los países
             print("\n📋 LISTADO COMPLETO DE PAÍSES:")
             print("-" * 60)
-            listar_paises(paises)
+            mostrar_paises(paises, tamano_pagina)
             pausar()
             
         elif opcion == "2":
             # Buscar país
             nombre = input("\nIngrese el nombre del país a buscar: ").strip()
             if nombre:
+                from src.services.pais_service import buscar_pais
                 resultados = buscar_pais(paises, nombre)
                 if resultados:
                     print(f"\n🔍 RESULTADOS DE BÚSQUEDA PARA '{nombre}':")
                     print("-" * 60)
-                    listar_paises(resultados)
+                    mostrar_paises(resultados, tamano_pagina)
                 else:
                     print(f"❌ No se encontraron países con '{nombre}'")
             else:
@@ -280,6 +349,8 @@ def main():
             continente = input("Continente: ").strip()
             
             # Validar datos
+            from src.services.pais_service import agregar_pais
+            from src.utils.validations import validar_datos_pais
             es_valido, datos, errores = validar_datos_pais(nombre, poblacion, superficie, continente)
             
             if es_valido:
@@ -299,6 +370,8 @@ def main():
             print("-" * 60)
             
             nombre = input("Nombre del país a actualizar: ").strip()
+            from src.services.pais_service import actualizar_pais, buscar_pais
+            from src.utils.validations import validar_entero_positivo
             
             # Buscar si existe
             if buscar_pais(paises, nombre):
@@ -332,11 +405,11 @@ def main():
             
         elif opcion == "5":
             # Filtros
-            menu_filtros(paises)
+            menu_filtros(paises, tamano_pagina)
             
         elif opcion == "6":
             # Ordenar
-            menu_ordenar(paises)
+            menu_ordenar(paises, tamano_pagina)
             
         elif opcion == "7":
             # Estadísticas
@@ -345,8 +418,9 @@ def main():
             
         elif opcion == "8":
             # Guardar cambios
+            from src.utils.csv_handler import guardar_cambios
             try:
-                if guardar_paises(paises, ruta_csv):
+                if guardar_cambios(paises, RUTA_CSV):
                     print("✅ Cambios guardados exitosamente en el archivo CSV")
                 else:
                     print("❌ No se pudieron guardar los cambios")
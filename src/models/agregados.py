@@ -0,0 +1,150 @@
+"""
+Agregados mantenidos sobre la tabla de países
+Responsabilidad: Tener sumas, cantidades y extremos siempre actualizados
+"""
+import heapq
+import threading
+
+
+CAMPOS_AGREGADOS = ("poblacion", "superficie")
+TODOS = None  # Clave de grupo para el total de la tabla
+
+
+class AgregadosMantenidos:
+    """
+    Sumas, cantidades y extremos de la tabla, globales y por continente.
+
+    - Las sumas y cantidades se actualizan en O(1) con cada alta o cambio.
+    - Los máximos y mínimos se guardan en heaps con borrado perezoso: un cambio
+      agrega una entrada nueva y las entradas viejas se descartan recién cuando
+      llegan al tope y ya no coinciden con la tabla (O(log n) amortizado).
+
+    Los continentes se identifican por su código en la tabla.
+
+    Las consultas también modifican los heaps (los construyen la primera vez y
+    descartan entradas viejas), así que ese trabajo se hace bajo un cerrojo
+    interno: varios lectores pueden consultar a la vez sin que dos descarten
+    la misma entrada.
+    """
+
+    def __init__(self, tabla):
+        self._tabla = tabla
+        self._cantidades = {TODOS: len(tabla)}
+        self._sumas = {TODOS: {campo: sum(tabla.columna(campo)) for campo in CAMPOS_AGREGADOS}}
+        self._heaps = {}
+        self._cerrojo = threading.Lock()
+
+        columnas = [tabla.columna(campo) for campo in CAMPOS_AGREGADOS]
+        for codigo, *valores in zip(tabla.codigos_continente(), *columnas):
+            self._cantidades[codigo] = self._cantidades.get(codigo, 0) + 1
+            sumas = self._sumas.setdefault(codigo, dict.fromkeys(CAMPOS_AGREGADOS, 0))
+            for campo, valor in zip(CAMPOS_AGREGADOS, valores):
+                sumas[campo] += valor
+
+    # -----------------------
+    # Mantenimiento
+    # -----------------------
+    def al_agregar(self, id_fila):
+        """Incorpora la fila recién agregada a la tabla."""
+        codigo = self._tabla.codigos_continente()[id_fila]
+        for grupo in (TODOS, codigo):
+            self._cantidades[grupo] = self._cantidades.get(grupo, 0) + 1
+            sumas = self._sumas.setdefault(grupo, dict.fromkeys(CAMPOS_AGREGADOS, 0))
+            for campo in CAMPOS_AGREGADOS:
+                sumas[campo] += self._tabla.valor(id_fila, campo)
+        self._empujar(id_fila, codigo)
+
+    def al_actualizar(self, id_fila, campo, anterior, nuevo):
+        """
+        Refleja el cambio de un campo de la fila (la tabla ya tiene el valor nuevo).
+
+        Args:
+            id_fila (int): Fila modificada
+            campo (str): poblacion, superficie o continente
+            anterior, nuevo: Valores antes y después del cambio (códigos para continente)
+        """
+        if campo == "continente":
+            for grupo, signo in ((anterior, -1), (nuevo, 1)):
+                self._cantidades[grupo] = self._cantidades.get(grupo, 0) + signo
+                sumas = self._sumas.setdefault(grupo, dict.fromkeys(CAMPOS_AGREGADOS, 0))
+                for campo_numerico in CAMPOS_AGREGADOS:
+                    sumas[campo_numerico] += signo * self._tabla.valor(id_fila, campo_numerico)
+        elif campo in CAMPOS_AGREGADOS:
+            codigo = self._tabla.codigos_continente()[id_fila]
+            for grupo in (TODOS, codigo):
+                self._sumas[grupo][campo] += nuevo - anterior
+        else:
+            return
+        self._empujar(id_fila, self._tabla.codigos_continente()[id_fila])
+
+    def _empujar(self, id_fila, codigo):
+        with self._cerrojo:
+            for (grupo, campo, es_maximo), heap in self._heaps.items():
+                if grupo is TODOS or grupo == codigo:
+                    valor = self._tabla.valor(id_fila, campo)
+                    heapq.heappush(heap, (-valor if es_maximo else valor, id_fila))
+                    if len(heap) > 2 * len(self._tabla) + 16:
+                        self._heaps[(grupo, campo, es_maximo)] = self._construir_heap(grupo, campo, es_maximo)
+
+    # -----------------------
+    # Consultas
+    # -----------------------
+    def cantidad(self, grupo=TODOS):
+        """Cantidad de países del grupo (código de continente o TODOS)."""
+        return self._cantidades.get(grupo, 0)
+
+    def suma(self, campo, grupo=TODOS):
+        """Suma de un campo en el grupo."""
+        return self._sumas.get(grupo, {}).get(campo, 0)
+
+    def promedio(self, campo, grupo=TODOS):
+        """Promedio de un campo en el grupo, 0 si el grupo está vacío."""
+        cantidad = self.cantidad(grupo)
+        if not cantidad:
+            return 0
+        return self.suma(campo, grupo) / cantidad
+
+    def cantidades_por_continente(self):
+        """
+        Returns:
+            dict: Código de continente -> cantidad de países (solo grupos no vacíos)
+        """
+        return {
+            grupo: cantidad for grupo, cantidad in self._cantidades.items()
+            if grupo is not TODOS and cantidad > 0
+        }
+
+    def extremo(self, campo, maximo=True, grupo=TODOS):
+        """
+        Devuelve el id de la primera fila con el valor máximo (o mínimo) del campo.
+
+        Returns:
+            int: Id de la fila, None si el grupo está vacío
+        """
+        if not self.cantidad(grupo):
+            return None
+        clave = (grupo, campo, maximo)
+        codigos = self._tabla.codigos_continente()
+        with self._cerrojo:
+            heap = self._heaps.get(clave)
+            if heap is None:
+                heap = self._heaps[clave] = self._construir_heap(grupo, campo, maximo)
+
+            while heap:
+                valor, id_fila = heap[0]
+                actual = self._tabla.valor(id_fila, campo)
+                if (-actual if maximo else actual) == valor and (grupo is TODOS or codigos[id_fila] == grupo):
+                    return id_fila
+                heapq.heappop(heap)  # Entrada vieja: se descarta
+        return None
+
+    def _construir_heap(self, grupo, campo, es_maximo):
+        columna = self._tabla.columna(campo)
+        codigos = self._tabla.codigos_continente()
+        heap = [
+            (-valor if es_maximo else valor, id_fila)
+            for id_fila, valor in enumerate(columna)
+            if grupo is TODOS or codigos[id_fila] == grupo
+        ]
+        heapq.heapify(heap)
+        return heap
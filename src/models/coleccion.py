@@ -0,0 +1,185 @@
+"""
+Colección de países para uso concurrente
+Responsabilidad: Permitir lecturas en paralelo y escrituras exclusivas desde varios hilos
+"""
+import sys
+import threading
+from contextlib import contextmanager
+
+from src.models.pais import PaisTable
+
+
+CERROJO = "cerrojo"  # Lectores en paralelo, escritor exclusivo
+COPIA = "copia"      # Copy-on-write: los lectores toman una instantánea sin bloquear
+ESTRATEGIAS = (CERROJO, COPIA)
+
+
+def gil_desactivado():
+    """
+    Indica si el intérprete corre sin GIL (CPython free-threaded, 3.13t o posterior).
+
+    Returns:
+        bool: True si los hilos de Python ejecutan bytecode en paralelo
+    """
+    esta_activo = getattr(sys, "_is_gil_enabled", None)
+    return esta_activo is not None and not esta_activo()
+
+
+class CerrojoLecturaEscritura:
+    """
+    Cerrojo de lectores/escritor para hilos.
+
+    Varios lectores pueden tenerlo a la vez; un escritor espera a que salgan
+    todos y, mientras escribe, nadie más entra. Los escritores en espera tienen
+    prioridad sobre lectores nuevos para no quedar esperando indefinidamente.
+    """
+
+    def __init__(self):
+        self._condicion = threading.Condition(threading.Lock())
+        self._lectores = 0
+        self._escribiendo = False
+        self._escritores_esperando = 0
+
+    def adquirir_lectura(self):
+        with self._condicion:
+            while self._escribiendo or self._escritores_esperando:
+                self._condicion.wait()
+            self._lectores += 1
+
+    def liberar_lectura(self):
+        with self._condicion:
+            self._lectores -= 1
+            if not self._lectores:
+                self._condicion.notify_all()
+
+    def adquirir_escritura(self):
+        with self._condicion:
+            self._escritores_esperando += 1
+            try:
+                while self._escribiendo or self._lectores:
+                    self._condicion.wait()
+            finally:
+                self._escritores_esperando -= 1
+            self._escribiendo = True
+
+    def liberar_escritura(self):
+        with self._condicion:
+            self._escribiendo = False
+            self._condicion.notify_all()
+
+    @contextmanager
+    def lectura(self):
+        self.adquirir_lectura()
+        try:
+            yield
+        finally:
+            self.liberar_lectura()
+
+    @contextmanager
+    def escritura(self):
+        self.adquirir_escritura()
+        try:
+            yield
+        finally:
+            self.liberar_escritura()
+
+
+def _copiar(paises):
+    if isinstance(paises, PaisTable):
+        return paises.copiar()
+    return [dict(p) for p in paises]
+
+
+class ColeccionPaises:
+    """
+    Envoltorio thread-safe sobre una lista o PaisTable de países.
+
+    Estrategias:
+
+    - ``cerrojo``: las lecturas comparten un cerrojo de lectores/escritor y las
+      escrituras lo toman en exclusiva. Las escrituras son baratas (se modifica
+      la colección en el lugar).
+    - ``copia``: copy-on-write. Leer solo toma la referencia a la colección
+      vigente, sin bloquear; escribir copia la colección, modifica la copia y
+      la publica con una única asignación. Conviene cuando casi todo son
+      lecturas, sobre todo sin GIL, donde el contador de lectores del cerrojo
+      se vuelve un punto de contención entre núcleos.
+
+    Con ``estrategia="auto"`` se usa ``copia`` si el intérprete corre sin GIL
+    y ``cerrojo`` en otro caso; ``modo_sin_gil`` indica cuál fue el caso.
+
+    Ejemplo::
+
+        coleccion = ColeccionPaises(paises)
+        with coleccion.lectura() as p:
+            asia = filtrar_por_continente(p, "Asia")
+        coleccion.escribir(agregar_pais, "Atlántida", 1, 1, "Oceanía")
+    """
+
+    def __init__(self, paises, estrategia="auto"):
+        """
+        Args:
+            paises (list | PaisTable): Colección inicial (pasa a ser propiedad de la colección)
+            estrategia (str): "cerrojo", "copia" o "auto"
+
+        Raises:
+            ValueError: Si la estrategia no existe
+        """
+        self.modo_sin_gil = gil_desactivado()
+        if estrategia == "auto":
+            estrategia = COPIA if self.modo_sin_gil else CERROJO
+        if estrategia not in ESTRATEGIAS:
+            raise ValueError(f"Estrategia desconocida: {estrategia}")
+        self.estrategia = estrategia
+        self._paises = paises
+        self._cerrojo = CerrojoLecturaEscritura()
+        self._escritores = threading.Lock()
+
+    def __len__(self):
+        return len(self.instantanea())
+
+    def instantanea(self):
+        """
+        Devuelve la colección vigente.
+
+        Con ``copia`` es una instantánea que ninguna escritura va a modificar.
+        Con ``cerrojo`` es la colección compartida: para leerla de forma
+        consistente hay que usar lectura().
+        """
+        return self._paises
+
+    @contextmanager
+    def lectura(self):
+        """Context manager que entrega la colección para leerla de forma consistente."""
+        if self.estrategia == COPIA:
+            yield self._paises
+            return
+        with self._cerrojo.lectura():
+            yield self._paises
+
+    @contextmanager
+    def escritura(self):
+        """
+        Context manager que entrega la colección para modificarla en exclusiva.
+
+        Con ``copia`` entrega una copia; si el bloque termina sin errores, la
+        copia reemplaza a la colección vigente y, si falla, se descarta.
+        """
+        if self.estrategia == COPIA:
+            with self._escritores:
+                copia = _copiar(self._paises)
+                yield copia
+                self._paises = copia
+            return
+        with self._cerrojo.escritura():
+            yield self._paises
+
+    def leer(self, funcion, *args, **kwargs):
+        """Ejecuta funcion(paises, *args, **kwargs) dentro de una lectura."""
+        with self.lectura() as paises:
+            return funcion(paises, *args, **kwargs)
+
+    def escribir(self, funcion, *args, **kwargs):
+        """Ejecuta funcion(paises, *args, **kwargs) dentro de una escritura."""
+        with self.escritura() as paises:
+            return funcion(paises, *args, **kwargs)
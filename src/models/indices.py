@@ -0,0 +1,145 @@
+"""
+Índices secundarios sobre la tabla de países
+Responsabilidad: Responder consultas sin recorrer todas las filas
+"""
+from bisect import bisect_left, bisect_right, insort
+
+
+class IndiceOrdenado:
+    """
+    Índice ordenado de un campo numérico.
+
+    Guarda dos listas paralelas ordenadas por (valor, id): los valores del
+    campo y el identificador de la fila. Las consultas por rango se resuelven
+    con bisect en O(log n + k) y el índice se mantiene con cada alta o cambio.
+    """
+
+    def __init__(self, valores=()):
+        """
+        Args:
+            valores (sequence): Valor del campo para cada fila, indexado por id
+        """
+        self._ids = sorted(range(len(valores)), key=valores.__getitem__)
+        self._claves = [valores[i] for i in self._ids]
+
+    def __len__(self):
+        return len(self._ids)
+
+    def _posicion(self, valor, id_fila):
+        inicio = bisect_left(self._claves, valor)
+        fin = bisect_right(self._claves, valor, inicio)
+        return bisect_left(self._ids, id_fila, inicio, fin)
+
+    def insertar(self, valor, id_fila):
+        """Agrega la fila id_fila con el valor indicado."""
+        posicion = self._posicion(valor, id_fila)
+        self._claves.insert(posicion, valor)
+        self._ids.insert(posicion, id_fila)
+
+    def eliminar(self, valor, id_fila):
+        """
+        Quita la fila id_fila, que debe estar indexada con el valor indicado.
+
+        Raises:
+            KeyError: Si la fila no está en el índice con ese valor
+        """
+        posicion = self._posicion(valor, id_fila)
+        if posicion == len(self._ids) or self._ids[posicion] != id_fila or self._claves[posicion] != valor:
+            raise KeyError(id_fila)
+        del self._claves[posicion]
+        del self._ids[posicion]
+
+    def actualizar(self, anterior, nuevo, id_fila):
+        """Mueve la fila id_fila de su valor anterior al nuevo."""
+        if anterior != nuevo:
+            self.eliminar(anterior, id_fila)
+            self.insertar(nuevo, id_fila)
+
+    def _limites(self, minimo, maximo):
+        return bisect_left(self._claves, minimo), bisect_right(self._claves, maximo)
+
+    def rango(self, minimo, maximo):
+        """
+        Devuelve los ids de las filas con minimo <= valor <= maximo.
+
+        Returns:
+            list: Ids ordenados por valor
+        """
+        inicio, fin = self._limites(minimo, maximo)
+        return self._ids[inicio:fin]
+
+    def contar_rango(self, minimo, maximo):
+        """Cuenta las filas con minimo <= valor <= maximo en O(log n)."""
+        inicio, fin = self._limites(minimo, maximo)
+        return max(fin - inicio, 0)
+
+
+def trigramas(texto):
+    """Devuelve el conjunto de subcadenas de 3 caracteres de un texto."""
+    return {texto[i:i + 3] for i in range(len(texto) - 2)}
+
+
+class IndiceTrigramas:
+    """
+    Índice de texto sobre nombres normalizados (sin tildes y en minúsculas).
+
+    - Búsqueda por subcadena: cada trigrama apunta al conjunto de ids que lo
+      contienen; se intersectan los conjuntos de los trigramas de la consulta,
+      empezando por el más chico, y se verifican los candidatos.
+    - Autocompletado: una lista ordenada de (nombre, id) permite encontrar
+      todos los nombres con un prefijo mediante bisect.
+    """
+
+    def __init__(self, nombres=()):
+        """
+        Args:
+            nombres (iterable): Nombres ya normalizados, en orden de id
+        """
+        self._nombres = []
+        self._postings = {}
+        for id_fila, nombre in enumerate(nombres):
+            self._nombres.append(nombre)
+            for trigrama in trigramas(nombre):
+                self._postings.setdefault(trigrama, set()).add(id_fila)
+        self._ordenados = sorted((nombre, i) for i, nombre in enumerate(self._nombres))
+
+    def agregar(self, nombre, id_fila):
+        """Indexa el nombre normalizado de una fila nueva (id_fila debe ser el siguiente id)."""
+        self._nombres.append(nombre)
+        for trigrama in trigramas(nombre):
+            self._postings.setdefault(trigrama, set()).add(id_fila)
+        insort(self._ordenados, (nombre, id_fila))
+
+    def buscar(self, consulta):
+        """
+        Devuelve los ids cuyos nombres contienen la consulta (ya normalizada).
+
+        Returns:
+            list: Ids en orden ascendente
+        """
+        claves = trigramas(consulta)
+        if not claves:
+            # Consultas de menos de 3 caracteres: se recorren los nombres ya normalizados
+            return [i for i, nombre in enumerate(self._nombres) if consulta in nombre]
+        
+        conjuntos = []
+        for trigrama in claves:
+            ids = self._postings.get(trigrama)
+            if not ids:
+                return []
+            conjuntos.append(ids)
+        conjuntos.sort(key=len)
+        
+        candidatos = conjuntos[0].intersection(*conjuntos[1:])
+        return sorted(i for i in candidatos if consulta in self._nombres[i])
+
+    def con_prefijo(self, prefijo):
+        """
+        Devuelve los ids cuyos nombres empiezan con el prefijo (ya normalizado).
+
+        Returns:
+            list: Ids en orden alfabético de nombre
+        """
+        inicio = bisect_left(self._ordenados, (prefijo,))
+        fin = bisect_left(self._ordenados, (prefijo + "\U0010ffff",), inicio)
+        return [id_fila for _, id_fila in self._ordenados[inicio:fin]]
@@ -0,0 +1,557 @@
+"""
+Modelo de datos de países
+Responsabilidad: Almacenamiento columnar y compacto de la colección de países
+"""
+import heapq
+import threading
+from array import array
+from collections.abc import Mapping
+
+from src.models.agregados import AgregadosMantenidos
+from src.models.indices import IndiceOrdenado, IndiceTrigramas
+from src.utils.validations import normalizar
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional
+    np = None
+
+
+CAMPOS = ("nombre", "poblacion", "superficie", "continente")
+CAMPOS_NUMERICOS = ("poblacion", "superficie")
+
+
+class PaisFila(Mapping):
+    """
+    Vista de una fila de la tabla con la misma interfaz que un diccionario de país.
+
+    No copia los datos: cada acceso lee la columna correspondiente de la tabla,
+    y las asignaciones se escriben de vuelta en ella.
+    """
+
+    __slots__ = ("_tabla", "_id")
+
+    def __init__(self, tabla, id_fila):
+        self._tabla = tabla
+        self._id = id_fila
+
+    def __getitem__(self, campo):
+        return self._tabla.valor(self._id, campo)
+
+    def __setitem__(self, campo, valor):
+        self._tabla._asignar(self._id, campo, valor)
+
+    def __iter__(self):
+        return iter(CAMPOS)
+
+    def __len__(self):
+        return len(CAMPOS)
+
+    def __repr__(self):
+        return repr(dict(self))
+
+
+class PaisTable:
+    """
+    Colección de países almacenada por columnas.
+
+    - poblacion y superficie se guardan en ``array('q')`` (enteros de 64 bits).
+    - continente se guarda como un código entero pequeño que apunta a una
+      lista de categorías.
+    - los nombres se guardan en un único buffer UTF-8 con una tabla de offsets.
+
+    Se comporta como una lista de diccionarios para el resto del sistema:
+    ``len()``, iteración, indexado y ``append()`` devuelven/aceptan filas.
+
+    ``version`` aumenta con cada alta o modificación, y sirve para saber si un
+    resultado calculado antes sigue siendo válido.
+
+    Los índices y agregados se construyen la primera vez que una lectura los
+    pide. Esa construcción se hace bajo un cerrojo interno y cada estructura se
+    publica recién cuando está completa, así varios hilos pueden leer la misma
+    tabla a la vez (las escrituras siguen necesitando acceso exclusivo, ver
+    ColeccionPaises).
+    """
+
+    def __init__(self):
+        self._poblacion = array("q")
+        self._superficie = array("q")
+        self._continente = array("H")
+        self._categorias = []
+        self._codigos = {}
+        self._nombres = bytearray()
+        self._offsets = array("q", [0])
+        self._origen = None
+        self._indices = {}
+        self._por_nombre = None
+        self._texto = None
+        self._minusculas = None
+        self._permutaciones = {}
+        self._agregados = None
+        self._diario = None
+        self._cerrojo = threading.Lock()
+        self._caches = {}
+        self.version = 0
+
+    @classmethod
+    def desde_buffers(cls, poblacion, superficie, continente, categorias, nombres, offsets, origen=None):
+        """
+        Construye una tabla sobre buffers ya existentes, sin copiarlos.
+
+        Se usa para abrir snapshots mapeados en memoria: las columnas pueden ser
+        memoryviews de solo lectura y recién se copian si la tabla se modifica.
+
+        Args:
+            poblacion, superficie (sequence): Columnas de enteros de 64 bits
+            continente (sequence): Códigos de continente (enteros sin signo de 16 bits)
+            categorias (list): Nombres de continente indexados por código
+            nombres (bytes-like): Buffer UTF-8 con todos los nombres
+            offsets (sequence): n + 1 posiciones de inicio de cada nombre en el buffer
+            origen (object, optional): Objeto que debe mantenerse vivo (por ejemplo, el mmap)
+
+        Returns:
+            PaisTable: Tabla que lee directamente de los buffers
+        """
+        tabla = cls()
+        tabla._poblacion = poblacion
+        tabla._superficie = superficie
+        tabla._continente = continente
+        tabla._categorias = list(categorias)
+        tabla._codigos = {c: i for i, c in enumerate(tabla._categorias)}
+        tabla._nombres = nombres
+        tabla._offsets = offsets
+        tabla._origen = origen
+        return tabla
+
+    @classmethod
+    def desde_dicts(cls, paises):
+        """
+        Construye una tabla a partir de cualquier iterable de diccionarios de países.
+
+        Args:
+            paises (iterable): Diccionarios con las claves de CAMPOS
+
+        Returns:
+            PaisTable: Nueva tabla con los países cargados
+        """
+        tabla = cls()
+        for pais in paises:
+            tabla.agregar(pais)
+        return tabla
+
+    def copiar(self):
+        """
+        Devuelve una copia independiente de la tabla, con la misma versión.
+
+        Copia las columnas y el diario de cambios; los índices y agregados
+        no se copian y se vuelven a construir la primera vez que se usen.
+
+        Returns:
+            PaisTable: Tabla nueva que se puede modificar sin afectar a esta
+        """
+        copia = PaisTable()
+        copia._poblacion = _copiar_array("q", self._poblacion)
+        copia._superficie = _copiar_array("q", self._superficie)
+        copia._continente = _copiar_array("H", self._continente)
+        copia._offsets = _copiar_array("q", self._offsets)
+        copia._nombres = bytearray(self._nombres)
+        copia._categorias = list(self._categorias)
+        copia._codigos = dict(self._codigos)
+        copia._diario = None if self._diario is None else list(self._diario)
+        copia.version = self.version
+        return copia
+
+    # -----------------------
+    # Interfaz tipo lista
+    # -----------------------
+    def __len__(self):
+        return len(self._poblacion)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield PaisFila(self, i)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [PaisFila(self, j) for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("índice de país fuera de rango")
+        return PaisFila(self, i)
+
+    def append(self, pais):
+        """Agrega un país (diccionario) al final de la tabla, como list.append."""
+        self.agregar(pais)
+
+    def __repr__(self):
+        return f"PaisTable({len(self)} países)"
+
+    # -----------------------
+    # Acceso por columnas
+    # -----------------------
+    def agregar(self, pais):
+        """
+        Agrega un país a la tabla.
+
+        Args:
+            pais (dict): Diccionario con nombre, poblacion, superficie y continente
+
+        Returns:
+            int: Identificador (posición) de la nueva fila
+        """
+        self._asegurar_mutable()
+        id_fila = len(self)
+        self._poblacion.append(int(pais["poblacion"]))
+        self._superficie.append(int(pais["superficie"]))
+        self._continente.append(self._codigo_continente(pais["continente"]))
+        self._nombres += pais["nombre"].encode("utf-8")
+        self._offsets.append(len(self._nombres))
+        
+        for campo, indice in self._indices.items():
+            indice.insertar(self.valor(id_fila, campo), id_fila)
+        if self._por_nombre is not None or self._texto is not None:
+            nombre_norm = normalizar(pais["nombre"])
+            if self._por_nombre is not None:
+                self._por_nombre.setdefault(nombre_norm, id_fila)
+            if self._texto is not None:
+                self._texto.agregar(nombre_norm, id_fila)
+        if self._minusculas is not None:
+            self._minusculas.append(pais["nombre"].lower())
+        if self._agregados is not None:
+            self._agregados.al_agregar(id_fila)
+        if self._diario is not None:
+            self._diario.append({"op": "agregar", "pais": dict(PaisFila(self, id_fila))})
+        self.version += 1
+        return id_fila
+
+    def nombre(self, i):
+        """Devuelve el nombre del país en la posición i."""
+        return str(self._nombres[self._offsets[i]:self._offsets[i + 1]], "utf-8")
+
+    def valor(self, i, campo):
+        """
+        Devuelve el valor de un campo para la fila i.
+
+        Raises:
+            KeyError: Si el campo no existe
+        """
+        if campo == "poblacion":
+            return self._poblacion[i]
+        if campo == "superficie":
+            return self._superficie[i]
+        if campo == "continente":
+            return self._categorias[self._continente[i]]
+        if campo == "nombre":
+            return self.nombre(i)
+        raise KeyError(campo)
+
+    def columna(self, campo):
+        """
+        Devuelve la columna numérica completa sin copiarla.
+
+        Args:
+            campo (str): 'poblacion' o 'superficie'
+
+        Returns:
+            array: Columna de enteros de 64 bits (memoryview si la tabla viene de un snapshot)
+        """
+        if campo == "poblacion":
+            return self._poblacion
+        if campo == "superficie":
+            return self._superficie
+        raise KeyError(campo)
+
+    def columna_numpy(self, campo):
+        """
+        Devuelve la columna como un ndarray int64 que comparte memoria con la tabla.
+
+        Returns:
+            numpy.ndarray: Vista de la columna, None si NumPy no está instalado
+        """
+        if np is None:
+            return None
+        return np.frombuffer(self.columna(campo), dtype=np.int64)
+
+    def indice_ordenado(self, campo):
+        """
+        Devuelve el índice ordenado de un campo numérico.
+
+        El índice se construye la primera vez que se pide y después se mantiene
+        con cada alta o modificación de la tabla.
+
+        Args:
+            campo (str): 'poblacion' o 'superficie'
+
+        Returns:
+            IndiceOrdenado: Índice del campo
+        """
+        indice = self._indices.get(campo)
+        if indice is None:
+            with self._cerrojo:
+                indice = self._indices.get(campo)
+                if indice is None:
+                    indice = self._indices[campo] = IndiceOrdenado(self.columna(campo))
+        return indice
+
+    def buscar_id(self, nombre):
+        """
+        Busca un país por nombre exacto, sin distinguir mayúsculas ni tildes.
+
+        Usa un diccionario nombre normalizado -> id que se construye la primera
+        vez y se mantiene con cada alta. Si hay nombres repetidos, devuelve el primero.
+
+        Args:
+            nombre (str): Nombre del país
+
+        Returns:
+            int: Id de la fila, None si no existe
+        """
+        por_nombre = self._por_nombre
+        if por_nombre is None:
+            with self._cerrojo:
+                por_nombre = self._por_nombre
+                if por_nombre is None:
+                    # Se arma completo antes de publicarlo para que otro lector no lo vea a medias
+                    por_nombre = {}
+                    for i in range(len(self)):
+                        por_nombre.setdefault(normalizar(self.nombre(i)), i)
+                    self._por_nombre = por_nombre
+        return por_nombre.get(normalizar(nombre))
+
+    def indice_texto(self):
+        """
+        Devuelve el índice de trigramas sobre los nombres normalizados.
+
+        Se construye la primera vez que se pide y se mantiene con cada alta.
+
+        Returns:
+            IndiceTrigramas: Índice de búsqueda por texto
+        """
+        texto = self._texto
+        if texto is None:
+            with self._cerrojo:
+                texto = self._texto
+                if texto is None:
+                    texto = self._texto = IndiceTrigramas(normalizar(self.nombre(i)) for i in range(len(self)))
+        return texto
+
+    def buscar_texto(self, texto):
+        """
+        Busca países cuyo nombre contiene el texto, sin distinguir mayúsculas ni tildes.
+
+        Returns:
+            list: Filas en el orden de la tabla
+        """
+        return [PaisFila(self, i) for i in self.indice_texto().buscar(normalizar(texto))]
+
+    def autocompletar(self, prefijo, limite=10):
+        """
+        Sugiere países cuyo nombre empieza con el prefijo, los más poblados primero.
+
+        Args:
+            prefijo (str): Comienzo del nombre (sin distinguir mayúsculas ni tildes)
+            limite (int): Cantidad máxima de sugerencias
+
+        Returns:
+            list: Filas ordenadas por población descendente
+        """
+        ids = self.indice_texto().con_prefijo(normalizar(prefijo))
+        return [PaisFila(self, i) for i in heapq.nlargest(limite, ids, key=self._poblacion.__getitem__)]
+
+    def filtrar_rango(self, campo, minimo, maximo):
+        """
+        Devuelve las filas con minimo <= campo <= maximo usando el índice ordenado.
+
+        Returns:
+            list: Filas en el orden de la tabla
+        """
+        ids = self.indice_ordenado(campo).rango(minimo, maximo)
+        return [PaisFila(self, i) for i in sorted(ids)]
+
+    def ordenar(self, campo, descendente=False, limite=None, desplazamiento=0):
+        """
+        Devuelve las filas ordenadas por un campo, opcionalmente solo una página.
+
+        La primera página pedida sobre una versión de la tabla se resuelve con
+        heapq (top-k); si se vuelve a ordenar por el mismo campo sin cambios en
+        la tabla, se guarda la permutación completa y las páginas siguientes
+        cuestan O(k). Cualquier alta o modificación invalida la permutación.
+        El nombre se compara en minúsculas, con una columna de claves que se
+        construye una vez (ver nombres_minusculas) y se mantiene con cada alta.
+
+        Args:
+            campo (str): nombre, poblacion o superficie
+            descendente (bool): True para orden descendente
+            limite (int, optional): Cantidad máxima de filas a devolver
+            desplazamiento (int): Cantidad de filas a saltear
+
+        Returns:
+            list: Filas ordenadas (el orden entre iguales es el de la tabla)
+        """
+        clave_cache = (campo, descendente)
+        version, ids = self._permutaciones.get(clave_cache, (None, None))
+        
+        if version != self.version or ids is None:
+            if limite is not None and version != self.version:
+                # Primera página de esta versión: top-k sin ordenar toda la tabla
+                self._permutaciones[clave_cache] = (self.version, None)
+                seleccionar = heapq.nlargest if descendente else heapq.nsmallest
+                ids = seleccionar(desplazamiento + limite, range(len(self)), key=self._clave_orden(campo))
+                return [PaisFila(self, i) for i in ids[desplazamiento:]]
+            
+            ids = sorted(range(len(self)), key=self._clave_orden(campo), reverse=descendente)
+            self._permutaciones[clave_cache] = (self.version, ids)
+        
+        fin = None if limite is None else desplazamiento + limite
+        return [PaisFila(self, i) for i in ids[desplazamiento:fin]]
+
+    def _clave_orden(self, campo):
+        if campo == "nombre":
+            return self.nombres_minusculas().__getitem__
+        return self.columna(campo).__getitem__
+
+    def nombres_minusculas(self):
+        """
+        Devuelve la columna de nombres en minúsculas usada para ordenar por nombre.
+
+        Se construye la primera vez que se pide y se mantiene con cada alta
+        (el nombre de una fila no se puede modificar).
+
+        Returns:
+            list: Nombre en minúsculas de cada fila, en el orden de la tabla
+        """
+        minusculas = self._minusculas
+        if minusculas is None:
+            with self._cerrojo:
+                minusculas = self._minusculas
+                if minusculas is None:
+                    minusculas = self._minusculas = [self.nombre(i).lower() for i in range(len(self))]
+        return minusculas
+
+    def agregados(self):
+        """
+        Devuelve los agregados mantenidos (sumas, cantidades y extremos).
+
+        Se calculan la primera vez que se piden y después se actualizan con
+        cada alta o modificación de la tabla.
+
+        Returns:
+            AgregadosMantenidos: Agregados globales y por código de continente
+        """
+        agregados = self._agregados
+        if agregados is None:
+            with self._cerrojo:
+                agregados = self._agregados
+                if agregados is None:
+                    agregados = self._agregados = AgregadosMantenidos(self)
+        return agregados
+
+    def caches(self):
+        """
+        Devuelve el diccionario donde cache_versionado guarda los resultados
+        calculados sobre esta tabla; se libera junto con la tabla y no se copia.
+
+        Returns:
+            dict: Nombre de función -> CacheLRU
+        """
+        return self._caches
+
+    def iniciar_diario(self):
+        """Empieza a registrar las altas y modificaciones para guardarlas de forma incremental."""
+        if self._diario is None:
+            self._diario = []
+
+    def cambios_pendientes(self):
+        """
+        Devuelve una copia de los cambios registrados que todavía no se guardaron.
+
+        Returns:
+            list: Cambios como diccionarios {'op': 'agregar', 'pais': ...} o
+            {'op': 'actualizar', 'nombre': ..., 'campo': ..., 'valor': ...}
+        """
+        return list(self._diario or [])
+
+    def tomar_diario(self, cantidad=None):
+        """
+        Quita del diario los primeros `cantidad` cambios (todos si es None).
+
+        Returns:
+            list: Cambios quitados, con el formato de cambios_pendientes()
+        """
+        if self._diario is None:
+            return []
+        if cantidad is None:
+            cantidad = len(self._diario)
+        cambios = self._diario[:cantidad]
+        del self._diario[:cantidad]
+        return cambios
+
+    def codigos_continente(self):
+        """Devuelve la columna de códigos de continente (índices en categorias())."""
+        return self._continente
+
+    def categorias(self):
+        """Devuelve la lista de continentes indexada por código."""
+        return self._categorias
+
+    def _codigo_continente(self, continente):
+        codigo = self._codigos.get(continente)
+        if codigo is None:
+            codigo = len(self._categorias)
+            self._categorias.append(continente)
+            self._codigos[continente] = codigo
+        return codigo
+
+    def nombres_utf8(self):
+        """
+        Devuelve el buffer de nombres y su tabla de offsets.
+
+        Returns:
+            tuple: (buffer UTF-8, offsets) -> el nombre i es buffer[offsets[i]:offsets[i + 1]]
+        """
+        return self._nombres, self._offsets
+
+    def _asegurar_mutable(self):
+        """Copia a memoria propia las columnas que todavía apuntan a buffers de solo lectura."""
+        if self._origen is None:
+            return
+        self._poblacion = _copiar_array("q", self._poblacion)
+        self._superficie = _copiar_array("q", self._superficie)
+        self._continente = _copiar_array("H", self._continente)
+        self._offsets = _copiar_array("q", self._offsets)
+        self._nombres = bytearray(self._nombres)
+        self._origen = None
+
+    def _asignar(self, i, campo, valor):
+        self._asegurar_mutable()
+        if campo == "poblacion":
+            columna, nuevo = self._poblacion, int(valor)
+        elif campo == "superficie":
+            columna, nuevo = self._superficie, int(valor)
+        elif campo == "continente":
+            columna, nuevo = self._continente, self._codigo_continente(valor)
+        elif campo == "nombre":
+            raise KeyError("El nombre de un país no se puede modificar en la tabla")
+        else:
+            raise KeyError(campo)
+        
+        anterior = columna[i]
+        indice = self._indices.get(campo)
+        if indice is not None:
+            indice.actualizar(anterior, nuevo, i)
+        columna[i] = nuevo
+        
+        if self._agregados is not None:
+            self._agregados.al_actualizar(i, campo, anterior, nuevo)
+        if self._diario is not None:
+            self._diario.append({
+                "op": "actualizar", "nombre": self.nombre(i), "campo": campo, "valor": self.valor(i, campo)
+            })
+        self.version += 1
+
+
+def _copiar_array(tipo, buffer):
+    copia = array(tipo)
+    copia.frombytes(memoryview(buffer).cast("B"))
+    return copia
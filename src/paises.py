@@ -1,21 +1,8 @@
-import csv
-
 # -----------------------
-# 1) Leer CSV -> lista de diccionarios
-# -----------------------
-def cargar_paises(path_csv):
-    paises = []
-    with open(path_csv, newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            pais = {
-                "nombre": row["nombre"],
-                "poblacion": int(row["poblacion"]),
-                "superficie": int(row["superficie"]),
-                "continente": row["continente"]
-            }
-            paises.append(pais)
-    return paises
+# 1) Leer CSV -> tabla de países
+# -----------------------
+# La carga se comparte con src/utils/csv_handler.py (lectura por lotes)
+from src.utils.csv_handler import cargar_paises, iter_paises  # noqa: F401
 
 # -----------------------
 # 2) Listar
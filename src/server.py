@@ -0,0 +1,249 @@
+"""
+Servidor HTTP de consultas - Gestor de Países
+Responsabilidad: Exponer las consultas de países como endpoints JSON
+
+Uso:
+    python -m src.server [--host 127.0.0.1] [--port 8000] [--csv data/paises.csv]
+
+Endpoints (todos GET, respuestas JSON):
+    /paises        ?limite=&desplazamiento=
+    /buscar        ?q=
+    /filtrar       ?continente=&min_poblacion=&max_poblacion=&min_superficie=&max_superficie=
+    /ordenar       ?campo=nombre|poblacion|superficie&descendente=1&limite=&desplazamiento=
+    /estadisticas  ?continente=
+"""
+import argparse
+import gzip
+import json
+import os
+import sys
+import time
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from src.services import pais_service
+from src.services.consultas import Consulta
+from src.utils import statistics
+from src.utils.cache import CacheLRU
+from src.utils.csv_handler import cargar_paises_con_snapshot
+from src.utils.serializacion import a_json
+
+
+RUTA_CSV = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "paises.csv")
+UMBRAL_GZIP = 1024  # Respuestas más chicas no se comprimen
+MAX_BYTES_CACHE = 32 * 1024 * 1024
+
+
+# -----------------------
+# Parámetros
+# -----------------------
+def _texto(parametros, nombre, defecto=None):
+    valores = parametros.get(nombre)
+    return valores[-1] if valores else defecto
+
+
+def _entero(parametros, nombre, defecto=None, minimo=None):
+    valor = _texto(parametros, nombre)
+    if valor is None or valor == "":
+        return defecto
+    try:
+        numero = int(valor)
+    except ValueError:
+        raise ValueError(f"El parámetro '{nombre}' debe ser un número entero") from None
+    if minimo is not None and numero < minimo:
+        raise ValueError(f"El parámetro '{nombre}' debe ser mayor o igual a {minimo}")
+    return numero
+
+
+def _paginacion(parametros):
+    """Devuelve (limite, desplazamiento); un valor negativo se rechaza en lugar de cortar desde el final."""
+    return _entero(parametros, "limite", minimo=0), _entero(parametros, "desplazamiento", 0, minimo=0)
+
+
+def _booleano(parametros, nombre):
+    return _texto(parametros, nombre, "").lower() in ("1", "true", "si", "sí")
+
+
+# -----------------------
+# Endpoints
+# -----------------------
+def listar(paises, parametros):
+    limite, desplazamiento = _paginacion(parametros)
+    fin = None if limite is None else desplazamiento + limite
+    return paises[desplazamiento:fin]
+
+
+def buscar(paises, parametros):
+    return pais_service.buscar_pais(paises, _texto(parametros, "q", ""))
+
+
+def filtrar(paises, parametros):
+    return Consulta.con_filtros(
+        paises,
+        continente=_texto(parametros, "continente"),
+        min_poblacion=_entero(parametros, "min_poblacion"),
+        max_poblacion=_entero(parametros, "max_poblacion"),
+        min_superficie=_entero(parametros, "min_superficie"),
+        max_superficie=_entero(parametros, "max_superficie"),
+    ).ejecutar()
+
+
+ORDENAMIENTOS = {
+    "nombre": pais_service.ordenar_por_nombre,
+    "poblacion": pais_service.ordenar_por_poblacion,
+    "superficie": pais_service.ordenar_por_superficie,
+}
+
+
+def ordenar(paises, parametros):
+    campo = _texto(parametros, "campo", "nombre")
+    if campo not in ORDENAMIENTOS:
+        raise ValueError(f"Campo no ordenable: {campo}")
+    limite, desplazamiento = _paginacion(parametros)
+    return ORDENAMIENTOS[campo](paises, _booleano(parametros, "descendente"), limite, desplazamiento)
+
+
+def estadisticas(paises, parametros):
+    continente = _texto(parametros, "continente")
+    if continente is None:
+        resumen = statistics.resumen_estadistico(paises)
+        resumen["cantidad_por_continente"] = statistics.cantidad_por_continente(paises)
+        return resumen
+    return statistics.estadisticas_continente(paises, continente)
+
+
+RUTAS = {
+    "/paises": listar,
+    "/buscar": buscar,
+    "/filtrar": filtrar,
+    "/ordenar": ordenar,
+    "/estadisticas": estadisticas,
+}
+
+
+# -----------------------
+# Servidor
+# -----------------------
+class ServidorPaises(ThreadingHTTPServer):
+    """
+    Servidor multi-hilo que mantiene los países cargados en memoria.
+
+    Las respuestas ya serializadas (y comprimidas) se guardan en una cache LRU
+    con clave (versión, URL, gzip): mientras la colección no cambie, una
+    consulta repetida no vuelve a calcularse ni a serializarse.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, direccion, paises, max_bytes_cache=MAX_BYTES_CACHE):
+        super().__init__(direccion, ManejadorPaises)
+        self.paises = paises
+        self.cache = CacheLRU(max_entradas=1024, max_bytes=max_bytes_cache)
+        # Distingue ETags de distintos arranques, aunque la versión vuelva a empezar
+        self._arranque = time.time_ns()
+
+    def etag(self):
+        return f'W/"{self._arranque:x}-{getattr(self.paises, "version", 0)}"'
+
+
+class ManejadorPaises(BaseHTTPRequestHandler):
+    """Atiende los GET de RUTAS con conexiones persistentes (HTTP/1.1)."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        endpoint = RUTAS.get(url.path.rstrip("/") or "/")
+        if endpoint is None:
+            self._enviar_error(HTTPStatus.NOT_FOUND, f"Ruta desconocida: {url.path}")
+            return
+
+        etag = self.server.etag()
+        acepta_gzip = "gzip" in self.headers.get("Accept-Encoding", "")
+        clave = (etag, url.path, url.query, acepta_gzip)
+        encontrado, respuesta = self.server.cache.obtener(clave)
+        if not encontrado:
+            try:
+                resultado = endpoint(self.server.paises, parse_qs(url.query))
+            except ValueError as e:
+                self._enviar_error(HTTPStatus.BAD_REQUEST, str(e))
+                return
+            cuerpo = json.dumps(resultado, ensure_ascii=False, default=a_json).encode("utf-8")
+            comprimido = acepta_gzip and len(cuerpo) > UMBRAL_GZIP
+            if comprimido:
+                cuerpo = gzip.compress(cuerpo, compresslevel=6)
+            respuesta = (cuerpo, comprimido)
+            self.server.cache.guardar(clave, respuesta, len(cuerpo))
+
+        # Recién con la respuesta calculada (o en cache) se sabe que la petición es válida
+        if etag in self.headers.get("If-None-Match", ""):
+            self._enviar(HTTPStatus.NOT_MODIFIED, None, etag)
+            return
+        self._enviar(HTTPStatus.OK, respuesta, etag)
+
+    def _enviar(self, estado, respuesta, etag=None):
+        cuerpo, comprimido = respuesta or (b"", False)
+        self.send_response(estado)
+        if etag:
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "no-cache")
+        if estado != HTTPStatus.NOT_MODIFIED:
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(cuerpo)))
+            self.send_header("Vary", "Accept-Encoding")
+            if comprimido:
+                self.send_header("Content-Encoding", "gzip")
+        self.end_headers()
+        if cuerpo:
+            self.wfile.write(cuerpo)
+
+    def _enviar_error(self, estado, mensaje):
+        cuerpo = json.dumps({"error": mensaje}, ensure_ascii=False).encode("utf-8")
+        self._enviar(estado, (cuerpo, False))
+
+    def log_message(self, formato, *args):
+        if not getattr(self.server, "silencioso", False):
+            super().log_message(formato, *args)
+
+
+def crear_servidor(paises, host="127.0.0.1", puerto=8000):
+    """
+    Args:
+        paises (list | PaisTable): Colección a servir
+        host (str): Dirección donde escuchar
+        puerto (int): Puerto (0 elige uno libre)
+
+    Returns:
+        ServidorPaises: Servidor listo para serve_forever()
+    """
+    return ServidorPaises((host, puerto), paises)
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Servidor JSON de consultas de países")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--csv", default=RUTA_CSV, help="Archivo CSV de países")
+    parser.add_argument("--silencioso", action="store_true", help="No registrar cada petición")
+    opciones = parser.parse_args(argumentos)
+
+    try:
+        paises = cargar_paises_con_snapshot(opciones.csv)
+    except (OSError, ValueError) as e:
+        print(f"❌ Error al cargar los datos: {e}", file=sys.stderr)
+        return 1
+    servidor = crear_servidor(paises, opciones.host, opciones.port)
+    servidor.silencioso = opciones.silencioso
+    host, puerto = servidor.server_address[:2]
+    print(f"✓ {len(paises)} países cargados. Escuchando en http://{host}:{puerto}")
+    try:
+        servidor.serve_forever()
+    except KeyboardInterrupt:
+        print("\nServidor detenido.")
+    finally:
+        servidor.server_close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,218 @@
+"""
+Servicio asíncrono de países
+Responsabilidad: Exponer consultas y modificaciones con una API basada en asyncio
+"""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from src.services import pais_service
+from src.services.consultas import Consulta
+from src.utils import statistics
+
+
+class CerrojoLecturaEscritura:
+    """
+    Cerrojo de lectores/escritor para corrutinas.
+
+    Varios lectores pueden trabajar a la vez; un escritor espera a que terminen
+    y mientras escribe no entra nadie más. Los escritores en espera tienen
+    prioridad sobre lectores nuevos, para que un flujo constante de lecturas
+    no los deje esperando indefinidamente.
+    """
+
+    def __init__(self):
+        self._condicion = asyncio.Condition()
+        self._lectores = 0
+        self._escribiendo = False
+        self._escritores_esperando = 0
+
+    async def adquirir_lectura(self):
+        async with self._condicion:
+            await self._condicion.wait_for(
+                lambda: not self._escribiendo and not self._escritores_esperando
+            )
+            self._lectores += 1
+
+    async def liberar_lectura(self):
+        async with self._condicion:
+            self._lectores -= 1
+            if not self._lectores:
+                self._condicion.notify_all()
+
+    async def adquirir_escritura(self):
+        async with self._condicion:
+            self._escritores_esperando += 1
+            try:
+                await self._condicion.wait_for(lambda: not self._escribiendo and not self._lectores)
+            finally:
+                self._escritores_esperando -= 1
+            self._escribiendo = True
+
+    async def liberar_escritura(self):
+        async with self._condicion:
+            self._escribiendo = False
+            self._condicion.notify_all()
+
+    def lectura(self):
+        """Context manager asíncrono para una sección de lectura."""
+        return _Seccion(self.adquirir_lectura, self.liberar_lectura)
+
+    def escritura(self):
+        """Context manager asíncrono para una sección de escritura exclusiva."""
+        return _Seccion(self.adquirir_escritura, self.liberar_escritura)
+
+
+class _Seccion:
+    def __init__(self, adquirir, liberar):
+        self._adquirir = adquirir
+        self._liberar = liberar
+
+    async def __aenter__(self):
+        await self._adquirir()
+
+    async def __aexit__(self, *exc):
+        await self._liberar()
+
+
+def _instantanea(resultado):
+    """Copia las filas devueltas, que en una PaisTable son vistas vivas."""
+    if isinstance(resultado, list):
+        return [dict(p) for p in resultado]
+    if isinstance(resultado, dict):
+        return {clave: _instantanea(valor) for clave, valor in resultado.items()}
+    if resultado is not None and hasattr(resultado, "keys"):
+        return dict(resultado)
+    return resultado
+
+
+class AsyncPaisService:
+    """
+    Fachada asyncio sobre pais_service y statistics.
+
+    - Las operaciones se ejecutan en un pool de hilos (run_in_executor), así el
+      event loop sigue atendiendo otras corrutinas mientras se filtra o se calcula.
+    - Las lecturas pueden correr en paralelo (PaisTable admite varios lectores a
+      la vez: sus índices y agregados perezosos se construyen bajo su propio
+      cerrojo); agregar_pais y actualizar_pais toman el cerrojo en modo
+      escritura, de modo que ninguna lectura ve una modificación a medias.
+    - Los resultados se devuelven como diccionarios copiados dentro de la sección
+      de lectura: no cambian aunque después se modifique la colección.
+
+    Se usa un pool de hilos y no de procesos porque la colección vive en memoria
+    y copiarla a otro proceso en cada consulta costaría más que la consulta.
+
+    Ejemplo::
+
+        async with AsyncPaisService(paises) as servicio:
+            asia = await servicio.filtrar(continente="Asia", min_poblacion=50_000_000)
+    """
+
+    def __init__(self, paises, executor=None, max_hilos=None):
+        """
+        Args:
+            paises (list | PaisTable): Colección de países a servir
+            executor (Executor, optional): Pool propio; si no se indica se crea uno
+            max_hilos (int, optional): Tamaño del pool creado por el servicio
+        """
+        self.paises = paises
+        self._cerrojo = CerrojoLecturaEscritura()
+        self._executor_propio = executor is None
+        self._executor = executor or ThreadPoolExecutor(max_hilos, thread_name_prefix="paises")
+
+    async def _ejecutar(self, funcion, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(funcion, *args, **kwargs))
+
+    async def _leer(self, funcion, *args, **kwargs):
+        async with self._cerrojo.lectura():
+            return await self._ejecutar(
+                lambda: _instantanea(funcion(self.paises, *args, **kwargs))
+            )
+
+    async def _escribir(self, funcion, *args, **kwargs):
+        async with self._cerrojo.escritura():
+            return await self._ejecutar(funcion, self.paises, *args, **kwargs)
+
+    # -----------------------
+    # Consultas
+    # -----------------------
+    async def buscar(self, nombre):
+        """Búsqueda parcial por nombre (ver pais_service.buscar_pais)."""
+        return await self._leer(pais_service.buscar_pais, nombre)
+
+    async def autocompletar(self, prefijo, limite=10):
+        """Sugerencias por prefijo (ver pais_service.autocompletar_pais)."""
+        return await self._leer(pais_service.autocompletar_pais, prefijo, limite)
+
+    async def filtrar(self, continente=None, min_poblacion=None, max_poblacion=None,
+                      min_superficie=None, max_superficie=None):
+        """
+        Combina los filtros indicados en una sola Consulta.
+
+        Args:
+            continente (str, optional): Continente exacto (sin distinguir mayúsculas)
+            min_poblacion, max_poblacion (int, optional): Rango de población
+            min_superficie, max_superficie (int, optional): Rango de superficie
+
+        Returns:
+            list: Países que cumplen todos los filtros, en orden de la colección
+        """
+        def ejecutar(paises):
+            return Consulta.con_filtros(
+                paises, continente, min_poblacion, max_poblacion, min_superficie, max_superficie
+            ).ejecutar()
+
+        return await self._leer(ejecutar)
+
+    async def ordenar(self, campo, descendente=False, limite=None, desplazamiento=0):
+        """
+        Ordena por nombre, poblacion o superficie (ver pais_service.ordenar_por_*).
+
+        Raises:
+            ValueError: Si el campo no es ordenable
+        """
+        funciones = {
+            "nombre": pais_service.ordenar_por_nombre,
+            "poblacion": pais_service.ordenar_por_poblacion,
+            "superficie": pais_service.ordenar_por_superficie,
+        }
+        if campo not in funciones:
+            raise ValueError(f"Campo no ordenable: {campo}")
+        return await self._leer(funciones[campo], descendente, limite, desplazamiento)
+
+    async def estadisticas(self, continente=None):
+        """
+        Returns:
+            dict: resumen_estadistico de toda la colección o, si se indica un
+            continente, estadisticas_continente (None si no tiene países)
+        """
+        if continente is None:
+            return await self._leer(statistics.resumen_estadistico)
+        return await self._leer(statistics.estadisticas_continente, continente)
+
+    # -----------------------
+    # Modificaciones
+    # -----------------------
+    async def agregar_pais(self, nombre, poblacion, superficie, continente):
+        """Alta exclusiva (ver pais_service.agregar_pais)."""
+        return await self._escribir(pais_service.agregar_pais, nombre, poblacion, superficie, continente)
+
+    async def actualizar_pais(self, nombre, nueva_poblacion=None, nueva_superficie=None):
+        """Modificación exclusiva (ver pais_service.actualizar_pais)."""
+        return await self._escribir(pais_service.actualizar_pais, nombre, nueva_poblacion, nueva_superficie)
+
+    # -----------------------
+    # Ciclo de vida
+    # -----------------------
+    def cerrar(self):
+        """Libera el pool de hilos si lo creó el servicio."""
+        if self._executor_propio:
+            self._executor.shutdown(wait=True)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        # shutdown(wait=True) bloquea: se espera en otro hilo para no frenar el event loop
+        await asyncio.get_running_loop().run_in_executor(None, self.cerrar)
@@ -0,0 +1,251 @@
+"""
+Consultas compuestas sobre países
+Responsabilidad: Combinar filtros, orden y límite en una sola pasada perezosa
+"""
+import heapq
+import operator
+from itertools import islice
+
+from src.models.pais import PaisTable
+from src.utils.validations import normalizar
+
+
+OPERADORES = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "contiene": lambda valor, texto: texto in valor,
+}
+CAMPOS_TEXTO = ("nombre", "continente")
+CAMPOS_INDEXADOS = ("poblacion", "superficie")
+
+
+class Consulta:
+    """
+    Consulta perezosa sobre una lista o PaisTable de países.
+
+    Ejemplo: los 10 países de Asia con más de 50 millones de habitantes,
+    ordenados por superficie descendente::
+
+        Consulta(paises).donde("continente", "==", "Asia") \\
+            .donde("poblacion", ">", 50_000_000) \\
+            .ordenar_por("superficie", descendente=True).limite(10)
+
+    Cada método devuelve una consulta nueva; nada se evalúa hasta recorrerla
+    o llamar a ejecutar(). Todos los filtros se aplican en una única pasada y,
+    con límite, el orden se resuelve con heapq en lugar de ordenar todo.
+    """
+
+    def __init__(self, paises):
+        self._paises = paises
+        self._filtros = ()
+        self._orden = None
+        self._limite = None
+
+    @classmethod
+    def con_filtros(cls, paises, continente=None, min_poblacion=None, max_poblacion=None,
+                    min_superficie=None, max_superficie=None):
+        """
+        Arma la consulta de los filtros habituales (continente y rangos),
+        agregando solo los que no son None.
+
+        Args:
+            paises (list | PaisTable): Colección a consultar
+            continente (str, optional): Continente exacto (sin distinguir mayúsculas)
+            min_poblacion, max_poblacion (int, optional): Rango de población
+            min_superficie, max_superficie (int, optional): Rango de superficie
+
+        Returns:
+            Consulta: Consulta perezosa con las condiciones indicadas
+        """
+        condiciones = (
+            ("continente", "==", continente),
+            ("poblacion", ">=", min_poblacion),
+            ("poblacion", "<=", max_poblacion),
+            ("superficie", ">=", min_superficie),
+            ("superficie", "<=", max_superficie),
+        )
+        consulta = cls(paises)
+        for campo, operador, valor in condiciones:
+            if valor is not None:
+                consulta = consulta.donde(campo, operador, valor)
+        return consulta
+
+    def _copiar(self, **cambios):
+        nueva = Consulta(self._paises)
+        nueva._filtros = self._filtros
+        nueva._orden = self._orden
+        nueva._limite = self._limite
+        for atributo, valor in cambios.items():
+            setattr(nueva, "_" + atributo, valor)
+        return nueva
+
+    def donde(self, campo, operador, valor):
+        """
+        Agrega una condición. Las cadenas se comparan sin distinguir mayúsculas
+        y 'contiene' tampoco distingue tildes.
+
+        Args:
+            campo (str): nombre, poblacion, superficie o continente
+            operador (str): Uno de OPERADORES
+            valor: Valor con el que se compara
+
+        Raises:
+            ValueError: Si el operador no existe
+        """
+        if operador not in OPERADORES:
+            raise ValueError(f"Operador desconocido: {operador}")
+        return self._copiar(filtros=self._filtros + ((campo, operador, valor),))
+
+    def ordenar_por(self, campo, descendente=False):
+        """Ordena el resultado por un campo (el nombre sin distinguir mayúsculas)."""
+        return self._copiar(orden=(campo, descendente))
+
+    def limite(self, cantidad):
+        """Devuelve como máximo `cantidad` países."""
+        return self._copiar(limite=cantidad)
+
+    # -----------------------
+    # Planificación
+    # -----------------------
+    def _rangos(self):
+        """Convierte los filtros numéricos en un rango [mínimo, máximo] por campo indexado."""
+        rangos = {}
+        for campo, operador, valor in self._filtros:
+            if campo not in CAMPOS_INDEXADOS or operador in ("!=", "contiene"):
+                continue
+            minimo, maximo = rangos.get(campo, (float("-inf"), float("inf")))
+            if operador in (">", ">=", "=="):
+                minimo = max(minimo, valor)
+            if operador in ("<", "<=", "=="):
+                maximo = min(maximo, valor)
+            rangos[campo] = (minimo, maximo)
+        return rangos
+
+    def _plan(self):
+        """
+        Elige de dónde salen los candidatos.
+
+        Returns:
+            tuple: (tipo, detalle) -> ('recorrido', None), ('texto', consulta)
+            o ('rango', (campo, minimo, maximo, cantidad_estimada))
+        """
+        if not isinstance(self._paises, PaisTable):
+            return "recorrido", None
+
+        for campo, operador, valor in self._filtros:
+            if campo == "nombre" and operador == "contiene":
+                return "texto", valor
+
+        mejor = None
+        for campo, (minimo, maximo) in self._rangos().items():
+            cantidad = self._paises.indice_ordenado(campo).contar_rango(minimo, maximo)
+            if mejor is None or cantidad < mejor[3]:
+                mejor = (campo, minimo, maximo, cantidad)
+        if mejor is not None and mejor[3] < len(self._paises):
+            return "rango", mejor
+        return "recorrido", None
+
+    def _candidatos(self, plan):
+        tipo, detalle = plan
+        if tipo == "texto":
+            return self._paises.buscar_texto(detalle)
+        if tipo == "rango":
+            campo, minimo, maximo, _ = detalle
+            return self._paises.filtrar_rango(campo, minimo, maximo)
+        return self._paises
+
+    def _predicado(self):
+        """Compila todos los filtros en una única función."""
+        condiciones = []
+        for campo, operador, valor in self._filtros:
+            comparar = OPERADORES[operador]
+            if operador == "contiene":
+                condiciones.append((campo, comparar, normalizar(str(valor)), normalizar))
+            elif campo in CAMPOS_TEXTO:
+                condiciones.append((campo, comparar, str(valor).strip().lower(), _texto))
+            else:
+                condiciones.append((campo, comparar, valor, None))
+
+        def cumple(pais):
+            for campo, comparar, valor, preparar in condiciones:
+                dato = pais[campo] if preparar is None else preparar(pais[campo])
+                if not comparar(dato, valor):
+                    return False
+            return True
+
+        return cumple
+
+    # -----------------------
+    # Ejecución
+    # -----------------------
+    def __iter__(self):
+        filas = self._candidatos(self._plan())
+        if self._filtros:
+            filas = filter(self._predicado(), filas)
+
+        if self._orden is None:
+            if self._limite is not None:
+                filas = islice(filas, self._limite)
+            return iter(filas)
+
+        campo, descendente = self._orden
+        clave = _clave_orden(campo)
+        if self._limite is None:
+            return iter(sorted(filas, key=clave, reverse=descendente))
+        seleccionar = heapq.nlargest if descendente else heapq.nsmallest
+        return iter(seleccionar(self._limite, filas, key=clave))
+
+    def ejecutar(self):
+        """
+        Evalúa la consulta.
+
+        Returns:
+            list: Países que cumplen la consulta
+        """
+        return list(self)
+
+    def explicar(self):
+        """
+        Describe cómo se va a evaluar la consulta, sin ejecutarla.
+
+        Returns:
+            str: Plan de ejecución, un paso por línea
+        """
+        tipo, detalle = self._plan()
+        if tipo == "texto":
+            pasos = [f"Origen: índice de trigramas de nombre (contiene '{detalle}')"]
+        elif tipo == "rango":
+            campo, minimo, maximo, cantidad = detalle
+            pasos = [f"Origen: índice ordenado de {campo} en [{minimo}, {maximo}] ({cantidad} filas)"]
+        else:
+            pasos = [f"Origen: recorrido completo ({len(self._paises)} filas)"]
+
+        if self._filtros:
+            condiciones = " Y ".join(f"{c} {o} {v!r}" for c, o, v in self._filtros)
+            pasos.append(f"Filtro (una pasada): {condiciones}")
+
+        if self._orden is not None:
+            campo, descendente = self._orden
+            sentido = "descendente" if descendente else "ascendente"
+            if self._limite is None:
+                pasos.append(f"Orden: sorted por {campo} {sentido}")
+            else:
+                funcion = "heapq.nlargest" if descendente else "heapq.nsmallest"
+                pasos.append(f"Orden: top-{self._limite} por {campo} {sentido} con {funcion}")
+        elif self._limite is not None:
+            pasos.append(f"Límite: primeros {self._limite} (corta la pasada)")
+        return "\n".join(pasos)
+
+
+def _texto(valor):
+    return valor.strip().lower()
+
+
+def _clave_orden(campo):
+    if campo in CAMPOS_TEXTO:
+        return lambda p: p[campo].lower()
+    return lambda p: p[campo]
@@ -2,26 +2,27 @@
 Servicio para gestión de países
 Responsabilidad: Operaciones CRUD y filtros sobre países
 """
+import heapq
 
+from src.models.pais import PaisTable
+from src.utils.cache import cache_versionado
+from src.utils.render import escribir_tabla
+from src.utils.validations import normalizar, validar_entero_positivo, validar_lote_paises
 
-def listar_paises(paises):
+
+def listar_paises(paises, salida=None):
     """
     Muestra la lista de países en formato tabular.
+    El formato y la escritura en bloque quedan a cargo de utils.render.
     
     Args:
         paises (list): Lista de diccionarios de países
+        salida (file, optional): Archivo o stream donde escribir (por defecto, la consola)
     """
-    if not paises:
-        print("No hay países para mostrar.")
-        return
-    
-    print(f"{'PAÍS':<20} | {'POBLACIÓN':<12} | {'SUPERFICIE':<12} | {'CONTINENTE':<15}")
-    print("-" * 65)
-    
-    for p in paises:
-        print(f"{p['nombre']:<20} | {p['poblacion']:>12,} | {p['superficie']:>12,} | {p['continente']:<15}")
+    escribir_tabla(paises, salida)
 
 
+@cache_versionado()
 def filtrar_por_continente(paises, continente):
     """
     Filtra países por continente.
@@ -37,24 +38,34 @@ def filtrar_por_continente(paises, continente):
     return [p for p in paises if p["continente"].strip().lower() == continente.strip().lower()]
 
 
+@cache_versionado()
 def filtrar_por_poblacion(paises, min_poblacion=0, max_poblacion=float('inf')):
     """
     Filtra países por rango de población.
+    Sobre una PaisTable usa el índice ordenado de población (búsqueda binaria).
     """
+    if isinstance(paises, PaisTable):
+        return paises.filtrar_rango("poblacion", min_poblacion, max_poblacion)
     return [p for p in paises if min_poblacion <= p["poblacion"] <= max_poblacion]
 
 
+@cache_versionado()
 def filtrar_por_superficie(paises, min_superficie=0, max_superficie=float('inf')):
     """
     Filtra países por rango de superficie.
+    Sobre una PaisTable usa el índice ordenado de superficie (búsqueda binaria).
     """
+    if isinstance(paises, PaisTable):
+        return paises.filtrar_rango("superficie", min_superficie, max_superficie)
     return [p for p in paises if min_superficie <= p["superficie"] <= max_superficie]
 
 
 
+@cache_versionado()
 def buscar_pais(paises, nombre):
     """
-    Busca un país por nombre (búsqueda parcial, insensible a mayúsculas).
+    Busca un país por nombre (búsqueda parcial, insensible a mayúsculas y tildes).
+    Sobre una PaisTable usa el índice de trigramas de nombres.
     
     Args:
         paises (list): Lista de diccionarios de países
@@ -63,50 +74,103 @@ def buscar_pais(paises, nombre):
     Returns:
         list: Lista de países que coinciden con la búsqueda
     """
-    nombre_lower = nombre.lower()
-    return [p for p in paises if nombre_lower in p["nombre"].lower()]
+    if isinstance(paises, PaisTable):
+        return paises.buscar_texto(nombre)
+    
+    nombre_norm = normalizar(nombre)
+    return [p for p in paises if nombre_norm in normalizar(p["nombre"])]
 
 
-def ordenar_por_poblacion(paises, descendente=True):
+@cache_versionado()
+def autocompletar_pais(paises, prefijo, limite=10):
+    """
+    Sugiere países cuyo nombre empieza con el prefijo, los más poblados primero.
+    
+    Args:
+        paises (list): Lista de diccionarios de países
+        prefijo (str): Comienzo del nombre (insensible a mayúsculas y tildes)
+        limite (int): Cantidad máxima de sugerencias
+        
+    Returns:
+        list: Hasta `limite` países ordenados por población descendente
+    """
+    if isinstance(paises, PaisTable):
+        return paises.autocompletar(prefijo, limite)
+    
+    prefijo_norm = normalizar(prefijo)
+    candidatos = sorted(
+        (p for p in paises if normalizar(p["nombre"]).startswith(prefijo_norm)),
+        key=lambda p: normalizar(p["nombre"])
+    )
+    return heapq.nlargest(limite, candidatos, key=lambda p: p["poblacion"])
+
+
+def ordenar_por_poblacion(paises, descendente=True, limite=None, desplazamiento=0):
     """
     Ordena países por población.
     
     Args:
         paises (list): Lista de diccionarios de países
         descendente (bool): True para orden descendente, False para ascendente
+        limite (int, optional): Cantidad máxima de países a devolver (top-k)
+        desplazamiento (int): Cantidad de países a saltear (paginado)
         
     Returns:
         list: Lista de países ordenada por población
     """
-    return sorted(paises, key=lambda p: p["poblacion"], reverse=descendente)
+    return _ordenar(paises, "poblacion", descendente, limite, desplazamiento)
 
 
-def ordenar_por_superficie(paises, descendente=True):
+def ordenar_por_superficie(paises, descendente=True, limite=None, desplazamiento=0):
     """
     Ordena países por superficie.
     
     Args:
         paises (list): Lista de diccionarios de países
         descendente (bool): True para orden descendente, False para ascendente
+        limite (int, optional): Cantidad máxima de países a devolver (top-k)
+        desplazamiento (int): Cantidad de países a saltear (paginado)
         
     Returns:
         list: Lista de países ordenada por superficie
     """
-    return sorted(paises, key=lambda p: p["superficie"], reverse=descendente)
+    return _ordenar(paises, "superficie", descendente, limite, desplazamiento)
 
 
-def ordenar_por_nombre(paises, descendente=False):
+def ordenar_por_nombre(paises, descendente=False, limite=None, desplazamiento=0):
     """
     Ordena países por nombre alfabéticamente.
     
     Args:
         paises (list): Lista de diccionarios de países
         descendente (bool): True para orden descendente, False para ascendente
+        limite (int, optional): Cantidad máxima de países a devolver (top-k)
+        desplazamiento (int): Cantidad de países a saltear (paginado)
         
     Returns:
         list: Lista de países ordenada por nombre
     """
-    return sorted(paises, key=lambda p: p["nombre"].lower(), reverse=descendente)
+    return _ordenar(paises, "nombre", descendente, limite, desplazamiento)
+
+
+def _ordenar(paises, campo, descendente, limite, desplazamiento):
+    """
+    Ordena por un campo. Con límite usa heapq (top-k) en lugar de ordenar todo;
+    sobre una PaisTable reutiliza la permutación ordenada mientras no haya cambios.
+    """
+    if isinstance(paises, PaisTable):
+        return paises.ordenar(campo, descendente, limite, desplazamiento)
+    
+    if campo == "nombre":
+        clave = lambda p: p["nombre"].lower()
+    else:
+        clave = lambda p: p[campo]
+    
+    if limite is None:
+        return sorted(paises, key=clave, reverse=descendente)[desplazamiento:]
+    
+    seleccionar = heapq.nlargest if descendente else heapq.nsmallest
+    return seleccionar(desplazamiento + limite, paises, key=clave)[desplazamiento:]
 
 
 def agregar_pais(paises, nombre, poblacion, superficie, continente):
@@ -123,8 +187,8 @@ def agregar_pais(paises, nombre, poblacion, superficie, continente):
     Returns:
         bool: True si se agregó exitosamente, False si ya existe
     """
-    # Verificar si el país ya existe
-    if any(p["nombre"].lower() == nombre.lower() for p in paises):
+    # Verificar si el país ya existe (sin distinguir mayúsculas ni tildes)
+    if _buscar_posicion(paises, nombre) is not None:
         return False
     
     nuevo_pais = {
@@ -151,11 +215,127 @@ def actualizar_pais(paises, nombre, nueva_poblacion=None, nueva_superficie=None)
     Returns:
         bool: True si se actualizó exitosamente, False si no se encontró el país
     """
-    for pais in paises:
-        if pais["nombre"].lower() == nombre.lower():
-            if nueva_poblacion is not None:
-                pais["poblacion"] = int(nueva_poblacion)
-            if nueva_superficie is not None:
-                pais["superficie"] = int(nueva_superficie)
-            return True
-    return False
\ No newline at end of file
+    posicion = _buscar_posicion(paises, nombre)
+    if posicion is None:
+        return False
+    
+    pais = paises[posicion]
+    if nueva_poblacion is not None:
+        pais["poblacion"] = int(nueva_poblacion)
+    if nueva_superficie is not None:
+        pais["superficie"] = int(nueva_superficie)
+    return True
+
+
+def agregar_paises_lote(paises, filas):
+    """
+    Agrega un lote de países de forma atómica.
+    
+    Primero se valida todo el lote en una pasada y se detectan los nombres
+    repetidos (contra la colección y dentro del mismo lote) con un conjunto.
+    Si alguna fila tiene errores no se agrega ninguna; si no, se agregan todas.
+    
+    Args:
+        paises (list): Lista de diccionarios de países
+        filas (iterable): Diccionarios con nombre, poblacion, superficie y continente
+        
+    Returns:
+        tuple: (bool, int, list) -> (exito, cantidad_agregada, errores), donde
+        errores son pares (posición en el lote, lista de mensajes)
+    """
+    validos, errores = validar_lote_paises(filas)
+    
+    if isinstance(paises, PaisTable):
+        existe = lambda clave: paises.buscar_id(clave) is not None
+    else:
+        existentes = {normalizar(p["nombre"]) for p in paises}
+        existe = existentes.__contains__
+    
+    vistos = set()
+    for posicion, datos in validos:
+        clave = normalizar(datos["nombre"])
+        if clave in vistos or existe(clave):
+            errores.append((posicion, [f"El país {datos['nombre']} ya existe"]))
+        vistos.add(clave)
+    
+    if errores:
+        errores.sort(key=lambda error: error[0])
+        return False, 0, errores
+    
+    for _, datos in validos:
+        paises.append(datos)
+    return True, len(validos), []
+
+
+def actualizar_paises_lote(paises, cambios):
+    """
+    Actualiza población y/o superficie de varios países de forma atómica.
+    
+    Si algún cambio es inválido o nombra un país inexistente no se aplica
+    ninguno. Si un país aparece más de una vez, queda el último valor.
+    
+    Args:
+        paises (list): Lista de diccionarios de países
+        cambios (iterable): Diccionarios con nombre y poblacion y/o superficie
+        
+    Returns:
+        tuple: (bool, int, list) -> (exito, cantidad_actualizada, errores), donde
+        errores son pares (posición en el lote, lista de mensajes)
+    """
+    if isinstance(paises, PaisTable):
+        posicion_de = paises.buscar_id
+    else:
+        posiciones = {}
+        for posicion, pais in enumerate(paises):
+            posiciones.setdefault(normalizar(pais["nombre"]), posicion)
+        posicion_de = lambda nombre: posiciones.get(normalizar(nombre))
+    
+    asignaciones = []
+    errores = []
+    for indice, cambio in enumerate(cambios):
+        mensajes = []
+        nombre = cambio.get("nombre")
+        posicion = posicion_de(str(nombre)) if nombre else None
+        if posicion is None:
+            mensajes.append(f"No se encontró el país {nombre}")
+        
+        valores = {}
+        for campo, etiqueta in (("poblacion", "Población"), ("superficie", "Superficie")):
+            if cambio.get(campo) is None:
+                continue
+            es_valido, numero, error = validar_entero_positivo(cambio[campo], etiqueta)
+            if es_valido:
+                valores[campo] = numero
+            else:
+                mensajes.append(error)
+        if not valores and not mensajes:
+            mensajes.append("Debe indicar poblacion o superficie")
+        
+        if mensajes:
+            errores.append((indice, mensajes))
+        else:
+            asignaciones.append((posicion, valores))
+    
+    if errores:
+        return False, 0, errores
+    
+    for posicion, valores in asignaciones:
+        pais = paises[posicion]
+        for campo, numero in valores.items():
+            pais[campo] = numero
+    return True, len(asignaciones), []
+
+
+def _buscar_posicion(paises, nombre):
+    """
+    Devuelve la posición del país con ese nombre (sin distinguir mayúsculas ni tildes).
+    Sobre una PaisTable usa su índice por nombre en O(1).
+    """
+    if isinstance(paises, PaisTable):
+        return paises.buscar_id(nombre)
+    
+    nombre_norm = normalizar(nombre)
+    for posicion, pais in enumerate(paises):
+        if normalizar(pais["nombre"]) == nombre_norm:
+            return posicion
+    return None
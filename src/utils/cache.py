@@ -0,0 +1,267 @@
+"""
+Módulo de cache de resultados
+Responsabilidad: Memorizar consultas repetidas mientras los datos no cambian
+"""
+import copy
+import functools
+import sys
+import threading
+import weakref
+from collections import OrderedDict
+
+
+# Todas las caches creadas con cache_versionado, por nombre de función
+_CACHES = {}
+
+
+class CacheLRU:
+    """
+    Cache LRU con límite de entradas y, opcionalmente, de bytes aproximados.
+
+    Lleva contadores de aciertos, fallos y desalojos para poder consultarlos
+    con info() o estadisticas_cache().
+    """
+
+    def __init__(self, max_entradas=128, max_bytes=None):
+        self.max_entradas = max_entradas
+        self.max_bytes = max_bytes
+        self._datos = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.aciertos = 0
+        self.fallos = 0
+        self.desalojos = 0
+
+    def obtener(self, clave):
+        """
+        Returns:
+            tuple: (bool, valor) -> (encontrado, valor guardado)
+        """
+        with self._lock:
+            entrada = self._datos.get(clave)
+            if entrada is None:
+                self.fallos += 1
+                return False, None
+            self._datos.move_to_end(clave)
+            self.aciertos += 1
+            return True, entrada[0]
+
+    def guardar(self, clave, valor, tamano=None):
+        """Guarda un valor; `tamano` permite indicar los bytes a contabilizar."""
+        if self.max_bytes is None:
+            tamano = 0
+        elif tamano is None:
+            tamano = _tamano_aproximado(valor)
+        with self._lock:
+            anterior = self._datos.pop(clave, None)
+            if anterior is not None:
+                self._bytes -= anterior[1]
+            self._datos[clave] = (valor, tamano)
+            self._bytes += tamano
+            while self._datos and (
+                len(self._datos) > self.max_entradas
+                or (self.max_bytes is not None and self._bytes > self.max_bytes)
+            ):
+                _, (_, tamano_viejo) = self._datos.popitem(last=False)
+                self._bytes -= tamano_viejo
+                self.desalojos += 1
+
+    def descartar(self, condicion):
+        """
+        Quita las entradas cuya clave cumple la condición.
+
+        Returns:
+            int: Cantidad de entradas quitadas
+        """
+        with self._lock:
+            claves = [clave for clave in self._datos if condicion(clave)]
+            for clave in claves:
+                _, tamano = self._datos.pop(clave)
+                self._bytes -= tamano
+            return len(claves)
+
+    def limpiar(self):
+        with self._lock:
+            self._datos.clear()
+            self._bytes = 0
+
+    def info(self):
+        """
+        Returns:
+            dict: Aciertos, fallos, desalojos, entradas y bytes ocupados
+        """
+        with self._lock:
+            return {
+                "aciertos": self.aciertos,
+                "fallos": self.fallos,
+                "desalojos": self.desalojos,
+                "entradas": len(self._datos),
+                "bytes": self._bytes,
+            }
+
+
+def _tamano_aproximado(valor):
+    tamano = sys.getsizeof(valor)
+    if isinstance(valor, (list, tuple)):
+        tamano += sum(sys.getsizeof(elemento) for elemento in valor)
+    elif isinstance(valor, dict):
+        tamano += sum(sys.getsizeof(v) for v in valor.values())
+    return tamano
+
+
+class CacheVersionada:
+    """
+    Cache de una función decorada con cache_versionado.
+
+    Los resultados no se guardan acá sino en la propia colección (un CacheLRU
+    por función en ``paises.caches()``), así se liberan junto con ella: una
+    tabla reemplazada por una escritura copy-on-write no queda viva por estar
+    en la cache. Esta clase lleva los contadores de la función y un conjunto
+    débil de las colecciones que tienen resultados guardados.
+    """
+
+    def __init__(self, nombre, max_entradas=128, max_bytes=None):
+        self.nombre = nombre
+        self.max_entradas = max_entradas
+        self.max_bytes = max_bytes
+        self._colecciones = weakref.WeakSet()
+        self._lock = threading.Lock()
+        self.aciertos = 0
+        self.fallos = 0
+        self.desalojos = 0
+
+    def obtener(self, paises, clave):
+        """
+        Returns:
+            tuple: (bool, valor) -> (encontrado, valor guardado para esta colección)
+        """
+        cache = paises.caches().get(self.nombre)
+        encontrado, valor = cache.obtener(clave) if cache is not None else (False, None)
+        with self._lock:
+            if encontrado:
+                self.aciertos += 1
+            else:
+                self.fallos += 1
+        return encontrado, valor
+
+    def guardar(self, paises, clave, valor, tamano=None):
+        """Guarda un resultado en la cache de la colección, creándola si hace falta."""
+        caches = paises.caches()
+        with self._lock:
+            cache = caches.get(self.nombre)
+            if cache is None:
+                cache = caches[self.nombre] = CacheLRU(self.max_entradas, self.max_bytes)
+                self._colecciones.add(paises)
+        # Con otra versión de la colección los resultados anteriores ya no sirven
+        viejas = cache.descartar(lambda otra: otra[0] != clave[0])
+        desalojos = cache.desalojos
+        cache.guardar(clave, valor, tamano)
+        with self._lock:
+            self.desalojos += viejas + cache.desalojos - desalojos
+
+    def limpiar(self):
+        """Quita los resultados guardados en todas las colecciones vivas."""
+        for paises in list(self._colecciones):
+            paises.caches().pop(self.nombre, None)
+            self._colecciones.discard(paises)
+
+    def info(self):
+        """
+        Returns:
+            dict: Aciertos, fallos, desalojos, entradas y bytes ocupados (colecciones vivas)
+        """
+        caches = [c for c in (p.caches().get(self.nombre) for p in list(self._colecciones)) if c is not None]
+        infos = [cache.info() for cache in caches]
+        with self._lock:
+            return {
+                "aciertos": self.aciertos,
+                "fallos": self.fallos,
+                "desalojos": self.desalojos,
+                "entradas": sum(i["entradas"] for i in infos),
+                "bytes": sum(i["bytes"] for i in infos),
+            }
+
+
+def _copiar_resultado(valor):
+    """
+    Copia los diccionarios y listas del resultado en todos los niveles (por
+    ejemplo, las estadísticas de cada continente), sin copiar las filas de
+    PaisTable que contienen: son vistas de la tabla, no datos de la cache.
+    """
+    if isinstance(valor, dict):
+        return {clave: _copiar_anidado(v) for clave, v in valor.items()}
+    if isinstance(valor, list):
+        return [_copiar_anidado(v) for v in valor]
+    return copy.copy(valor)
+
+
+def _copiar_anidado(valor):
+    if isinstance(valor, (dict, list)):
+        return _copiar_resultado(valor)
+    return valor
+
+
+def cache_versionado(max_entradas=128, max_bytes=None):
+    """
+    Decorador que memoriza funciones cuyo primer argumento es la colección de países.
+
+    Los resultados se guardan en la colección misma (ver PaisTable.caches), con
+    la clave (versión de la colección, resto de argumentos). Como PaisTable
+    incrementa su versión con cada alta o modificación, los resultados viejos
+    dejan de usarse solos y se descartan al guardar uno de la versión nueva; y
+    cuando la colección se libera, sus resultados se liberan con ella. Con
+    listas comunes (sin versión) la función se ejecuta siempre sin cache.
+
+    Se devuelve una copia del resultado guardado (ver _copiar_resultado), para
+    que quien lo reciba pueda modificarlo sin alterar la cache.
+
+    Args:
+        max_entradas (int): Cantidad máxima de resultados guardados por colección
+        max_bytes (int, optional): Tamaño máximo aproximado de los resultados por colección
+
+    Returns:
+        callable: Decorador; la función decorada expone `.cache` (CacheVersionada)
+    """
+    def decorador(funcion):
+        nombre = f"{funcion.__module__}.{funcion.__qualname__}"
+        cache = CacheVersionada(nombre, max_entradas, max_bytes)
+
+        @functools.wraps(funcion)
+        def envoltura(paises, *args, **kwargs):
+            version = getattr(paises, "version", None)
+            if version is None or not hasattr(paises, "caches"):
+                return funcion(paises, *args, **kwargs)
+            try:
+                clave = (version, args, tuple(sorted(kwargs.items())))
+                hash(clave)
+            except TypeError:
+                return funcion(paises, *args, **kwargs)
+
+            encontrado, resultado = cache.obtener(paises, clave)
+            if not encontrado:
+                resultado = funcion(paises, *args, **kwargs)
+                tamano = _tamano_aproximado(resultado) if max_bytes is not None else 0
+                cache.guardar(paises, clave, resultado, tamano)
+            return _copiar_resultado(resultado)
+
+        envoltura.cache = cache
+        _CACHES[nombre] = cache
+        return envoltura
+
+    return decorador
+
+
+def estadisticas_cache():
+    """
+    Devuelve los contadores de todas las caches versionadas.
+
+    Returns:
+        dict: Nombre de función -> info() de su cache
+    """
+    return {nombre: cache.info() for nombre, cache in _CACHES.items()}
+
+
+def limpiar_caches():
+    """Vacía todas las caches versionadas (los contadores se conservan)."""
+    for cache in _CACHES.values():
+        cache.limpiar()
@@ -3,58 +3,281 @@ Módulo para manejo de archivos CSV
 Responsabilidad: Lectura y escritura de datos desde/hacia archivos CSV
 """
 import csv
+import io
+import mmap
 import os
+import struct
+import sys
+from array import array
+
+from src.models.pais import PaisTable
+from src.utils.registro_cambios import (
+    agregar_al_registro, aplicar_registro, aplicar_registro_en_lotes, borrar_registro, leer_registro,
+    ruta_registro
+)
+from src.utils.validations import validar_pais
+
+
+TAMANO_LOTE = 10_000
+UMBRAL_PARALELO = 4 * 1024 * 1024  # Por debajo de 4 MB se carga en serie
+UMBRAL_COMPACTACION = 1024 * 1024  # El registro de cambios se compacta al superar 1 MB...
+PROPORCION_COMPACTACION = 0.25     # ...o la cuarta parte del tamaño del CSV, lo que sea mayor
+
+# Snapshot binario: encabezado fijo + columnas alineadas a 8 bytes (little-endian)
+#   magia, versión, filas, categorías, mtime del CSV (ns), bytes de categorías, bytes de nombres
+SNAPSHOT_MAGIA = b"PSNP"
+SNAPSHOT_VERSION = 1
+SNAPSHOT_ENCABEZADO = struct.Struct("<4sIqqqqq")
+
+
+def _parsear_fila(row):
+    """
+    Convierte una fila leída del CSV en un diccionario de país, validada
+    con el mismo esquema que el resto de la aplicación (ESQUEMA_PAIS).
+
+    Raises:
+        ValueError: Si la fila está incompleta o algún campo no es válido
+    """
+    if None in row.values():
+        raise ValueError("la fila tiene menos columnas que el encabezado")
+    es_valido, pais, errores = validar_pais(row)
+    if not es_valido:
+        raise ValueError("; ".join(errores))
+    return pais
+
+
+def iter_paises(path_csv, chunk_size=TAMANO_LOTE):
+    """
+    Lee el archivo CSV en lotes, sin cargarlo completo en memoria.
+    
+    Las filas con errores se informan por pantalla (``Error en línea N``) y se
+    omiten, y después se aplica el registro de cambios, igual que en cargar_paises.
+    
+    Args:
+        path_csv (str): Ruta al archivo CSV
+        chunk_size (int): Cantidad máxima de países por lote
+        
+    Returns:
+        generator: Genera listas de diccionarios de países
+        
+    Raises:
+        FileNotFoundError: Si el archivo no existe
+        ValueError: Si chunk_size no es positivo
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size debe ser un número positivo")
+    
+    # Verificar si el archivo existe (antes de empezar a iterar)
+    if not os.path.exists(path_csv):
+        raise FileNotFoundError(f"No se encontró el archivo: {path_csv}")
+    
+    cambios = leer_registro(path_csv)
+    lotes = _generar_lotes(path_csv, chunk_size)
+    if not cambios:
+        return lotes
+    return aplicar_registro_en_lotes(lotes, cambios, chunk_size)
+
+
+def _generar_lotes(path_csv, chunk_size):
+    with open(path_csv, newline="", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        lote = []
+        
+        for row_num, row in enumerate(reader, start=2):  # Empieza en 2 por el header
+            try:
+                lote.append(_parsear_fila(row))
+            except (ValueError, KeyError) as e:
+                print(f"Error en línea {row_num}: {e}")
+                continue
+            
+            if len(lote) >= chunk_size:
+                yield lote
+                lote = []
+        
+        if lote:
+            yield lote
 
 
 def cargar_paises(path_csv):
     """
     Carga los datos de países desde un archivo CSV.
     
+    Después del CSV se aplican los cambios pendientes del registro de cambios
+    (ver guardar_cambios), y la tabla queda registrando los cambios nuevos.
+    
     Args:
         path_csv (str): Ruta al archivo CSV
         
     Returns:
-        list: Lista de diccionarios con información de países
+        PaisTable: Tabla columnar de países (se recorre como una lista de diccionarios)
         
     Raises:
         FileNotFoundError: Si el archivo no existe
-        ValueError: Si hay problemas con el formato de datos
+        ValueError: Si el archivo no se puede leer (no se aplica el registro de cambios)
+    """
+    return _con_registro(_cargar_base(path_csv), path_csv)
+
+
+def _cargar_base(path_csv):
+    """
+    Lee el CSV base, sin aplicar el registro de cambios.
+
+    Si el archivo no se puede leer se lanza una excepción en lugar de devolver
+    una tabla vacía: aplicar el registro (o compactarlo) sobre una carga
+    fallida reescribiría el CSV solo con los cambios y se perderían los datos.
+
+    Raises:
+        FileNotFoundError: Si el archivo no existe
+        ValueError: Si el archivo no es texto UTF-8 o CSV válido
     """
-    paises = []
-    
-    # Verificar si el archivo existe
     if not os.path.exists(path_csv):
         raise FileNotFoundError(f"No se encontró el archivo: {path_csv}")
     
+    # Solo el CSV base: el registro lo aplica _con_registro sobre la tabla
+    paises = PaisTable()
+    lotes = _generar_lotes(path_csv, TAMANO_LOTE)
+    
     try:
-        with open(path_csv, newline="", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            
-            for row_num, row in enumerate(reader, start=2):  # Empieza en 2 por el header
-                try:
-                    pais = {
-                        "nombre": row["nombre"].strip(),
-                        "poblacion": int(row["poblacion"]),
-                        "superficie": int(row["superficie"]),
-                        "continente": row["continente"].strip()
-                    }
-                    paises.append(pais)
+        for lote in lotes:
+            for pais in lote:
+                paises.agregar(pais)
                     
-                except (ValueError, KeyError) as e:
-                    print(f"Error en línea {row_num}: {e}")
-                    continue
-                    
-    except Exception as e:
-        print(f"Error al leer el archivo CSV: {e}")
-        return []
+    except (UnicodeDecodeError, csv.Error) as e:
+        raise ValueError(f"Error al leer el archivo CSV {path_csv}: {e}") from e
     
     return paises
 
 
+def _con_registro(paises, path_csv):
+    """Aplica el registro de cambios del CSV y deja la tabla registrando cambios nuevos."""
+    aplicar_registro(paises, leer_registro(path_csv))
+    paises.iniciar_diario()
+    return paises
+
+
+def _rangos_de_bytes(path_csv, partes):
+    """
+    Divide el archivo en rangos de bytes que empiezan y terminan en un salto de línea.
+
+    Returns:
+        tuple: (encabezado, rangos) -> (lista de columnas, lista de (inicio, fin))
+    """
+    tamano = os.path.getsize(path_csv)
+    with open(path_csv, "rb") as f:
+        encabezado = next(csv.reader([f.readline().decode("utf-8")]), [])
+        inicio_datos = f.tell()
+        
+        cortes = [inicio_datos]
+        for k in range(1, partes):
+            f.seek(inicio_datos + k * (tamano - inicio_datos) // partes)
+            f.readline()  # Avanzar hasta el final de la línea actual
+            corte = min(f.tell(), tamano)
+            if corte > cortes[-1]:
+                cortes.append(corte)
+        cortes.append(tamano)
+    
+    rangos = [(a, b) for a, b in zip(cortes, cortes[1:]) if b > a]
+    return encabezado, rangos
+
+
+def _parsear_rango(path_csv, inicio, fin, encabezado):
+    """
+    Parsea un rango de bytes del CSV (se ejecuta en un proceso de trabajo).
+
+    Returns:
+        tuple: (filas, errores, registros) -> filas válidas como tuplas,
+        errores como (índice de registro, mensaje) y cantidad de registros leídos
+    """
+    with open(path_csv, "rb") as f:
+        f.seek(inicio)
+        texto = f.read(fin - inicio).decode("utf-8")
+    
+    filas = []
+    errores = []
+    registros = 0
+    reader = csv.DictReader(io.StringIO(texto, newline=""), fieldnames=encabezado)
+    for registros, row in enumerate(reader, start=1):
+        try:
+            pais = _parsear_fila(row)
+        except (ValueError, KeyError) as e:
+            errores.append((registros, str(e)))
+            continue
+        filas.append((pais["nombre"], pais["poblacion"], pais["superficie"], pais["continente"]))
+    
+    return filas, errores, registros
+
+
+def cargar_paises_paralelo(path_csv, workers=None, umbral_bytes=UMBRAL_PARALELO):
+    """
+    Carga el CSV repartiendo el parseo entre varios procesos.
+    
+    El archivo se divide en rangos de bytes alineados a saltos de línea; cada
+    proceso parsea un rango y los resultados se unen en el orden del archivo.
+    Los números de línea de los errores coinciden con los de cargar_paises.
+    Supone, como el formato de paises.csv, que ningún campo contiene saltos de línea.
+    
+    Args:
+        path_csv (str): Ruta al archivo CSV
+        workers (int, optional): Cantidad de procesos (por defecto, los núcleos disponibles)
+        umbral_bytes (int): Tamaño mínimo del archivo para cargar en paralelo
+        
+    Returns:
+        PaisTable: Tabla columnar de países
+        
+    Raises:
+        FileNotFoundError: Si el archivo no existe
+        ValueError: Si el archivo no es texto UTF-8 o CSV válido (mismo mensaje que cargar_paises)
+    """
+    if not os.path.exists(path_csv):
+        raise FileNotFoundError(f"No se encontró el archivo: {path_csv}")
+    
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1 or os.path.getsize(path_csv) < umbral_bytes:
+        return cargar_paises(path_csv)
+    
+    # multiprocessing tarda en importarse: solo se paga si de verdad se carga en paralelo
+    from concurrent.futures import ProcessPoolExecutor
+    
+    paises = PaisTable()
+    registros_previos = 0
+    
+    try:
+        encabezado, rangos = _rangos_de_bytes(path_csv, workers)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            resultados = executor.map(
+                _parsear_rango,
+                [path_csv] * len(rangos),
+                [inicio for inicio, _ in rangos],
+                [fin for _, fin in rangos],
+                [encabezado] * len(rangos),
+            )
+            # Las excepciones de los procesos se relanzan acá al pedir su resultado
+            for filas, errores, registros in resultados:
+                for indice, error in errores:
+                    print(f"Error en línea {registros_previos + indice + 1}: {error}")
+                for nombre, poblacion, superficie, continente in filas:
+                    paises.agregar({
+                        "nombre": nombre,
+                        "poblacion": poblacion,
+                        "superficie": superficie,
+                        "continente": continente
+                    })
+                registros_previos += registros
+    
+    except (UnicodeDecodeError, csv.Error) as e:
+        raise ValueError(f"Error al leer el archivo CSV {path_csv}: {e}") from e
+    
+    return _con_registro(paises, path_csv)
+
+
 def guardar_paises(paises, path_csv):
     """
     Guarda los datos de países en un archivo CSV.
     
+    El archivo se escribe primero en un temporal que después reemplaza al
+    original, así que un error a mitad de camino no deja el CSV incompleto.
+    Como el CSV queda con todos los datos, se borra el registro de cambios.
+    
     Args:
         paises (list): Lista de diccionarios con información de países
         path_csv (str): Ruta donde guardar el archivo CSV
@@ -62,19 +285,246 @@ def guardar_paises(paises, path_csv):
     Returns:
         bool: True si se guardó exitosamente, False en caso contrario
     """
+    if not paises:
+        return False
+    
+    temporal = path_csv + ".tmp"
     try:
-        with open(path_csv, 'w', newline='', encoding='utf-8') as f:
-            if not paises:
-                return False
-                
+        with open(temporal, 'w', newline='', encoding='utf-8') as f:
             fieldnames = ['nombre', 'poblacion', 'superficie', 'continente']
             writer = csv.DictWriter(f, fieldnames=fieldnames)
             
             writer.writeheader()
             writer.writerows(paises)
-            
+            f.flush()
+            os.fsync(f.fileno())
+        
+        os.replace(temporal, path_csv)
+        borrar_registro(path_csv)
+        if isinstance(paises, PaisTable):
+            paises.tomar_diario()  # Los cambios pendientes ya quedaron en el CSV
         return True
         
     except Exception as e:
         print(f"Error al guardar el archivo CSV: {e}")
-        return False
\ No newline at end of file
+        if os.path.exists(temporal):
+            os.remove(temporal)
+        return False
+
+
+def guardar_cambios(paises, path_csv):
+    """
+    Guarda solo los cambios hechos desde la última vez, sin reescribir el CSV.
+    
+    Las altas y modificaciones registradas por la tabla se agregan al final del
+    registro de cambios. Cuando el registro crece demasiado respecto del CSV,
+    se compacta: se reescribe el CSV completo y se borra el registro.
+    Si paises no es una PaisTable con registro de cambios, se guarda completo.
+    
+    Args:
+        paises (PaisTable): Tabla cargada con cargar_paises
+        path_csv (str): Ruta del archivo CSV
+        
+    Returns:
+        bool: True si se guardó exitosamente, False en caso contrario
+    """
+    if not isinstance(paises, PaisTable) or not os.path.exists(path_csv):
+        return guardar_paises(paises, path_csv)
+    
+    cambios = paises.cambios_pendientes()
+    try:
+        agregar_al_registro(path_csv, cambios)
+    except OSError as e:
+        print(f"Error al guardar el registro de cambios: {e}")
+        return False
+    paises.tomar_diario(len(cambios))
+    
+    ruta = ruta_registro(path_csv)
+    tamano_registro = os.path.getsize(ruta) if os.path.exists(ruta) else 0
+    limite = max(UMBRAL_COMPACTACION, PROPORCION_COMPACTACION * os.path.getsize(path_csv))
+    if tamano_registro > limite:
+        return guardar_paises(paises, path_csv)
+    return True
+
+
+# -----------------------
+# Snapshot binario
+# -----------------------
+def _alinear(n):
+    return (n + 7) & ~7
+
+
+def _bytes_columna(tipo, valores):
+    if sys.byteorder == "little":
+        return bytes(valores)
+    return _copiar_invertido(tipo, valores).tobytes()
+
+
+def guardar_snapshot(paises, path_snapshot, csv_mtime_ns=0):
+    """
+    Guarda los países en un snapshot binario que se puede abrir con mmap.
+    
+    Formato: encabezado fijo, columnas int64 de población y superficie,
+    offsets int64 de los nombres, códigos de continente (uint16), offsets y
+    texto del diccionario de continentes, y el texto UTF-8 de los nombres.
+    El archivo se escribe en un temporal y se renombra al final.
+    
+    Args:
+        paises (PaisTable | list): Países a guardar
+        path_snapshot (str): Ruta del archivo de snapshot
+        csv_mtime_ns (int): Fecha de modificación del CSV de origen
+        
+    Returns:
+        bool: True si se guardó exitosamente, False en caso contrario
+    """
+    if not isinstance(paises, PaisTable):
+        paises = PaisTable.desde_dicts(paises)
+    
+    categorias = [c.encode("utf-8") for c in paises.categorias()]
+    offsets_categorias = [0]
+    for c in categorias:
+        offsets_categorias.append(offsets_categorias[-1] + len(c))
+    texto_categorias = b"".join(categorias)
+    nombres, offsets = paises.nombres_utf8()
+    
+    secciones = [
+        _bytes_columna("q", paises.columna("poblacion")),
+        _bytes_columna("q", paises.columna("superficie")),
+        _bytes_columna("q", offsets),
+        _bytes_columna("H", paises.codigos_continente()),
+        _bytes_columna("q", array("q", offsets_categorias)),
+        texto_categorias,
+        bytes(nombres),
+    ]
+    encabezado = SNAPSHOT_ENCABEZADO.pack(
+        SNAPSHOT_MAGIA, SNAPSHOT_VERSION, len(paises), len(categorias),
+        csv_mtime_ns, len(texto_categorias), len(nombres)
+    )
+    
+    temporal = path_snapshot + ".tmp"
+    try:
+        with open(temporal, "wb") as f:
+            f.write(encabezado)
+            f.write(b"\0" * (_alinear(len(encabezado)) - len(encabezado)))
+            for seccion in secciones:
+                f.write(seccion)
+                f.write(b"\0" * (_alinear(len(seccion)) - len(seccion)))
+        os.replace(temporal, path_snapshot)
+        return True
+        
+    except OSError as e:
+        print(f"Error al guardar el snapshot: {e}")
+        return False
+
+
+def abrir_snapshot(path_snapshot):
+    """
+    Abre un snapshot binario mapeándolo en memoria, sin deserializarlo.
+    
+    Las columnas de la tabla devuelta leen directamente del archivo; recién se
+    copian a memoria si la tabla se modifica.
+    
+    Args:
+        path_snapshot (str): Ruta del archivo de snapshot
+        
+    Returns:
+        tuple: (PaisTable, int) -> tabla de países y mtime del CSV de origen
+        
+    Raises:
+        FileNotFoundError: Si el archivo no existe
+        ValueError: Si el archivo no es un snapshot válido
+    """
+    with open(path_snapshot, "rb") as f:
+        try:
+            mapa = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            raise ValueError(f"Snapshot vacío: {path_snapshot}")
+    
+    datos = memoryview(mapa)
+    if len(datos) < SNAPSHOT_ENCABEZADO.size:
+        raise ValueError(f"Snapshot inválido: {path_snapshot}")
+    magia, version, filas, cantidad_categorias, csv_mtime_ns, bytes_categorias, bytes_nombres = \
+        SNAPSHOT_ENCABEZADO.unpack_from(datos)
+    if magia != SNAPSHOT_MAGIA or version != SNAPSHOT_VERSION:
+        raise ValueError(f"Snapshot inválido o de otra versión: {path_snapshot}")
+    
+    tamanos = [
+        8 * filas, 8 * filas, 8 * (filas + 1), 2 * filas,
+        8 * (cantidad_categorias + 1), bytes_categorias, bytes_nombres,
+    ]
+    secciones = []
+    posicion = _alinear(SNAPSHOT_ENCABEZADO.size)
+    for tamano in tamanos:
+        secciones.append(datos[posicion:posicion + tamano])
+        posicion += _alinear(tamano)
+    if posicion > len(datos):
+        raise ValueError(f"Snapshot truncado: {path_snapshot}")
+    
+    poblacion, superficie, offsets, continente, offsets_categorias, texto_categorias, nombres = secciones
+    columnas = [seccion.cast("q") for seccion in (poblacion, superficie, offsets, offsets_categorias)]
+    continente = continente.cast("H")
+    if sys.byteorder != "little":
+        # En máquinas big-endian no se puede leer en el lugar: se copia y se invierte
+        columnas = [_copiar_invertido("q", c) for c in columnas]
+        continente = _copiar_invertido("H", continente)
+    poblacion, superficie, offsets, offsets_categorias = columnas
+    
+    categorias = [
+        str(texto_categorias[offsets_categorias[i]:offsets_categorias[i + 1]], "utf-8")
+        for i in range(cantidad_categorias)
+    ]
+    tabla = PaisTable.desde_buffers(
+        poblacion, superficie, continente, categorias, nombres, offsets, origen=mapa
+    )
+    return tabla, csv_mtime_ns
+
+
+def _copiar_invertido(tipo, buffer):
+    copia = array(tipo)
+    copia.frombytes(memoryview(buffer).cast("B"))
+    copia.byteswap()
+    return copia
+
+
+def ruta_snapshot(path_csv):
+    """Devuelve la ruta del snapshot asociado a un CSV (mismo nombre, extensión .snap)."""
+    return os.path.splitext(path_csv)[0] + ".snap"
+
+
+def cargar_paises_con_snapshot(path_csv, path_snapshot=None):
+    """
+    Carga los países usando el snapshot binario si está al día con el CSV.
+    
+    Si el snapshot no existe, es inválido o la fecha de modificación del CSV
+    cambió, se vuelve a leer el CSV y se regenera el snapshot. En ambos casos
+    después se aplica el registro de cambios, igual que en cargar_paises.
+    
+    Args:
+        path_csv (str): Ruta al archivo CSV
+        path_snapshot (str, optional): Ruta del snapshot (por defecto, junto al CSV)
+        
+    Returns:
+        PaisTable: Tabla columnar de países
+        
+    Raises:
+        FileNotFoundError: Si el archivo CSV no existe
+        ValueError: Si el CSV no se puede leer (no se aplica el registro de cambios)
+    """
+    if not os.path.exists(path_csv):
+        raise FileNotFoundError(f"No se encontró el archivo: {path_csv}")
+    
+    path_snapshot = path_snapshot or ruta_snapshot(path_csv)
+    mtime_csv = os.stat(path_csv).st_mtime_ns
+    
+    try:
+        paises, mtime_snapshot = abrir_snapshot(path_snapshot)
+        if mtime_snapshot == mtime_csv:
+            return _con_registro(paises, path_csv)
+    except (OSError, ValueError):
+        pass
+    
+    # El snapshot refleja solo el CSV base; el registro de cambios se aplica después
+    paises = _cargar_base(path_csv)
+    if paises:
+        guardar_snapshot(paises, path_snapshot, mtime_csv)
+    return _con_registro(paises, path_csv)
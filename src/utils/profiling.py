@@ -0,0 +1,263 @@
+"""
+Módulo de instrumentación
+Responsabilidad: Medir llamadas, latencias, filas y memoria de los caminos críticos
+
+Se activa con la variable de entorno PAISES_PROFILE=1 o con ``--profile`` en
+main. Desactivada no agrega ningún costo: las funciones originales no se
+envuelven. Al activarse, cada función registrada se reemplaza por una versión
+medida en su módulo y en todos los módulos de la aplicación que la hayan
+importado con ``from ... import``.
+
+Variables de entorno:
+    PAISES_PROFILE=1            activa la instrumentación al importar este módulo
+    PAISES_PROFILE_MEMORIA=1    mide también memoria con tracemalloc (más lento)
+    PAISES_PROFILE_SALIDA=ruta  guarda el reporte al salir (.json o .prom)
+"""
+import atexit
+import functools
+import importlib
+import inspect
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import deque
+
+
+# Módulos cuyas funciones públicas se instrumentan
+MODULOS = ("src.utils.csv_handler", "src.services.pais_service", "src.utils.statistics")
+# Las funciones que devuelven generadores se miden mal (el trabajo ocurre al recorrerlos)
+EXCLUIDAS = {"iter_paises"}
+MAX_MUESTRAS = 10_000  # Latencias guardadas por función para calcular percentiles
+
+_metricas = {}
+_originales = {}  # Función medida -> función original
+_lock = threading.Lock()
+_local = threading.local()
+_activo = False
+_medir_memoria = False
+
+
+class Metrica:
+    """Acumulados de una función instrumentada."""
+
+    def __init__(self):
+        self.llamadas = 0
+        self.segundos = 0.0
+        self.filas = 0
+        self.memoria_pico = 0
+        self.latencias = deque(maxlen=MAX_MUESTRAS)
+
+    def percentil(self, p):
+        if not self.latencias:
+            return 0.0
+        ordenadas = sorted(self.latencias)
+        return ordenadas[min(int(p * len(ordenadas)), len(ordenadas) - 1)]
+
+    def como_dict(self):
+        return {
+            "llamadas": self.llamadas,
+            "segundos_total": self.segundos,
+            "p50_s": self.percentil(0.50),
+            "p99_s": self.percentil(0.99),
+            "filas": self.filas,
+            "memoria_pico_bytes": self.memoria_pico,
+        }
+
+
+def _contar_filas(args, resultado):
+    """Filas procesadas: la colección recibida o, si no hay, la devuelta."""
+    for candidato in (args[0] if args else None, resultado):
+        if hasattr(candidato, "__len__") and not isinstance(candidato, (str, bytes, dict, tuple)):
+            return len(candidato)
+    return 0
+
+
+def _medida(nombre, funcion):
+    metrica = _metricas.setdefault(nombre, Metrica())
+
+    @functools.wraps(funcion)
+    def envoltura(*args, **kwargs):
+        # Con llamadas anidadas, solo la externa reinicia el pico de memoria
+        externa = _medir_memoria and not getattr(_local, "profundidad", 0)
+        _local.profundidad = getattr(_local, "profundidad", 0) + 1
+        if externa:
+            tracemalloc.reset_peak()
+            memoria_inicial = tracemalloc.get_traced_memory()[0]
+        resultado = None
+        inicio = time.perf_counter()
+        try:
+            resultado = funcion(*args, **kwargs)
+            return resultado
+        finally:
+            # Las llamadas que lanzan una excepción también cuentan
+            duracion = time.perf_counter() - inicio
+            _local.profundidad -= 1
+            pico = tracemalloc.get_traced_memory()[1] - memoria_inicial if externa else 0
+            with _lock:
+                metrica.llamadas += 1
+                metrica.segundos += duracion
+                metrica.filas += _contar_filas(args, resultado)
+                metrica.memoria_pico = max(metrica.memoria_pico, pico)
+                metrica.latencias.append(duracion)
+
+    return envoltura
+
+
+def _funciones_publicas(modulo):
+    for nombre, objeto in vars(modulo).items():
+        if (nombre.startswith("_") or nombre in EXCLUIDAS or not inspect.isfunction(objeto)
+                or objeto.__module__ != modulo.__name__):
+            continue
+        yield nombre, objeto
+
+
+def _modulos_de_la_aplicacion():
+    return [
+        modulo for nombre, modulo in list(sys.modules.items())
+        if modulo is not None and (nombre == "src" or nombre.startswith("src.") or nombre == "__main__")
+    ]
+
+
+def _reemplazar(reemplazos):
+    """Cambia cada función por su reemplazo en todos los módulos de la aplicación."""
+    for modulo in _modulos_de_la_aplicacion():
+        for nombre, objeto in list(vars(modulo).items()):
+            nuevo = reemplazos.get(id(objeto))
+            if nuevo is not None and nuevo[0] is objeto:
+                setattr(modulo, nombre, nuevo[1])
+
+
+def activar(modulos=MODULOS, memoria=False, salida=None):
+    """
+    Instrumenta las funciones públicas de los módulos indicados.
+
+    Args:
+        modulos (iterable): Nombres de módulos a instrumentar
+        memoria (bool): Medir el pico de memoria de cada llamada con tracemalloc
+        salida (str, optional): Archivo donde guardar el reporte al salir (.json o .prom)
+    """
+    global _activo, _medir_memoria
+    with _lock:
+        if _activo:
+            return
+        _activo = True
+    _medir_memoria = memoria
+    if memoria and not tracemalloc.is_tracing():
+        tracemalloc.start()
+
+    reemplazos = {}
+    for nombre_modulo in modulos:
+        modulo = importlib.import_module(nombre_modulo)
+        for nombre, funcion in _funciones_publicas(modulo):
+            medida = _medida(f"{nombre_modulo}.{nombre}", funcion)
+            _originales[medida] = funcion
+            reemplazos[id(funcion)] = (funcion, medida)
+    _reemplazar(reemplazos)
+    atexit.register(_volcar_al_salir, salida)
+
+
+def activar_desde_entorno():
+    """Activa la instrumentación con las opciones de PAISES_PROFILE_MEMORIA y PAISES_PROFILE_SALIDA."""
+    activar(
+        memoria=os.environ.get("PAISES_PROFILE_MEMORIA", "") not in ("", "0"),
+        salida=os.environ.get("PAISES_PROFILE_SALIDA"),
+    )
+
+
+def desactivar():
+    """Restaura las funciones originales (las métricas se conservan)."""
+    global _activo
+    if not _activo:
+        return
+    _reemplazar({id(medida): (medida, original) for medida, original in _originales.items()})
+    _originales.clear()
+    atexit.unregister(_volcar_al_salir)
+    if _medir_memoria and tracemalloc.is_tracing():
+        tracemalloc.stop()
+    _activo = False
+
+
+def esta_activo():
+    return _activo
+
+
+def reiniciar():
+    """Borra las métricas acumuladas."""
+    with _lock:
+        for metrica in _metricas.values():
+            metrica.__init__()
+
+
+# -----------------------
+# Reportes
+# -----------------------
+def reporte():
+    """
+    Returns:
+        dict: Nombre de función -> métricas (solo funciones llamadas al menos una vez)
+    """
+    with _lock:
+        return {nombre: m.como_dict() for nombre, m in sorted(_metricas.items()) if m.llamadas}
+
+
+def reporte_json():
+    return json.dumps(reporte(), indent=2, ensure_ascii=False)
+
+
+def reporte_prometheus():
+    """Reporte en el formato de texto de Prometheus."""
+    metricas = reporte()
+    lineas = []
+
+    def serie(nombre, tipo, ayuda, valores):
+        lineas.append(f"# HELP {nombre} {ayuda}")
+        lineas.append(f"# TYPE {nombre} {tipo}")
+        lineas.extend(valores)
+
+    serie("paises_llamadas_total", "counter", "Cantidad de llamadas",
+          [f'paises_llamadas_total{{funcion="{f}"}} {m["llamadas"]}' for f, m in metricas.items()])
+    serie("paises_segundos_total", "counter", "Tiempo acumulado en segundos",
+          [f'paises_segundos_total{{funcion="{f}"}} {m["segundos_total"]:.9f}' for f, m in metricas.items()])
+    serie("paises_latencia_segundos", "summary", "Latencia por llamada", [
+        f'paises_latencia_segundos{{funcion="{f}",quantile="{q}"}} {m[clave]:.9f}'
+        for f, m in metricas.items() for q, clave in (("0.5", "p50_s"), ("0.99", "p99_s"))
+    ])
+    serie("paises_filas_total", "counter", "Filas procesadas",
+          [f'paises_filas_total{{funcion="{f}"}} {m["filas"]}' for f, m in metricas.items()])
+    serie("paises_memoria_pico_bytes", "gauge", "Pico de memoria de una llamada",
+          [f'paises_memoria_pico_bytes{{funcion="{f}"}} {m["memoria_pico_bytes"]}' for f, m in metricas.items()])
+    return "\n".join(lineas) + "\n"
+
+
+def reporte_texto():
+    """Tabla legible con una función por línea, de mayor a menor tiempo total."""
+    metricas = sorted(reporte().items(), key=lambda item: -item[1]["segundos_total"])
+    lineas = [f"{'FUNCIÓN':<50} {'LLAMADAS':>9} {'TOTAL ms':>10} {'P50 ms':>9} {'P99 ms':>9} {'FILAS':>12}"]
+    for nombre, m in metricas:
+        lineas.append(
+            f"{nombre:<50} {m['llamadas']:>9} {m['segundos_total'] * 1000:>10.3f} "
+            f"{m['p50_s'] * 1000:>9.3f} {m['p99_s'] * 1000:>9.3f} {m['filas']:>12,}"
+        )
+    return "\n".join(lineas) + "\n"
+
+
+def guardar_reporte(path):
+    """Guarda el reporte en JSON o, si la ruta termina en .prom, en formato Prometheus."""
+    contenido = reporte_prometheus() if path.endswith(".prom") else reporte_json()
+    with open(path, "w", encoding="utf-8") as archivo:
+        archivo.write(contenido)
+
+
+def _volcar_al_salir(salida):
+    if not reporte():
+        return
+    sys.stderr.write("\n" + reporte_texto())
+    if salida:
+        guardar_reporte(salida)
+
+
+if os.environ.get("PAISES_PROFILE", "") not in ("", "0"):
+    activar_desde_entorno()
@@ -0,0 +1,139 @@
+"""
+Módulo de registro de cambios (write-ahead log)
+Responsabilidad: Guardar altas y modificaciones sin reescribir el CSV completo
+"""
+import json
+import os
+
+from src.utils.validations import normalizar
+
+
+def ruta_registro(path_csv):
+    """Devuelve la ruta del registro de cambios asociado a un CSV."""
+    return path_csv + ".log"
+
+
+def agregar_al_registro(path_csv, cambios):
+    """
+    Agrega cambios al final del registro, uno por línea en formato JSON.
+    
+    Args:
+        path_csv (str): Ruta del CSV base
+        cambios (list): Cambios tal como los devuelve PaisTable.tomar_diario()
+    """
+    if not cambios:
+        return
+    lineas = "".join(json.dumps(cambio, ensure_ascii=False) + "\n" for cambio in cambios)
+    with open(ruta_registro(path_csv), "a", encoding="utf-8") as f:
+        f.write(lineas)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def leer_registro(path_csv):
+    """
+    Lee los cambios registrados para un CSV.
+    
+    Una última línea incompleta (por ejemplo, por un corte durante la
+    escritura) se informa y se ignora.
+    
+    Args:
+        path_csv (str): Ruta del CSV base
+        
+    Returns:
+        list: Cambios en el orden en que se registraron (vacía si no hay registro)
+    """
+    ruta = ruta_registro(path_csv)
+    if not os.path.exists(ruta):
+        return []
+    
+    cambios = []
+    with open(ruta, encoding="utf-8") as f:
+        for num_linea, linea in enumerate(f, start=1):
+            if not linea.strip():
+                continue
+            try:
+                cambios.append(json.loads(linea))
+            except json.JSONDecodeError:
+                print(f"Registro de cambios dañado en la línea {num_linea}: se ignora el resto")
+                break
+    return cambios
+
+
+def aplicar_registro(paises, cambios):
+    """
+    Aplica los cambios registrados sobre una tabla de países.
+    
+    Las altas de países que ya existen y las modificaciones de países que no
+    existen se ignoran, así que aplicar el mismo registro dos veces es seguro.
+    
+    Args:
+        paises (PaisTable): Tabla cargada desde el CSV base
+        cambios (list): Cambios leídos con leer_registro
+        
+    Returns:
+        int: Cantidad de cambios aplicados
+    """
+    aplicados = 0
+    for cambio in cambios:
+        if cambio.get("op") == "agregar":
+            pais = cambio["pais"]
+            if paises.buscar_id(pais["nombre"]) is None:
+                paises.agregar(pais)
+                aplicados += 1
+        elif cambio.get("op") == "actualizar":
+            id_fila = paises.buscar_id(cambio["nombre"])
+            if id_fila is not None:
+                paises[id_fila][cambio["campo"]] = cambio["valor"]
+                aplicados += 1
+    return aplicados
+
+
+def aplicar_registro_en_lotes(lotes, cambios, chunk_size):
+    """
+    Aplica los cambios registrados a países que se leen en lotes, sin armar la tabla.
+
+    Da el mismo resultado que aplicar_registro sobre la tabla completa: las
+    modificaciones se aplican a la primera fila con ese nombre, las altas de
+    nombres que ya existen se ignoran y las altas nuevas salen al final, con
+    las modificaciones registradas después de cada alta.
+
+    Args:
+        lotes (iterable): Listas de diccionarios de países (el CSV base)
+        cambios (list): Cambios leídos con leer_registro
+        chunk_size (int): Tamaño máximo de los lotes con las altas
+
+    Returns:
+        generator: Genera listas de diccionarios de países
+    """
+    modificaciones = {}  # Nombre normalizado -> cambios si el país está en el CSV base
+    altas = {}           # Nombre normalizado -> (país, cambios posteriores) si no está
+    for cambio in cambios:
+        if cambio.get("op") == "agregar":
+            clave = normalizar(cambio["pais"]["nombre"])
+            altas.setdefault(clave, (dict(cambio["pais"]), {}))
+        elif cambio.get("op") == "actualizar":
+            clave = normalizar(cambio["nombre"])
+            modificaciones.setdefault(clave, {})[cambio["campo"]] = cambio["valor"]
+            if clave in altas:
+                altas[clave][1][cambio["campo"]] = cambio["valor"]
+
+    for lote in lotes:
+        if modificaciones or altas:
+            for pais in lote:
+                clave = normalizar(pais["nombre"])
+                altas.pop(clave, None)
+                pais.update(modificaciones.pop(clave, {}))
+        yield lote
+
+    nuevos = [dict(pais, **posteriores) for pais, posteriores in altas.values()]
+    for inicio in range(0, len(nuevos), chunk_size):
+        yield nuevos[inicio:inicio + chunk_size]
+
+
+def borrar_registro(path_csv):
+    """Elimina el registro de cambios (después de compactarlo en el CSV)."""
+    try:
+        os.remove(ruta_registro(path_csv))
+    except FileNotFoundError:
+        pass
@@ -0,0 +1,171 @@
+"""
+Módulo de presentación de tablas
+Responsabilidad: Formatear listados de países y escribirlos en bloque o por páginas
+"""
+import sys
+
+
+# (campo, encabezado, alineación, ancho mínimo, formato numérico)
+COLUMNAS = (
+    ("nombre", "PAÍS", "<", 20, ""),
+    ("poblacion", "POBLACIÓN", ">", 12, ","),
+    ("superficie", "SUPERFICIE", ">", 12, ","),
+    ("continente", "CONTINENTE", "<", 15, ""),
+)
+SEPARADOR = " | "
+FILAS_POR_ESCRITURA = 10_000
+
+
+def calcular_anchos(paises):
+    """
+    Calcula una sola vez el ancho de cada columna para toda la colección,
+    así todas las páginas quedan alineadas igual.
+
+    Returns:
+        tuple: Ancho de cada columna de COLUMNAS
+    """
+    anchos = []
+    for campo, encabezado, _, minimo, formato in COLUMNAS:
+        if formato:
+            # El número más largo es el mínimo o el máximo (por el signo)
+            valores = [p[campo] for p in paises]
+            extremos = (min(valores, default=0), max(valores, default=0))
+            mas_largo = max(len(f"{v:{formato}}") for v in extremos)
+        else:
+            mas_largo = max((len(p[campo]) for p in paises), default=0)
+        anchos.append(max(minimo, len(encabezado), mas_largo))
+    return tuple(anchos)
+
+
+def _plantilla(anchos):
+    return SEPARADOR.join(
+        f"{{{i}:{alineacion}{ancho}{formato}}}"
+        for i, ((_, _, alineacion, _, formato), ancho) in enumerate(zip(COLUMNAS, anchos))
+    )
+
+
+def formatear_encabezado(anchos):
+    """Devuelve el encabezado y la línea separadora, terminados en salto de línea."""
+    encabezado = SEPARADOR.join(
+        f"{titulo:<{ancho}}" for (_, titulo, _, _, _), ancho in zip(COLUMNAS, anchos)
+    )
+    return f"{encabezado}\n{'-' * len(encabezado)}\n"
+
+
+def formatear_filas(paises, anchos):
+    """
+    Formatea un conjunto de filas como un único texto.
+
+    Returns:
+        str: Una línea por país, cada una terminada en salto de línea
+    """
+    formato = _plantilla(anchos).format
+    campos = [campo for campo, *_ in COLUMNAS]
+    return "".join(formato(*(p[c] for c in campos)) + "\n" for p in paises)
+
+
+def escribir_tabla(paises, salida=None, filas_por_escritura=FILAS_POR_ESCRITURA):
+    """
+    Escribe la tabla completa con una escritura por bloque de filas,
+    en lugar de un print por país.
+
+    Args:
+        paises (list | PaisTable): Países a mostrar
+        salida (file, optional): Archivo o stream de texto (por defecto, sys.stdout)
+        filas_por_escritura (int): Filas formateadas en cada escritura
+    """
+    salida = salida or sys.stdout
+    if not paises:
+        salida.write("No hay países para mostrar.\n")
+        return
+
+    anchos = calcular_anchos(paises)
+    salida.write(formatear_encabezado(anchos))
+    for inicio in range(0, len(paises), filas_por_escritura):
+        salida.write(formatear_filas(paises[inicio:inicio + filas_por_escritura], anchos))
+    salida.flush()
+
+
+def paginar(paises, tamano_pagina, salida=None, entrada=input):
+    """
+    Muestra la tabla de a una página, con navegación siguiente/anterior.
+
+    Args:
+        paises (list | PaisTable): Países a mostrar
+        tamano_pagina (int): Filas por página
+        salida (file, optional): Stream de texto (por defecto, sys.stdout)
+        entrada (callable): Función que lee la orden del usuario
+    """
+    salida = salida or sys.stdout
+    if len(paises) <= tamano_pagina:
+        escribir_tabla(paises, salida)
+        return
+
+    anchos = calcular_anchos(paises)
+    paginas = (len(paises) + tamano_pagina - 1) // tamano_pagina
+    pagina = 0
+    while True:
+        inicio = pagina * tamano_pagina
+        salida.write(formatear_encabezado(anchos))
+        salida.write(formatear_filas(paises[inicio:inicio + tamano_pagina], anchos))
+        salida.write(f"\nPágina {pagina + 1} de {paginas}\n")
+        salida.flush()
+
+        orden = entrada("[S]iguiente, [A]nterior, [Q] salir: ").strip().lower()
+        if orden in ("q", "salir"):
+            return
+        if orden == "a":
+            pagina = max(pagina - 1, 0)
+        elif pagina + 1 < paginas:
+            pagina += 1
+        else:
+            return
+
+
+def _celda(valor):
+    """Texto de una celda genérica: países anidados por su nombre, números con separador de miles."""
+    if hasattr(valor, "keys"):
+        return valor["nombre"]
+    if isinstance(valor, bool) or valor is None:
+        return str(valor)
+    if isinstance(valor, int):
+        return f"{valor:,}"
+    if isinstance(valor, float):
+        return f"{valor:,.2f}"
+    return str(valor)
+
+
+def escribir_registros(registros, salida=None):
+    """
+    Escribe una tabla genérica (por ejemplo, estadísticas por continente),
+    con una columna por clave del primer registro. Los números se alinean a
+    la derecha y los países anidados se muestran por su nombre.
+
+    Args:
+        registros (list): Diccionarios con las mismas claves
+        salida (file, optional): Stream de texto (por defecto, sys.stdout)
+    """
+    salida = salida or sys.stdout
+    if not registros:
+        salida.write("No hay datos para mostrar.\n")
+        return
+
+    campos = list(registros[0])
+    filas = [[_celda(r.get(campo)) for campo in campos] for r in registros]
+    numericas = [
+        all(isinstance(r.get(campo), (int, float)) for r in registros) for campo in campos
+    ]
+    anchos = [
+        max(len(campo), *(len(fila[i]) for fila in filas)) for i, campo in enumerate(campos)
+    ]
+
+    def linea(celdas):
+        return SEPARADOR.join(
+            f"{celda:{'>' if numerica else '<'}{ancho}}"
+            for celda, numerica, ancho in zip(celdas, numericas, anchos)
+        ).rstrip() + "\n"
+
+    encabezado = SEPARADOR.join(f"{campo.upper():<{ancho}}" for campo, ancho in zip(campos, anchos))
+    salida.write(f"{encabezado}\n{'-' * len(encabezado)}\n")
+    salida.write("".join(linea(fila) for fila in filas))
+    salida.flush()
@@ -0,0 +1,17 @@
+"""
+Módulo de serialización
+Responsabilidad: Convertir resultados de la aplicación a JSON
+"""
+
+
+def a_json(valor):
+    """
+    Función ``default`` de json para serializar las filas de PaisTable
+    (vistas tipo Mapping) como objetos.
+
+    Raises:
+        TypeError: Si el valor no se puede serializar
+    """
+    if hasattr(valor, "keys"):
+        return dict(valor)
+    raise TypeError(f"No serializable: {type(valor).__name__}")
@@ -0,0 +1,343 @@
+"""
+Almacenamiento en SQLite
+Responsabilidad: Guardar y consultar países en una base SQLite embebida
+"""
+import contextlib
+import sqlite3
+import threading
+
+from src.models.pais import PaisTable
+from src.utils.csv_handler import TAMANO_LOTE, iter_paises
+from src.utils.validations import normalizar
+
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS paises (
+    id INTEGER PRIMARY KEY,
+    nombre TEXT NOT NULL,
+    nombre_norm TEXT NOT NULL UNIQUE,
+    poblacion INTEGER NOT NULL,
+    superficie INTEGER NOT NULL,
+    continente TEXT NOT NULL,
+    continente_norm TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_paises_continente ON paises (continente_norm);
+CREATE INDEX IF NOT EXISTS idx_paises_poblacion ON paises (poblacion);
+CREATE INDEX IF NOT EXISTS idx_paises_superficie ON paises (superficie);
+"""
+COLUMNAS = "nombre, poblacion, superficie, continente"
+INSERTAR = (
+    "INSERT OR IGNORE INTO paises "
+    "(nombre, nombre_norm, poblacion, superficie, continente, continente_norm) "
+    "VALUES (?, ?, ?, ?, ?, ?)"
+)
+ORDENES = {
+    "poblacion": "poblacion",
+    "superficie": "superficie",
+    "nombre": "minusculas(nombre)",
+}
+
+
+def _fila(pais):
+    """Convierte un diccionario de país en la tupla que espera INSERTAR."""
+    nombre = pais["nombre"].strip()
+    continente = pais["continente"].strip()
+    return (
+        nombre, normalizar(nombre), int(pais["poblacion"]), int(pais["superficie"]),
+        continente, continente.lower()
+    )
+
+
+def _como_dict(cursor, fila):
+    return {columna[0]: valor for columna, valor in zip(cursor.description, fila)}
+
+
+class SqliteStore:
+    """
+    Backend de países sobre SQLite, con el mismo contrato que csv_handler.
+
+    - Índices sobre nombre normalizado (único), continente, población y superficie.
+    - Los filtros, ordenamientos y estadísticas se resuelven con consultas SQL,
+      sin cargar todos los países en memoria.
+    - La base se abre en modo WAL con una conexión por hilo: los lectores de
+      otros hilos siguen trabajando (y viendo los datos confirmados) mientras
+      un hilo escribe. Las escrituras las serializa SQLite. Por eso hace falta
+      un archivo: con ':memory:' cada conexión tendría su propia base vacía.
+
+    Los nombres se comparan sin distinguir mayúsculas ni tildes (como agregar_pais),
+    por lo que no puede haber dos países con el mismo nombre normalizado.
+    """
+
+    def __init__(self, path_db):
+        """
+        Args:
+            path_db (str): Ruta del archivo de base de datos (se crea si no existe)
+
+        Raises:
+            ValueError: Si se pide una base en memoria; cada hilo abriría la suya, vacía
+        """
+        if path_db in ("", ":memory:"):
+            raise ValueError("SqliteStore necesita un archivo: una base en memoria no se comparte entre hilos")
+        self.path_db = path_db
+        self._local = threading.local()
+        self._conexiones = []
+        self._lock = threading.Lock()
+        self._conexion.execute("PRAGMA journal_mode=WAL")
+        self._conexion.executescript(ESQUEMA)
+
+    @property
+    def _conexion(self):
+        """Conexión del hilo actual (una conexión de SQLite no se comparte entre hilos)."""
+        conexion = getattr(self._local, "conexion", None)
+        if conexion is None:
+            # check_same_thread=False solo para poder cerrarlas todas desde cerrar()
+            conexion = sqlite3.connect(self.path_db, check_same_thread=False)
+            conexion.row_factory = _como_dict
+            # lower() de SQLite solo convierte ASCII; se usa el de Python para ordenar nombres con tildes
+            conexion.create_function("minusculas", 1, str.lower, deterministic=True)
+            conexion.execute("PRAGMA synchronous=NORMAL")
+            self._local.conexion = conexion
+            with self._lock:
+                self._conexiones.append(conexion)
+        return conexion
+
+    def cerrar(self):
+        """Cierra las conexiones con la base de todos los hilos."""
+        with self._lock:
+            conexiones, self._conexiones = self._conexiones, []
+        for conexion in conexiones:
+            conexion.close()
+        self._local = threading.local()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
+
+    def _consultar(self, sql, parametros=()):
+        return self._conexion.execute(sql, parametros).fetchall()
+
+    @contextlib.contextmanager
+    def _lectura(self):
+        """Agrupa varias consultas en una transacción, para que todas lean la misma versión de la base."""
+        conexion = self._conexion
+        if conexion.in_transaction:
+            yield
+            return
+        conexion.execute("BEGIN")
+        try:
+            yield
+        finally:
+            conexion.commit()
+
+    # -----------------------
+    # Contrato de csv_handler
+    # -----------------------
+    def cargar_paises(self):
+        """
+        Carga todos los países de la base.
+
+        Returns:
+            PaisTable: Tabla columnar de países, en orden de alta
+        """
+        return PaisTable.desde_dicts(self._consultar(f"SELECT {COLUMNAS} FROM paises ORDER BY id"))
+
+    def guardar_paises(self, paises):
+        """
+        Reemplaza el contenido de la base por los países indicados, en una sola transacción.
+
+        Args:
+            paises (list): Lista de diccionarios de países
+
+        Returns:
+            bool: True si se guardó exitosamente, False en caso contrario
+        """
+        if not paises:
+            return False
+        try:
+            with self._conexion:
+                self._conexion.execute("DELETE FROM paises")
+                self._conexion.executemany(INSERTAR, (_fila(p) for p in paises))
+            return True
+        except (sqlite3.Error, KeyError, ValueError) as e:
+            print(f"Error al guardar en la base de datos: {e}")
+            return False
+
+    def importar_csv(self, path_csv, tamano_lote=TAMANO_LOTE):
+        """
+        Importa un CSV en lotes, con una transacción y un executemany por lote.
+
+        Args:
+            path_csv (str): Ruta al archivo CSV
+            tamano_lote (int): Cantidad de filas por transacción
+
+        Returns:
+            int: Cantidad de países insertados (los nombres repetidos se omiten)
+
+        Raises:
+            FileNotFoundError: Si el archivo no existe
+        """
+        antes = len(self)
+        for lote in iter_paises(path_csv, tamano_lote):
+            with self._conexion:
+                self._conexion.executemany(INSERTAR, (_fila(p) for p in lote))
+        return len(self) - antes
+
+    def __len__(self):
+        return self._consultar("SELECT COUNT(*) AS cantidad FROM paises")[0]["cantidad"]
+
+    # -----------------------
+    # Altas y modificaciones
+    # -----------------------
+    def agregar_pais(self, nombre, poblacion, superficie, continente):
+        """
+        Returns:
+            bool: True si se agregó exitosamente, False si ya existe
+        """
+        pais = {"nombre": nombre, "poblacion": poblacion, "superficie": superficie, "continente": continente}
+        with self._conexion:
+            cursor = self._conexion.execute(INSERTAR, _fila(pais))
+        return cursor.rowcount == 1
+
+    def actualizar_pais(self, nombre, nueva_poblacion=None, nueva_superficie=None):
+        """
+        Returns:
+            bool: True si se actualizó exitosamente, False si no se encontró el país
+        """
+        with self._conexion:
+            cursor = self._conexion.execute(
+                "UPDATE paises SET poblacion = COALESCE(?, poblacion), "
+                "superficie = COALESCE(?, superficie) WHERE nombre_norm = ?",
+                (
+                    None if nueva_poblacion is None else int(nueva_poblacion),
+                    None if nueva_superficie is None else int(nueva_superficie),
+                    normalizar(nombre),
+                ),
+            )
+        return cursor.rowcount == 1
+
+    # -----------------------
+    # Filtros y búsqueda (pais_service)
+    # -----------------------
+    def filtrar_por_continente(self, continente):
+        """Países del continente (insensible a mayúsculas), usando el índice de continente."""
+        return self._consultar(
+            f"SELECT {COLUMNAS} FROM paises WHERE continente_norm = ? ORDER BY id",
+            (continente.strip().lower(),),
+        )
+
+    def filtrar_por_poblacion(self, min_poblacion=0, max_poblacion=float('inf')):
+        """Países con población en el rango, usando el índice de población."""
+        return self._consultar(
+            f"SELECT {COLUMNAS} FROM paises WHERE poblacion BETWEEN ? AND ? ORDER BY id",
+            (min_poblacion, max_poblacion),
+        )
+
+    def filtrar_por_superficie(self, min_superficie=0, max_superficie=float('inf')):
+        """Países con superficie en el rango, usando el índice de superficie."""
+        return self._consultar(
+            f"SELECT {COLUMNAS} FROM paises WHERE superficie BETWEEN ? AND ? ORDER BY id",
+            (min_superficie, max_superficie),
+        )
+
+    def buscar_pais(self, nombre):
+        """Búsqueda parcial, sin distinguir mayúsculas ni tildes."""
+        patron = normalizar(nombre).replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        return self._consultar(
+            f"SELECT {COLUMNAS} FROM paises WHERE nombre_norm LIKE ? ESCAPE '\\' ORDER BY id",
+            (f"%{patron}%",),
+        )
+
+    def _ordenar(self, campo, descendente, limite, desplazamiento):
+        sentido = "DESC" if descendente else "ASC"
+        return self._consultar(
+            f"SELECT {COLUMNAS} FROM paises ORDER BY {ORDENES[campo]} {sentido}, id "
+            "LIMIT ? OFFSET ?",
+            (-1 if limite is None else limite, desplazamiento),
+        )
+
+    def ordenar_por_poblacion(self, descendente=True, limite=None, desplazamiento=0):
+        return self._ordenar("poblacion", descendente, limite, desplazamiento)
+
+    def ordenar_por_superficie(self, descendente=True, limite=None, desplazamiento=0):
+        return self._ordenar("superficie", descendente, limite, desplazamiento)
+
+    def ordenar_por_nombre(self, descendente=False, limite=None, desplazamiento=0):
+        return self._ordenar("nombre", descendente, limite, desplazamiento)
+
+    # -----------------------
+    # Estadísticas (statistics)
+    # -----------------------
+    def _promedio(self, campo):
+        fila = self._consultar(f"SELECT SUM({campo}) AS suma, COUNT(*) AS cantidad FROM paises")[0]
+        if not fila["cantidad"]:
+            return 0
+        return fila["suma"] / fila["cantidad"]
+
+    def _extremo(self, campo, maximo, continente=None):
+        filtro, parametros = "", ()
+        if continente is not None:
+            filtro, parametros = "WHERE continente_norm = ?", (continente.strip().lower(),)
+        sentido = "DESC" if maximo else "ASC"
+        filas = self._consultar(
+            f"SELECT {COLUMNAS} FROM paises {filtro} ORDER BY {campo} {sentido}, id LIMIT 1", parametros
+        )
+        return filas[0] if filas else None
+
+    def promedio_poblacion(self):
+        return self._promedio("poblacion")
+
+    def promedio_superficie(self):
+        return self._promedio("superficie")
+
+    def pais_mas_poblado(self):
+        return self._extremo("poblacion", True)
+
+    def pais_menos_poblado(self):
+        return self._extremo("poblacion", False)
+
+    def pais_mas_grande(self):
+        return self._extremo("superficie", True)
+
+    def pais_mas_pequeno(self):
+        return self._extremo("superficie", False)
+
+    def estadisticas_continente(self, continente):
+        """
+        Mismo resultado que statistics.estadisticas_continente, calculado en SQL.
+
+        Las tres consultas se hacen en una misma transacción de lectura, así los
+        totales y los extremos no mezclan datos de antes y después de otra escritura.
+        """
+        with self._lectura():
+            totales = self._consultar(
+                "SELECT COUNT(*) AS total_paises, SUM(poblacion) AS poblacion_total, "
+                "SUM(superficie) AS superficie_total FROM paises WHERE continente_norm = ?",
+                (continente.strip().lower(),),
+            )[0]
+            if not totales["total_paises"]:
+                return None
+            total = totales["total_paises"]
+            mas_poblado = self._extremo("poblacion", True, continente)
+            mas_grande = self._extremo("superficie", True, continente)
+        return {
+            "continente": continente,
+            "total_paises": total,
+            "poblacion_total": totales["poblacion_total"],
+            "superficie_total": totales["superficie_total"],
+            "promedio_poblacion": totales["poblacion_total"] / total,
+            "promedio_superficie": totales["superficie_total"] / total,
+            "pais_mas_poblado": mas_poblado,
+            "pais_mas_grande": mas_grande,
+        }
+
+    def cantidad_por_continente(self):
+        """Continente -> cantidad de países, en orden de aparición."""
+        filas = self._consultar(
+            "SELECT continente, COUNT(*) AS cantidad FROM paises GROUP BY continente ORDER BY MIN(id)"
+        )
+        return {fila["continente"]: fila["cantidad"] for fila in filas}
+
+    def obtener_continentes(self):
+        return sorted(self.cantidad_por_continente())
@@ -2,6 +2,13 @@
 Módulo de estadísticas para análisis de datos de países
 Responsabilidad: Cálculos estadísticos y análisis de datos
 """
+from src.models.pais import PaisTable
+from src.utils.cache import cache_versionado
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional: se usa la versión en Python puro
+    np = None
 
 
 def promedio_poblacion(paises):
@@ -14,6 +21,8 @@ def promedio_poblacion(paises):
     Returns:
         float: Promedio de población, 0 si la lista está vacía
     """
+    if isinstance(paises, PaisTable):
+        return paises.agregados().promedio("poblacion")
     if not paises:
         return 0
     return sum(p["poblacion"] for p in paises) / len(paises)
@@ -29,6 +38,8 @@ def promedio_superficie(paises):
     Returns:
         float: Promedio de superficie, 0 si la lista está vacía
     """
+    if isinstance(paises, PaisTable):
+        return paises.agregados().promedio("superficie")
     if not paises:
         return 0
     return sum(p["superficie"] for p in paises) / len(paises)
@@ -44,6 +55,8 @@ def pais_mas_poblado(paises):
     Returns:
         dict: País con mayor población, None si la lista está vacía
     """
+    if isinstance(paises, PaisTable):
+        return _extremo_mantenido(paises, "poblacion", maximo=True)
     return max(paises, key=lambda p: p["poblacion"], default=None)
 
 
@@ -57,6 +70,8 @@ def pais_menos_poblado(paises):
     Returns:
         dict: País con menor población, None si la lista está vacía
     """
+    if isinstance(paises, PaisTable):
+        return _extremo_mantenido(paises, "poblacion", maximo=False)
     return min(paises, key=lambda p: p["poblacion"], default=None)
 
 
@@ -70,6 +85,8 @@ def pais_mas_grande(paises):
     Returns:
         dict: País con mayor superficie, None si la lista está vacía
     """
+    if isinstance(paises, PaisTable):
+        return _extremo_mantenido(paises, "superficie", maximo=True)
     return max(paises, key=lambda p: p["superficie"], default=None)
 
 
@@ -83,6 +100,8 @@ def pais_mas_pequeno(paises):
     Returns:
         dict: País con menor superficie, None si la lista está vacía
     """
+    if isinstance(paises, PaisTable):
+        return _extremo_mantenido(paises, "superficie", maximo=False)
     return min(paises, key=lambda p: p["superficie"], default=None)
 
 
@@ -101,6 +120,7 @@ def densidad_poblacional(pais):
     return pais["poblacion"] / pais["superficie"]
 
 
+@cache_versionado()
 def estadisticas_continente(paises, continente):
     """
     Genera estadísticas para un continente específico.
@@ -112,23 +132,61 @@ def estadisticas_continente(paises, continente):
     Returns:
         dict: Diccionario con estadísticas del continente
     """
-    paises_continente = [p for p in paises if p["continente"].lower() == continente.lower()]
+    if isinstance(paises, PaisTable):
+        return _estadisticas_mantenidas(paises, continente)
+    
+    estadisticas = estadisticas_por_continente(paises).get(continente.lower())
     
-    if not paises_continente:
+    if not estadisticas:
         return None
     
+    return dict(estadisticas, continente=continente)
+
+
+@cache_versionado()
+def estadisticas_por_continente(paises):
+    """
+    Genera las estadísticas de todos los continentes en una sola pasada.
+    
+    Args:
+        paises (list): Lista de diccionarios de países
+        
+    Returns:
+        dict: Estadísticas por continente (clave en minúsculas), con el mismo
+        formato que estadisticas_continente; el campo 'continente' conserva
+        la escritura con la que el continente aparece por primera vez
+    """
+    grupos = agrupar_por(paises, "continente", normalizar_clave=str.lower)
+    nombres = _primera_escritura(paises)
     return {
-        "continente": continente,
-        "total_paises": len(paises_continente),
-        "poblacion_total": sum(p["poblacion"] for p in paises_continente),
-        "superficie_total": sum(p["superficie"] for p in paises_continente),
-        "promedio_poblacion": promedio_poblacion(paises_continente),
-        "promedio_superficie": promedio_superficie(paises_continente),
-        "pais_mas_poblado": pais_mas_poblado(paises_continente),
-        "pais_mas_grande": pais_mas_grande(paises_continente)
+        continente: {
+            "continente": nombres[continente],
+            "total_paises": grupo["cantidad"],
+            "poblacion_total": grupo["poblacion"]["suma"],
+            "superficie_total": grupo["superficie"]["suma"],
+            "promedio_poblacion": grupo["poblacion"]["promedio"],
+            "promedio_superficie": grupo["superficie"]["promedio"],
+            "pais_mas_poblado": grupo["poblacion"]["argmax"],
+            "pais_mas_grande": grupo["superficie"]["argmax"]
+        }
+        for continente, grupo in grupos.items()
     }
 
 
+def _primera_escritura(paises):
+    """Continente en minúsculas -> cómo aparece escrito la primera vez."""
+    if isinstance(paises, PaisTable):
+        # Basta con recorrer los códigos distintos, en orden de aparición
+        categorias = paises.categorias()
+        continentes = (categorias[codigo] for codigo in dict.fromkeys(paises.codigos_continente()))
+    else:
+        continentes = (p["continente"] for p in paises)
+    nombres = {}
+    for continente in continentes:
+        nombres.setdefault(continente.lower(), continente)
+    return nombres
+
+
 def obtener_continentes(paises):
     """
     Obtiene la lista de continentes únicos de los países.
@@ -139,5 +197,366 @@ def obtener_continentes(paises):
     Returns:
         list: Lista de continentes únicos ordenados alfabéticamente
     """
-    continentes = set(p["continente"] for p in paises)
-    return sorted(list(continentes))
\ No newline at end of file
+    if isinstance(paises, PaisTable):
+        return sorted(cantidad_por_continente(paises))
+    return sorted(agrupar_por(paises, "continente", agregaciones=("cantidad",)))
+
+
+def cantidad_por_continente(paises):
+    """
+    Cuenta los países de cada continente.
+    
+    Args:
+        paises (list): Lista de diccionarios de países
+        
+    Returns:
+        dict: Continente -> cantidad de países
+    """
+    if isinstance(paises, PaisTable):
+        categorias = paises.categorias()
+        cantidades = paises.agregados().cantidades_por_continente()
+        return {categorias[codigo]: cantidad for codigo, cantidad in cantidades.items()}
+    
+    grupos = agrupar_por(paises, "continente", agregaciones=("cantidad",))
+    return {continente: grupo["cantidad"] for continente, grupo in grupos.items()}
+
+
+# -----------------------
+# Lecturas sobre los agregados mantenidos de una PaisTable
+# -----------------------
+def _extremo_mantenido(tabla, campo, maximo, grupo=None):
+    id_fila = tabla.agregados().extremo(campo, maximo, grupo)
+    return None if id_fila is None else tabla[id_fila]
+
+
+def _estadisticas_mantenidas(tabla, continente):
+    """estadisticas_continente leyendo los agregados (O(1) amortizado)."""
+    agregados = tabla.agregados()
+    continente_lower = continente.lower()
+    codigos = [
+        codigo for codigo, nombre in enumerate(tabla.categorias())
+        if nombre.lower() == continente_lower and agregados.cantidad(codigo)
+    ]
+    if not codigos:
+        return None
+    
+    total_paises = sum(agregados.cantidad(c) for c in codigos)
+    poblacion_total = sum(agregados.suma("poblacion", c) for c in codigos)
+    superficie_total = sum(agregados.suma("superficie", c) for c in codigos)
+    
+    def primer_maximo(campo):
+        # Entre varios códigos ('Asia' y 'asia'), gana el valor mayor y luego la primera fila
+        ids = [agregados.extremo(campo, True, c) for c in codigos]
+        return tabla[min(ids, key=lambda i: (-tabla.valor(i, campo), i))]
+    
+    return {
+        "continente": continente,
+        "total_paises": total_paises,
+        "poblacion_total": poblacion_total,
+        "superficie_total": superficie_total,
+        "promedio_poblacion": poblacion_total / total_paises,
+        "promedio_superficie": superficie_total / total_paises,
+        "pais_mas_poblado": primer_maximo("poblacion"),
+        "pais_mas_grande": primer_maximo("superficie")
+    }
+
+
+# -----------------------
+# Agrupamiento en una sola pasada
+# -----------------------
+AGREGACIONES = ("suma", "promedio", "minimo", "maximo", "cantidad", "argmax")
+
+
+def _claves_y_columnas(paises, clave, campos):
+    if isinstance(paises, PaisTable) and clave == "continente":
+        # Camino rápido: se recorren las columnas y los códigos de continente
+        categorias = paises.categorias()
+        claves = (categorias[codigo] for codigo in paises.codigos_continente())
+        return claves, [paises.columna(campo) for campo in campos]
+    
+    if callable(clave):
+        claves = (clave(p) for p in paises)
+    else:
+        claves = (p[clave] for p in paises)
+    return claves, [_valores_de(paises, campo) for campo in campos]
+
+
+def _valores_de(paises, campo):
+    return (p[campo] for p in paises)
+
+
+@cache_versionado()
+def agrupar_por(paises, clave, agregaciones=AGREGACIONES, campos=("poblacion", "superficie"),
+                normalizar_clave=None):
+    """
+    Agrupa los países y calcula agregaciones para cada grupo en una sola pasada.
+    
+    Args:
+        paises (list): Lista de diccionarios de países
+        clave (str | callable): Campo por el que agrupar, o función que recibe un país
+        agregaciones (iterable): Subconjunto de AGREGACIONES a calcular
+        campos (iterable): Campos numéricos sobre los que se calculan las agregaciones
+        normalizar_clave (callable, optional): Función aplicada a la clave de cada grupo
+            (por ejemplo, str.lower para unir 'Asia' y 'asia')
+        
+    Returns:
+        dict: Grupo -> {'cantidad': int, campo: {agregación: valor}}; 'argmax'
+        es el primer país con el valor máximo del campo. Los grupos aparecen en
+        el orden en que se encuentran.
+        
+    Raises:
+        ValueError: Si se pide una agregación desconocida
+    """
+    agregaciones = tuple(agregaciones)
+    desconocidas = set(agregaciones) - set(AGREGACIONES)
+    if desconocidas:
+        raise ValueError(f"Agregaciones desconocidas: {', '.join(sorted(desconocidas))}")
+    campos = tuple(campos) if set(agregaciones) - {"cantidad"} else ()
+    
+    claves, columnas = _claves_y_columnas(paises, clave, campos)
+    if normalizar_clave is not None:
+        claves = map(normalizar_clave, claves)
+    
+    # Estado por grupo: [cantidad, [suma, mínimo, máximo, índice del máximo] por campo]
+    estados = {}
+    for indice, (grupo, *valores) in enumerate(zip(claves, *columnas)):
+        estado = estados.get(grupo)
+        if estado is None:
+            estados[grupo] = [1] + [[valor, valor, valor, indice] for valor in valores]
+            continue
+        estado[0] += 1
+        for acumulado, valor in zip(estado[1:], valores):
+            acumulado[0] += valor
+            if valor < acumulado[1]:
+                acumulado[1] = valor
+            if valor > acumulado[2]:
+                acumulado[2] = valor
+                acumulado[3] = indice
+    
+    resultado = {}
+    for grupo, (cantidad, *acumulados) in estados.items():
+        datos = {"cantidad": cantidad} if "cantidad" in agregaciones else {}
+        for campo, (suma, minimo, maximo, indice_maximo) in zip(campos, acumulados):
+            valores = {
+                "suma": suma,
+                "promedio": suma / cantidad,
+                "minimo": minimo,
+                "maximo": maximo,
+            }
+            datos[campo] = {nombre: valores[nombre] for nombre in agregaciones if nombre in valores}
+            if "argmax" in agregaciones:
+                datos[campo]["argmax"] = paises[indice_maximo]
+        resultado[grupo] = datos
+    return resultado
+
+
+# -----------------------
+# Resumen en una sola pasada
+# -----------------------
+def _columnas_numpy(paises):
+    if isinstance(paises, PaisTable):
+        return paises.columna_numpy("poblacion"), paises.columna_numpy("superficie")
+    cantidad = len(paises)
+    poblacion = np.fromiter((p["poblacion"] for p in paises), dtype=np.int64, count=cantidad)
+    superficie = np.fromiter((p["superficie"] for p in paises), dtype=np.int64, count=cantidad)
+    return poblacion, superficie
+
+
+def _resumen_numpy(paises):
+    poblacion, superficie = _columnas_numpy(paises)
+    cantidad = len(poblacion)
+    return {
+        "total_paises": cantidad,
+        "promedio_poblacion": int(poblacion.sum()) / cantidad,
+        "promedio_superficie": int(superficie.sum()) / cantidad,
+        "pais_mas_poblado": paises[int(poblacion.argmax())],
+        "pais_menos_poblado": paises[int(poblacion.argmin())],
+        "pais_mas_grande": paises[int(superficie.argmax())],
+        "pais_mas_pequeno": paises[int(superficie.argmin())]
+    }
+
+
+def _resumen_python(paises):
+    total_poblacion = 0
+    total_superficie = 0
+    mas_poblado = menos_poblado = mas_grande = mas_pequeno = None
+    
+    for p in paises:
+        poblacion = p["poblacion"]
+        superficie = p["superficie"]
+        total_poblacion += poblacion
+        total_superficie += superficie
+        if mas_poblado is None:
+            mas_poblado = menos_poblado = mas_grande = mas_pequeno = p
+            continue
+        if poblacion > mas_poblado["poblacion"]:
+            mas_poblado = p
+        if poblacion < menos_poblado["poblacion"]:
+            menos_poblado = p
+        if superficie > mas_grande["superficie"]:
+            mas_grande = p
+        if superficie < mas_pequeno["superficie"]:
+            mas_pequeno = p
+    
+    cantidad = len(paises)
+    return {
+        "total_paises": cantidad,
+        "promedio_poblacion": total_poblacion / cantidad,
+        "promedio_superficie": total_superficie / cantidad,
+        "pais_mas_poblado": mas_poblado,
+        "pais_menos_poblado": menos_poblado,
+        "pais_mas_grande": mas_grande,
+        "pais_mas_pequeno": mas_pequeno
+    }
+
+
+def resumen_estadistico(paises):
+    """
+    Calcula todas las estadísticas generales en una sola pasada.
+    
+    Devuelve los mismos resultados que promedio_poblacion, promedio_superficie,
+    pais_mas_poblado, pais_menos_poblado, pais_mas_grande y pais_mas_pequeno.
+    Sobre una PaisTable lee los agregados mantenidos; en otro caso, si NumPy
+    está instalado, las columnas se procesan de forma vectorizada.
+    
+    Args:
+        paises (list | PaisTable): Lista de diccionarios de países
+        
+    Returns:
+        dict: Diccionario con las estadísticas (promedios en 0 y países en None
+        si la lista está vacía)
+    """
+    if not paises:
+        return {
+            "total_paises": 0,
+            "promedio_poblacion": 0,
+            "promedio_superficie": 0,
+            "pais_mas_poblado": None,
+            "pais_menos_poblado": None,
+            "pais_mas_grande": None,
+            "pais_mas_pequeno": None
+        }
+    if isinstance(paises, PaisTable):
+        # Los agregados mantenidos ya tienen todo: no hace falta recorrer la tabla
+        return {
+            "total_paises": len(paises),
+            "promedio_poblacion": promedio_poblacion(paises),
+            "promedio_superficie": promedio_superficie(paises),
+            "pais_mas_poblado": pais_mas_poblado(paises),
+            "pais_menos_poblado": pais_menos_poblado(paises),
+            "pais_mas_grande": pais_mas_grande(paises),
+            "pais_mas_pequeno": pais_mas_pequeno(paises)
+        }
+    if np is not None:
+        return _resumen_numpy(paises)
+    return _resumen_python(paises)
+
+
+@cache_versionado()
+def densidades(paises):
+    """
+    Calcula la densidad poblacional de todos los países como una operación por columna.
+    
+    Args:
+        paises (list | PaisTable): Lista de diccionarios de países
+        
+    Returns:
+        numpy.ndarray | list: Densidad de cada país (0 si la superficie es 0),
+        como ndarray si NumPy está instalado
+    """
+    if np is None:
+        return [densidad_poblacional(p) for p in paises]
+    if not paises:
+        return np.zeros(0)
+    poblacion, superficie = _columnas_numpy(paises)
+    resultado = np.zeros(len(poblacion))
+    np.divide(poblacion, superficie, out=resultado, where=superficie != 0)
+    return resultado
+
+# -----------------------
+# Versiones en streaming (sobre lotes de iter_paises)
+# -----------------------
+def promedio_poblacion_lotes(lotes):
+    """
+    Calcula el promedio de población recorriendo lotes de países.
+    
+    Args:
+        lotes (iterable): Iterable de listas de países (por ejemplo, iter_paises)
+        
+    Returns:
+        float: Promedio de población, 0 si no hay países
+    """
+    total = 0
+    cantidad = 0
+    for lote in lotes:
+        total += sum(p["poblacion"] for p in lote)
+        cantidad += len(lote)
+    if not cantidad:
+        return 0
+    return total / cantidad
+
+
+def pais_mas_poblado_lotes(lotes):
+    """
+    Encuentra el país con mayor población recorriendo lotes de países.
+    
+    Args:
+        lotes (iterable): Iterable de listas de países
+        
+    Returns:
+        dict: País con mayor población, None si no hay países
+    """
+    mejor = None
+    for lote in lotes:
+        candidato = pais_mas_poblado(lote)
+        if candidato is not None and (mejor is None or candidato["poblacion"] > mejor["poblacion"]):
+            mejor = candidato
+    return mejor
+
+
+def estadisticas_continente_lotes(lotes, continente):
+    """
+    Genera las estadísticas de un continente recorriendo lotes de países.
+    
+    Devuelve el mismo diccionario que estadisticas_continente, usando memoria
+    constante respecto del tamaño del archivo.
+    
+    Args:
+        lotes (iterable): Iterable de listas de países
+        continente (str): Nombre del continente
+        
+    Returns:
+        dict: Diccionario con estadísticas del continente, None si no hay países
+    """
+    continente_lower = continente.lower()
+    total_paises = 0
+    poblacion_total = 0
+    superficie_total = 0
+    mas_poblado = None
+    mas_grande = None
+    
+    for lote in lotes:
+        for p in lote:
+            if p["continente"].lower() != continente_lower:
+                continue
+            total_paises += 1
+            poblacion_total += p["poblacion"]
+            superficie_total += p["superficie"]
+            if mas_poblado is None or p["poblacion"] > mas_poblado["poblacion"]:
+                mas_poblado = p
+            if mas_grande is None or p["superficie"] > mas_grande["superficie"]:
+                mas_grande = p
+    
+    if not total_paises:
+        return None
+    
+    return {
+        "continente": continente,
+        "total_paises": total_paises,
+        "poblacion_total": poblacion_total,
+        "superficie_total": superficie_total,
+        "promedio_poblacion": poblacion_total / total_paises,
+        "promedio_superficie": superficie_total / total_paises,
+        "pais_mas_poblado": mas_poblado,
+        "pais_mas_grande": mas_grande
+    }
@@ -2,171 +2,176 @@
 Módulo de validaciones
 Responsabilidad: Validar datos de entrada y tipos
 """
+import unicodedata
+from collections.abc import Mapping
+from functools import lru_cache
+
+
+@lru_cache(maxsize=4096)
+def normalizar(texto):
+    """
+    Elimina tildes y convierte a minúsculas para comparar sin errores.
+
+    Los textos solo ASCII no tienen tildes: se resuelven sin descomponer en
+    NFD. Los resultados se memorizan, porque en una carga los mismos
+    continentes y nombres se normalizan muchas veces.
+    """
+    texto = texto.lower().strip()
+    if texto.isascii():
+        return texto
+    return ''.join(
+        c for c in unicodedata.normalize('NFD', texto)
+        if unicodedata.category(c) != 'Mn'
+    )
+
+
+CONTINENTES_VALIDOS = ("América", "Asia", "Europa", "África", "Oceanía")
+# Forma normalizada -> forma con tildes, calculada una sola vez
+CONTINENTES_NORMALIZADOS = {normalizar(c): c for c in CONTINENTES_VALIDOS}
 
 
 def validar_entero_positivo(valor, nombre_campo):
     """
-    Valida que un valor sea un entero positivo.
-    
+    Valida que un valor sea un entero positivo (mayor que cero).
+
     Args:
         valor: Valor a validar
         nombre_campo (str): Nombre del campo para mensajes de error
-        
+
     Returns:
         tuple: (bool, int/None, str) -> (es_valido, valor_convertido, mensaje_error)
     """
     try:
-        valor_int = int(valor)
-        if valor_int < 0:
-            return False, None, f"{nombre_campo} debe ser un número positivo"
-        return True, valor_int, ""
+        numero = int(valor)
     except (ValueError, TypeError):
-        return False, None, f"{nombre_campo} debe ser un número válido"
+        return False, None, f"{nombre_campo} debe ser un número entero válido"
+    if numero <= 0:
+        return False, None, f"{nombre_campo} debe ser un número positivo"
+    return True, numero, None
 
 
 def validar_cadena_no_vacia(valor, nombre_campo):
     """
     Valida que una cadena no esté vacía.
-    
+
     Args:
         valor: Valor a validar
         nombre_campo (str): Nombre del campo para mensajes de error
-        
+
     Returns:
         tuple: (bool, str/None, str) -> (es_valido, valor_limpio, mensaje_error)
     """
     if not valor or not str(valor).strip():
         return False, None, f"{nombre_campo} no puede estar vacío"
-    
+
     valor_limpio = str(valor).strip()
     return True, valor_limpio, ""
 
 
-def validar_continente(continente):
+def validar_continente(continente, nombre_campo="Continente"):
     """
     Valida que el continente sea uno de los valores permitidos.
-    
+    La comparación no distingue mayúsculas ni tildes.
+
     Args:
         continente (str): Nombre del continente
-        
+        nombre_campo (str): Nombre del campo para mensajes de error
+
     Returns:
         tuple: (bool, str/None, str) -> (es_valido, continente_normalizado, mensaje_error)
     """
-    continentes_validos = ["América", "Asia", "Europa", "África", "Oceanía"]
-    
-    es_valido, continente_limpio, error = validar_cadena_no_vacia(continente, "Continente")
+    es_valido, continente_limpio, error = validar_cadena_no_vacia(continente, nombre_campo)
     if not es_valido:
         return False, None, error
-    
-    # Buscar coincidencia insensible a mayúsculas
-    for cont_valido in continentes_validos:
-        if continente_limpio.lower() == cont_valido.lower():
-            return True, cont_valido, ""
-    
-    return False, None, f"Continente debe ser uno de: {', '.join(continentes_validos)}"
 
+    continente_valido = CONTINENTES_NORMALIZADOS.get(normalizar(continente_limpio))
+    if continente_valido is None:
+        return False, None, f"{nombre_campo} debe ser uno de: {', '.join(CONTINENTES_VALIDOS)}"
+    return True, continente_valido, ""
 
-import unicodedata
 
-def normalizar(texto):
-    """Elimina tildes y convierte a minúsculas para comparar sin errores."""
-    return ''.join(
-        c for c in unicodedata.normalize('NFD', texto.lower().strip())
-        if unicodedata.category(c) != 'Mn'
-    )
+# -----------------------
+# Validación por esquema
+# -----------------------
+# (campo, nombre para mensajes, validador) -> cada validador recibe (valor, nombre)
+# y devuelve (es_valido, valor_convertido, mensaje_error)
+ESQUEMA_PAIS = (
+    ("nombre", "Nombre del país", validar_cadena_no_vacia),
+    ("poblacion", "Población", validar_entero_positivo),
+    ("superficie", "Superficie", validar_entero_positivo),
+    ("continente", "Continente", validar_continente),
+)
 
-def validar_entero_positivo(valor, nombre_campo):
-    """Valida que un valor sea un entero positivo."""
-    try:
-        numero = int(valor)
-        if numero <= 0:
-            return False, None, f"{nombre_campo} debe ser un número positivo"
-        return True, numero, None
-    except ValueError:
-        return False, None, f"{nombre_campo} debe ser un número entero válido"
 
-def validar_datos_pais(nombre, poblacion, superficie, continente):
-    """Valida los datos ingresados para un país nuevo o actualizado."""
-    errores = []
+def validar_pais(fila, esquema=ESQUEMA_PAIS):
+    """
+    Valida un país (diccionario o fila del CSV) según un esquema.
+
+    Args:
+        fila (dict): Valores a validar, por nombre de campo
+        esquema (tuple): Tuplas (campo, nombre para mensajes, validador)
+
+    Returns:
+        tuple: (bool, dict/None, list) -> (es_valido, datos_validados, errores)
+    """
+    if not isinstance(fila, Mapping):
+        return False, None, ["El registro debe ser un objeto con los campos del país"]
+
     datos = {}
+    errores = []
+    for campo, nombre_campo, validador in esquema:
+        es_valido, valor, error = validador(fila.get(campo), nombre_campo)
+        if es_valido:
+            datos[campo] = valor
+        else:
+            errores.append(error)
 
-    # Validar nombre
-    if not nombre or not nombre.strip():
-        errores.append("El nombre del país no puede estar vacío")
-    else:
-        datos["nombre"] = nombre.strip().title()
-
-    # Validar población
-    es_valido, numero, error = validar_entero_positivo(poblacion, "Población")
-    if es_valido:
-        datos["poblacion"] = numero
-    else:
-        errores.append(error)
-
-    # Validar superficie
-    es_valido, numero, error = validar_entero_positivo(superficie, "Superficie")
-    if es_valido:
-        datos["superficie"] = numero
-    else:
-        errores.append(error)
-
-    # Validar continente (ignorando tildes y mayúsculas)
-    continentes_validos = ["América", "Asia", "Europa", "África", "Oceanía"]
-    continente_norm = normalizar(continente)
-    continentes_norm = [normalizar(c) for c in continentes_validos]
-
-    if continente_norm not in continentes_norm:
-        errores.append(f"Continente debe ser uno de: {', '.join(continentes_validos)}")
-    else:
-        # Guardar con la forma original (con tilde)
-        datos["continente"] = continentes_validos[continentes_norm.index(continente_norm)]
-
-    # Resultado final
     if errores:
         return False, None, errores
-    else:
-        return True, datos, None
+    return True, datos, []
+
+
+def validar_datos_pais(nombre, poblacion, superficie, continente):
     """
-    Valida todos los datos de un país.
-    
+    Valida los datos ingresados para un país nuevo o actualizado.
+    El nombre se devuelve con mayúscula inicial en cada palabra.
+
     Args:
         nombre (str): Nombre del país
         poblacion: Población del país
         superficie: Superficie del país
         continente (str): Continente del país
-        
+
     Returns:
-        tuple: (bool, dict/None, list) -> (es_valido, datos_validados, errores)
+        tuple: (bool, dict/None, list/None) -> (es_valido, datos_validados, errores)
     """
+    es_valido, datos, errores = validar_pais({
+        "nombre": nombre, "poblacion": poblacion, "superficie": superficie, "continente": continente
+    })
+    if not es_valido:
+        return False, None, errores
+
+    datos["nombre"] = datos["nombre"].title()
+    return True, datos, None
+
+
+def validar_lote_paises(filas):
+    """
+    Valida un lote de países en una sola pasada.
+
+    Args:
+        filas (iterable): Diccionarios con nombre, poblacion, superficie y continente
+
+    Returns:
+        tuple: (list, list) -> (validos, errores): validos son pares (posición, datos)
+        y errores son pares (posición, lista de mensajes)
+    """
+    validos = []
     errores = []
-    datos = {}
-    
-    # Validar nombre
-    valido, valor, error = validar_cadena_no_vacia(nombre, "Nombre del país")
-    if valido:
-        datos["nombre"] = valor
-    else:
-        errores.append(error)
-    
-    # Validar población
-    valido, valor, error = validar_entero_positivo(poblacion, "Población")
-    if valido:
-        datos["poblacion"] = valor
-    else:
-        errores.append(error)
-    
-    # Validar superficie
-    valido, valor, error = validar_entero_positivo(superficie, "Superficie")
-    if valido:
-        datos["superficie"] = valor
-    else:
-        errores.append(error)
-    
-    # Validar continente
-    valido, valor, error = validar_continente(continente)
-    if valido:
-        datos["continente"] = valor
-    else:
-        errores.append(error)
-    
-    return len(errores) == 0, datos if len(errores) == 0 else None, errores
\ No newline at end of file
+    for posicion, fila in enumerate(filas):
+        es_valido, datos, mensajes = validar_pais(fila)
+        if es_valido:
+            validos.append((posicion, datos))
+        else:
+            errores.append((posicion, mensajes))
+    return validos, errores
@@ -0,0 +1,78 @@
+import asyncio
+import os
+
+from src.services.async_service import AsyncPaisService, CerrojoLecturaEscritura
+from src.services.pais_service import filtrar_por_continente, filtrar_por_poblacion
+from src.utils.csv_handler import cargar_paises
+from src.utils.statistics import resumen_estadistico
+
+RUTA_CSV = os.path.join(os.path.dirname(__file__), "..", "data", "paises.csv")
+
+def test_consultas_concurrentes_coinciden_con_el_servicio():
+    paises = cargar_paises(RUTA_CSV)
+    esperado = [dict(p) for p in filtrar_por_poblacion(filtrar_por_continente(paises, "Asia"), 50_000_000)]
+
+    async def principal():
+        async with AsyncPaisService(paises) as servicio:
+            resultados = await asyncio.gather(*(
+                servicio.filtrar(continente="asia", min_poblacion=50_000_000) for _ in range(20)
+            ))
+            resumen = await servicio.estadisticas()
+            top = await servicio.ordenar("poblacion", descendente=True, limite=1)
+            return resultados, resumen, top
+
+    resultados, resumen, top = asyncio.run(principal())
+    assert all(r == esperado for r in resultados)
+    assert resumen["total_paises"] == len(paises)
+    assert top == [dict(resumen_estadistico(paises)["pais_mas_poblado"])]
+
+def test_escrituras_serializadas_y_resultados_inmutables():
+    async def principal():
+        async with AsyncPaisService(cargar_paises(RUTA_CSV)) as servicio:
+            antes = await servicio.buscar("argentina")
+            altas = await asyncio.gather(*(
+                servicio.agregar_pais("Atlántida", 1, 1, "Oceanía") for _ in range(5)
+            ))
+            await servicio.actualizar_pais("argentina", nueva_poblacion=1)
+            return antes, altas, await servicio.buscar("argentina")
+
+    antes, altas, despues = asyncio.run(principal())
+    assert sorted(altas) == [False] * 4 + [True]
+    assert antes[0]["poblacion"] != 1 and despues[0]["poblacion"] == 1
+
+def test_escritor_excluye_a_los_lectores():
+    eventos = []
+
+    async def lector(cerrojo, nombre):
+        async with cerrojo.lectura():
+            eventos.append(("inicio", nombre))
+            await asyncio.sleep(0.01)
+            eventos.append(("fin", nombre))
+
+    async def escritor(cerrojo):
+        async with cerrojo.escritura():
+            eventos.append(("escritura", None))
+
+    async def principal():
+        cerrojo = CerrojoLecturaEscritura()
+        await asyncio.gather(lector(cerrojo, 1), lector(cerrojo, 2), escritor(cerrojo))
+
+    asyncio.run(principal())
+    assert eventos[:2] == [("inicio", 1), ("inicio", 2)]
+    assert eventos[-1] == ("escritura", None)
+
+def test_estadisticas_concurrentes_despues_de_escrituras():
+    paises = cargar_paises(RUTA_CSV)
+
+    async def principal():
+        async with AsyncPaisService(paises, max_hilos=8) as servicio:
+            await servicio.estadisticas()
+            for poblacion in range(2_000_000_000, 2_000_000_050):
+                await servicio.actualizar_pais("argentina", nueva_poblacion=poblacion)
+            await servicio.actualizar_pais("argentina", nueva_poblacion=1)
+            return await asyncio.gather(*(servicio.estadisticas() for _ in range(50)))
+
+    resumenes = asyncio.run(principal())
+    esperado = dict(resumen_estadistico(paises)["pais_mas_poblado"])
+    assert esperado["nombre"] != "Argentina"
+    assert all(r["pais_mas_poblado"] == esperado for r in resumenes)
@@ -0,0 +1,45 @@
+from benchmarks.ejecutar import comparar, ejecutar, medir
+from benchmarks.generador import generar_csv
+from src.utils.csv_handler import cargar_paises
+
+def test_generador_reproducible_y_valido(tmp_path):
+    ruta_a = generar_csv(str(tmp_path / "a.csv"), 500, semilla=7)
+    ruta_b = generar_csv(str(tmp_path / "b.csv"), 500, semilla=7)
+    with open(ruta_a, encoding="utf-8") as a, open(ruta_b, encoding="utf-8") as b:
+        assert a.read() == b.read()
+    assert len(cargar_paises(ruta_a)) == 500
+
+def test_comparar_detecta_regresiones():
+    resultado = ejecutar([200], repeticiones=1, casos=["promedio_superficie"], informar=lambda _: None)
+    assert [r["caso"] for r in resultado["resultados"]] == ["promedio_superficie"]
+    base = {"resultados": [
+        {"caso": "lento", "filas": 10, "mejor_s": 1.0, "mejor_caliente_s": 1.0},
+        {"caso": "ok", "filas": 10, "mejor_s": 1.0, "mejor_caliente_s": 1.0},
+    ]}
+    actual = {"resultados": [
+        {"caso": "lento", "filas": 10, "mejor_s": 1.5, "mejor_caliente_s": 1.0},
+        {"caso": "ok", "filas": 10, "mejor_s": 1.1, "mejor_caliente_s": 1.1},
+    ]}
+    assert [(r["caso"], r["medida"]) for r in comparar(actual, base)] == [("lento", "mejor_s")]
+
+def test_cada_repeticion_mide_en_frio_sobre_una_tabla_nueva(tmp_path):
+    ctx = {"paises": cargar_paises(generar_csv(str(tmp_path / "a.csv"), 2000, semilla=3))}
+    tablas = []
+
+    def caso(ctx):
+        tablas.append(ctx["paises"])
+        ctx["paises"].agregados().extremo("poblacion")
+
+    medicion = medir(caso, ctx, repeticiones=3)
+    assert ctx["paises"]._agregados is None
+    assert len({id(t) for t in tablas[:6:2]}) == 3 and tablas[0] is tablas[1]
+    assert medicion["mejor_s"] > medicion["mejor_caliente_s"]
+
+def test_casos_de_streaming_paralelo_y_guardado_incremental():
+    nuevos = [
+        "promedio_poblacion_lotes", "pais_mas_poblado_lotes", "estadisticas_continente_lotes",
+        "densidad_poblacional", "iter_paises", "cargar_paises_paralelo", "guardar_cambios",
+    ]
+    resultado = ejecutar([300], repeticiones=1, casos=nuevos, informar=lambda _: None)
+    assert sorted(r["caso"] for r in resultado["resultados"]) == sorted(nuevos)
+    assert all(r["mejor_s"] > 0 for r in resultado["resultados"])
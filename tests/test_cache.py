@@ -0,0 +1,70 @@
+import gc
+import weakref
+
+from src.models.coleccion import ColeccionPaises
+from src.models.pais import PaisTable
+from src.services.pais_service import agregar_pais, filtrar_por_continente
+from src.utils.cache import CacheLRU, cache_versionado
+from src.utils.statistics import agrupar_por, estadisticas_por_continente
+
+PAISES = [
+    {"nombre": "Perú", "poblacion": 100, "superficie": 10, "continente": "América"},
+    {"nombre": "Japón", "poblacion": 300, "superficie": 20, "continente": "Asia"},
+]
+
+def test_cache_se_invalida_cuando_cambia_la_version():
+    tabla = PaisTable.desde_dicts(PAISES)
+    info_inicial = filtrar_por_continente.cache.info()
+    assert len(filtrar_por_continente(tabla, "Asia")) == 1
+    assert len(filtrar_por_continente(tabla, "Asia")) == 1
+    agregar_pais(tabla, "China", 1, 1, "Asia")
+    assert len(filtrar_por_continente(tabla, "Asia")) == 2
+    info = filtrar_por_continente.cache.info()
+    assert info["aciertos"] - info_inicial["aciertos"] == 1
+    assert info["fallos"] - info_inicial["fallos"] == 2
+
+def test_cache_lru_desaloja_la_entrada_menos_usada():
+    cache = CacheLRU(max_entradas=2)
+    cache.guardar("a", 1)
+    cache.guardar("b", 2)
+    cache.obtener("a")
+    cache.guardar("c", 3)
+    assert cache.obtener("b") == (False, None)
+    assert cache.obtener("a") == (True, 1)
+    assert cache.info()["desalojos"] == 1
+
+def test_listas_sin_version_no_se_cachean():
+    llamadas = []
+
+    @cache_versionado()
+    def contar(paises):
+        llamadas.append(1)
+        return len(paises)
+
+    contar(PAISES)
+    contar(PAISES)
+    assert len(llamadas) == 2
+
+def test_la_cache_no_mantiene_vivas_las_tablas_reemplazadas():
+    coleccion = ColeccionPaises(PaisTable.desde_dicts(PAISES), "copia")
+    reemplazadas = []
+    for i in range(50):
+        reemplazadas.append(weakref.ref(coleccion.instantanea()))
+        assert len(coleccion.leer(filtrar_por_continente, "Asia")) == i + 1
+        coleccion.escribir(agregar_pais, f"País {i}", 1, 1, "Asia")
+    gc.collect()
+    assert not any(ref() is not None for ref in reemplazadas)
+    assert filtrar_por_continente.cache.info()["entradas"] <= 1
+
+def test_modificar_un_resultado_anidado_no_altera_la_cache():
+    tabla = PaisTable.desde_dicts(PAISES)
+    estadisticas = estadisticas_por_continente(tabla)
+    estadisticas["asia"]["total_paises"] = -999
+    estadisticas["asia"]["pais_mas_poblado"] = None
+    grupos = agrupar_por(tabla, "continente")
+    grupos["Asia"]["poblacion"]["suma"] = -1
+
+    assert estadisticas_por_continente(tabla)["asia"]["total_paises"] == 1
+    assert estadisticas_por_continente(tabla)["asia"]["pais_mas_poblado"]["nombre"] == "Japón"
+    assert agrupar_por(tabla, "continente")["Asia"]["poblacion"]["suma"] == 300
+    assert estadisticas_por_continente.cache.info()["aciertos"] >= 2
@@ -0,0 +1,70 @@
+import json
+import os
+import shutil
+
+from src.cli import main
+from src.services.pais_service import filtrar_por_continente, filtrar_por_poblacion
+from src.utils.csv_handler import cargar_paises
+
+RUTA_CSV = os.path.join(os.path.dirname(__file__), "..", "data", "paises.csv")
+
+def copiar_csv(tmp_path):
+    ruta = str(tmp_path / "paises.csv")
+    shutil.copy(RUTA_CSV, ruta)
+    return ruta
+
+def test_filter_emite_ndjson_igual_al_servicio(tmp_path, capsys):
+    ruta = copiar_csv(tmp_path)
+    assert main(["filter", "--csv", ruta, "--continent", "asia", "--min-pop", "100000000"]) == 0
+    filas = [json.loads(linea) for linea in capsys.readouterr().out.splitlines()]
+    paises = cargar_paises(ruta)
+    assert filas == [dict(p) for p in filtrar_por_poblacion(filtrar_por_continente(paises, "Asia"), 100_000_000)]
+
+def test_sort_y_stats_en_csv(tmp_path, capsys):
+    ruta = copiar_csv(tmp_path)
+    main(["sort", "--csv", ruta, "--by", "superficie", "--desc", "--limit", "2", "--format", "csv"])
+    lineas = capsys.readouterr().out.splitlines()
+    assert lineas[0] == "nombre,poblacion,superficie,continente" and len(lineas) == 3
+
+    main(["stats", "--csv", ruta, "--by-continent", "--format", "csv"])
+    lineas = capsys.readouterr().out.splitlines()
+    assert lineas[0].startswith("continente,total_paises") and len(lineas) == 6
+
+def test_import_es_atomico_y_persiste(tmp_path, capsys):
+    ruta = copiar_csv(tmp_path)
+    cantidad = len(cargar_paises(ruta))
+    nuevos = tmp_path / "nuevos.ndjson"
+    nuevos.write_text(
+        '{"nombre": "Atlántida", "poblacion": 900000, "superficie": 18274, "continente": "Oceania"}\n'
+        '{"nombre": "Chile", "poblacion": 1, "superficie": 1, "continente": "América"}\n',
+        encoding="utf-8",
+    )
+    assert main(["import", "--csv", ruta, "--from-format", "ndjson", str(nuevos)]) == 1
+    assert '"registro": 2' in capsys.readouterr().err
+    assert len(cargar_paises(ruta)) == cantidad
+
+    nuevos.write_text(nuevos.read_text(encoding="utf-8").splitlines()[0] + "\n", encoding="utf-8")
+    assert main(["import", "--csv", ruta, "--from-format", "ndjson", str(nuevos)]) == 0
+    assert cargar_paises(ruta)[cantidad]["nombre"] == "Atlántida"
+
+def test_import_ndjson_informa_lineas_invalidas_por_registro(tmp_path, capsys):
+    ruta = copiar_csv(tmp_path)
+    cantidad = len(cargar_paises(ruta))
+    nuevos = tmp_path / "nuevos.ndjson"
+    nuevos.write_text(
+        '{"nombre": "Atlántida", "poblacion": 900000, "superficie": 18274, "continente": "Oceania"}\n'
+        '{"nombre": "Lemuria"\n'
+        '[1, 2]\n',
+        encoding="utf-8",
+    )
+    assert main(["import", "--csv", ruta, "--from-format", "ndjson", str(nuevos)]) == 1
+    errores = [json.loads(linea) for linea in capsys.readouterr().err.splitlines() if linea.startswith("{")]
+    assert [e["registro"] for e in errores] == [2, 3]
+    assert errores[0]["errores"][0].startswith("JSON inválido")
+    assert len(cargar_paises(ruta)) == cantidad
+
+def test_stats_por_continente_en_tabla(tmp_path, capsys):
+    assert main(["stats", "--csv", copiar_csv(tmp_path), "--by-continent", "--format", "table"]) == 0
+    lineas = capsys.readouterr().out.splitlines()
+    assert lineas[0].startswith("CONTINENTE | TOTAL_PAISES") and len(lineas) == 7
+    assert "," not in lineas[0]
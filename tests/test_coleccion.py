@@ -0,0 +1,91 @@
+import os
+import sys
+import threading
+
+import pytest
+
+from src.models.coleccion import ColeccionPaises
+from src.models.pais import PaisTable
+from src.services.pais_service import actualizar_pais, agregar_pais
+from src.utils.csv_handler import cargar_paises
+from src.utils.statistics import pais_mas_poblado, promedio_poblacion
+
+RUTA_CSV = os.path.join(os.path.dirname(__file__), "..", "data", "paises.csv")
+
+def transferir(paises, origen, destino, cantidad):
+    # Dos modificaciones que solo son consistentes juntas: la población total no cambia
+    actualizar_pais(paises, origen, nueva_poblacion=next(p for p in paises if p["nombre"] == origen)["poblacion"] - cantidad)
+    actualizar_pais(paises, destino, nueva_poblacion=next(p for p in paises if p["nombre"] == destino)["poblacion"] + cantidad)
+
+@pytest.mark.parametrize("estrategia", ["cerrojo", "copia"])
+def test_los_lectores_nunca_ven_escrituras_a_medias(estrategia):
+    coleccion = ColeccionPaises(cargar_paises(RUTA_CSV), estrategia)
+    esperado = coleccion.leer(promedio_poblacion)
+    vistos = []
+
+    def lector():
+        for _ in range(200):
+            vistos.append(coleccion.leer(promedio_poblacion))
+
+    def escritor():
+        for _ in range(50):
+            coleccion.escribir(transferir, "Argentina", "Brasil", 1000)
+
+    hilos = [threading.Thread(target=lector) for _ in range(4)] + [threading.Thread(target=escritor)]
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+
+    assert set(vistos) == {esperado}
+    assert coleccion.leer(lambda p: p[0]["poblacion"]) == 45376763 - 50_000
+
+def test_copia_publica_solo_escrituras_completas():
+    coleccion = ColeccionPaises(cargar_paises(RUTA_CSV), "copia")
+    anterior = coleccion.instantanea()
+    with pytest.raises(RuntimeError):
+        with coleccion.escritura() as paises:
+            agregar_pais(paises, "Atlántida", 1, 1, "Oceanía")
+            raise RuntimeError("falla a mitad de la escritura")
+    assert coleccion.instantanea() is anterior
+
+    assert coleccion.escribir(agregar_pais, "Atlántida", 1, 1, "Oceanía")
+    assert len(coleccion) == len(anterior) + 1
+    assert coleccion.instantanea().version == anterior.version + 1
+
+def tabla_con_entradas_viejas():
+    # Las 50 modificaciones dejan en el tope del heap entradas que ya no coinciden con la tabla
+    paises = PaisTable.desde_dicts(
+        {"nombre": f"P{i}", "poblacion": i, "superficie": 1, "continente": "Asia"} for i in range(150)
+    )
+    pais_mas_poblado(paises)
+    for i in range(100, 125):
+        paises[i]["poblacion"] = 10_000 + i
+        paises[i]["poblacion"] = i
+    return paises
+
+@pytest.mark.parametrize("estrategia", ["cerrojo", "copia"])
+def test_lectores_en_paralelo_no_corrompen_indices_ni_agregados(estrategia):
+    intervalo = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        for _ in range(50):
+            coleccion = ColeccionPaises(tabla_con_entradas_viejas(), estrategia)
+            barrera = threading.Barrier(8)
+            vistos = []
+
+            def lector():
+                barrera.wait()
+                vistos.append(coleccion.leer(pais_mas_poblado)["nombre"])
+                vistos.append(coleccion.leer(lambda p: p.buscar_id("P149")))
+
+            hilos = [threading.Thread(target=lector) for _ in range(8)]
+            for hilo in hilos:
+                hilo.start()
+            for hilo in hilos:
+                hilo.join()
+
+            assert set(vistos) == {"P149", 149}
+            assert coleccion.leer(pais_mas_poblado)["nombre"] == "P149"
+    finally:
+        sys.setswitchinterval(intervalo)
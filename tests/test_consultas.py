@@ -0,0 +1,42 @@
+import os
+
+from src.models.pais import PaisTable
+from src.services.consultas import Consulta
+from src.services.pais_service import filtrar_por_continente, filtrar_por_poblacion, ordenar_por_superficie
+from src.utils.csv_handler import cargar_paises
+
+RUTA_CSV = os.path.join(os.path.dirname(__file__), "..", "data", "paises.csv")
+
+def consulta_asia(paises):
+    return (Consulta(paises).donde("continente", "==", "asia")
+            .donde("poblacion", ">", 50_000_000)
+            .ordenar_por("superficie", descendente=True).limite(2))
+
+def test_consulta_equivale_a_encadenar_filtros():
+    paises = cargar_paises(RUTA_CSV)
+    esperado = ordenar_por_superficie(
+        filtrar_por_poblacion(filtrar_por_continente(paises, "Asia"), 50_000_001)
+    )[:2]
+    assert consulta_asia(paises).ejecutar() == esperado
+    assert consulta_asia([dict(p) for p in paises]).ejecutar() == esperado
+
+def test_explicar_muestra_el_indice_elegido():
+    plan = consulta_asia(cargar_paises(RUTA_CSV)).explicar()
+    assert plan.startswith("Origen: índice ordenado de poblacion")
+    assert "heapq.nlargest" in plan
+    assert Consulta([]).explicar() == "Origen: recorrido completo (0 filas)"
+
+def test_limite_sin_orden_y_busqueda_por_texto():
+    tabla = PaisTable.desde_dicts([
+        {"nombre": "Perú", "poblacion": 1, "superficie": 1, "continente": "América"},
+        {"nombre": "Perusia", "poblacion": 2, "superficie": 2, "continente": "Europa"},
+    ])
+    consulta = Consulta(tabla).donde("nombre", "contiene", "PERU")
+    assert [p["nombre"] for p in consulta.limite(1)] == ["Perú"]
+    assert "trigramas" in consulta.explicar()
+
+def test_con_filtros_omite_los_filtros_sin_valor():
+    paises = cargar_paises(RUTA_CSV)
+    esperado = filtrar_por_poblacion(filtrar_por_continente(paises, "Asia"), 50_000_000)
+    assert Consulta.con_filtros(paises, continente="asia", min_poblacion=50_000_000).ejecutar() == esperado
+    assert Consulta.con_filtros(paises).ejecutar() == list(paises)
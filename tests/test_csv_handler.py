@@ -0,0 +1,114 @@
+import os
+
+import pytest
+
+from src.utils.csv_handler import (
+    abrir_snapshot, cargar_paises, cargar_paises_con_snapshot, cargar_paises_paralelo,
+    guardar_cambios, guardar_paises, guardar_snapshot, iter_paises
+)
+from src.utils.statistics import estadisticas_continente, estadisticas_continente_lotes
+
+CSV = (
+    "nombre,poblacion,superficie,continente\n"
+    "Perú,100,10,América\n"
+    "Japón,300,20,Asia\n"
+    "Roto,abc,30,Asia\n"
+    "Chile,200,30,América\n"
+)
+
+def escribir_csv(tmp_path, contenido=CSV):
+    ruta = tmp_path / "paises.csv"
+    ruta.write_text(contenido, encoding="utf-8")
+    return str(ruta)
+
+def test_iter_paises_genera_lotes_e_informa_errores(tmp_path, capsys):
+    lotes = list(iter_paises(escribir_csv(tmp_path), chunk_size=2))
+    assert [len(lote) for lote in lotes] == [2, 1]
+    assert "Error en línea 4" in capsys.readouterr().out
+
+def test_estadisticas_en_streaming_coinciden_con_la_version_en_memoria(tmp_path):
+    ruta = escribir_csv(tmp_path)
+    esperado = estadisticas_continente(cargar_paises(ruta), "américa")
+    assert estadisticas_continente_lotes(iter_paises(ruta, chunk_size=1), "américa") == esperado
+
+def test_carga_paralela_coincide_con_la_carga_en_serie(tmp_path, capsys):
+    ruta = escribir_csv(tmp_path, CSV + "\nBolivia,1\n" + "Fiyi,5,6,Oceanía\n" * 50)
+    serie = [dict(p) for p in cargar_paises(ruta)]
+    errores_serie = capsys.readouterr().out
+    paralelo = [dict(p) for p in cargar_paises_paralelo(ruta, workers=3, umbral_bytes=0)]
+    assert paralelo == serie
+    assert capsys.readouterr().out == errores_serie
+
+def test_snapshot_conserva_los_datos_y_se_regenera_si_cambia_el_csv(tmp_path):
+    ruta = escribir_csv(tmp_path)
+    paises = cargar_paises(ruta)
+    assert guardar_snapshot(paises, str(tmp_path / "p.snap"), csv_mtime_ns=42)
+    abierta, mtime = abrir_snapshot(str(tmp_path / "p.snap"))
+    assert mtime == 42
+    assert [dict(p) for p in abierta] == [dict(p) for p in paises]
+
+    cargar_paises_con_snapshot(ruta)
+    escribir_csv(tmp_path, CSV + "Fiyi,5,6,Oceanía\n")
+    os.utime(ruta, ns=(10**9, 10**9))
+    assert len(cargar_paises_con_snapshot(ruta)) == 4
+
+def test_guardar_cambios_agrega_al_registro_y_se_reaplica_al_cargar(tmp_path):
+    ruta = escribir_csv(tmp_path)
+    paises = cargar_paises(ruta)
+    paises.append({"nombre": "Fiyi", "poblacion": 5, "superficie": 6, "continente": "Oceanía"})
+    paises[0]["poblacion"] = 7
+    assert guardar_cambios(paises, ruta)
+    assert open(ruta, encoding="utf-8").read() == CSV
+    assert os.path.exists(ruta + ".log")
+
+    recargados = cargar_paises(ruta)
+    assert [dict(p) for p in recargados] == [dict(p) for p in paises]
+    assert [dict(p) for p in cargar_paises_con_snapshot(ruta)] == [dict(p) for p in paises]
+
+    assert guardar_paises(recargados, ruta)
+    assert not os.path.exists(ruta + ".log")
+    assert len(cargar_paises(ruta)) == 4
+
+def test_guardar_lista_vacia_no_borra_el_archivo(tmp_path):
+    ruta = escribir_csv(tmp_path)
+    assert not guardar_paises([], ruta)
+    assert open(ruta, encoding="utf-8").read() == CSV
+
+def test_csv_ilegible_no_se_reemplaza_por_el_registro_de_cambios(tmp_path, monkeypatch):
+    ruta = escribir_csv(tmp_path)
+    paises = cargar_paises(ruta)
+    paises.append({"nombre": "Fiyi", "poblacion": 5, "superficie": 6, "continente": "Oceanía"})
+    assert guardar_cambios(paises, ruta)
+
+    with open(ruta, "ab") as f:
+        f.write(b"Ma\xffla,1,1,Asia\n")
+    original = open(ruta, "rb").read()
+    for cargar in (cargar_paises, cargar_paises_con_snapshot):
+        with pytest.raises(ValueError):
+            cargar(ruta)
+    assert open(ruta, "rb").read() == original
+
+def test_carga_paralela_informa_el_mismo_error_de_lectura(tmp_path):
+    ruta = escribir_csv(tmp_path, CSV + "".join(f"País {i},1,1,Asia\n" for i in range(100)))
+    with open(ruta, "ab") as f:
+        f.write(b"Ma\xffla,1,1,Asia\n")
+    # La posición del byte inválido depende de cómo se leyó el archivo; el resto del mensaje es igual
+    prefijo = f"Error al leer el archivo CSV {ruta}: 'utf-8' codec can't decode byte 0xff"
+    for cargar in (cargar_paises, lambda r: cargar_paises_paralelo(r, workers=3, umbral_bytes=0)):
+        with pytest.raises(ValueError) as error:
+            cargar(ruta)
+        assert str(error.value).startswith(prefijo)
+
+def test_iter_paises_aplica_el_registro_de_cambios(tmp_path, capsys):
+    ruta = escribir_csv(tmp_path)
+    paises = cargar_paises(ruta)
+    paises.append({"nombre": "Fiyi", "poblacion": 5, "superficie": 6, "continente": "Oceanía"})
+    paises[0]["poblacion"] = 1
+    paises[3]["superficie"] = 7
+    assert guardar_cambios(paises, ruta)
+
+    esperado = [dict(p) for p in cargar_paises(ruta)]
+    for chunk_size in (1, 2, 10):
+        assert [p for lote in iter_paises(ruta, chunk_size) for p in lote] == esperado
+        assert all(len(lote) <= chunk_size for lote in iter_paises(ruta, chunk_size))
+    assert estadisticas_continente_lotes(iter_paises(ruta), "oceanía")["total_paises"] == 1
@@ -0,0 +1,36 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from src.main import CargaEnSegundoPlano, RUTA_CSV
+
+RAIZ = os.path.join(os.path.dirname(__file__), "..")
+
+def test_carga_en_segundo_plano():
+    assert len(CargaEnSegundoPlano(RUTA_CSV).paises()) > 0
+    with pytest.raises(FileNotFoundError):
+        CargaEnSegundoPlano(os.path.join(RAIZ, "no_existe.csv")).paises()
+
+def test_comando_list_no_importa_servicios_ni_estadisticas():
+    codigo = (
+        "import sys; from src.__main__ import main; main(['list', '--format', 'table']); "
+        "print(sorted(m for m in ('src.services.pais_service', 'src.utils.statistics') if m in sys.modules))"
+    )
+    salida = subprocess.run(
+        [sys.executable, "-c", codigo], cwd=RAIZ, capture_output=True, text=True, check=True
+    ).stdout
+    assert salida.startswith("PAÍS")
+    assert "Argentina" in salida
+    assert salida.splitlines()[-1] == "[]"
+
+def test_comando_stats():
+    salida = subprocess.run(
+        [sys.executable, "-m", "src", "stats", "--format", "table"], cwd=RAIZ, capture_output=True, text=True, check=True
+    ).stdout
+    encabezado, separador, fila = salida.splitlines()
+    assert encabezado.split(" | ")[:3] == ["TOTAL_PAISES", "PROMEDIO_POBLACION", "PROMEDIO_SUPERFICIE"]
+    assert set(separador) == {"-"}
+    assert int(fila.split("|")[0]) == len(CargaEnSegundoPlano(RUTA_CSV).paises())
+    assert "Estados Unidos" in fila
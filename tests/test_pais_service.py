@@ -0,0 +1,78 @@
+from src.models.pais import PaisTable
+from src.services.pais_service import (
+    actualizar_pais, actualizar_paises_lote, agregar_pais, agregar_paises_lote, autocompletar_pais, buscar_pais, ordenar_por_nombre,
+    ordenar_por_poblacion, ordenar_por_superficie
+)
+
+PAISES = [
+    {"nombre": "Perú", "poblacion": 100, "superficie": 10, "continente": "América"},
+    {"nombre": "Japón", "poblacion": 300, "superficie": 20, "continente": "Asia"},
+    {"nombre": "Chile", "poblacion": 200, "superficie": 30, "continente": "América"},
+]
+
+def test_agregar_pais_detecta_duplicados_sin_tildes_ni_mayusculas():
+    for paises in ([dict(p) for p in PAISES], PaisTable.desde_dicts(PAISES)):
+        assert not agregar_pais(paises, "PERU", 1, 1, "América")
+        assert agregar_pais(paises, "Fiyi", 1, 1, "Oceanía")
+        assert not agregar_pais(paises, "fiyi", 1, 1, "Oceanía")
+        assert len(paises) == 4
+
+def test_actualizar_pais_por_nombre_normalizado():
+    tabla = PaisTable.desde_dicts(PAISES)
+    assert actualizar_pais(tabla, "japon", nueva_poblacion=5)
+    assert tabla[1]["poblacion"] == 5
+    assert not actualizar_pais(tabla, "Narnia", nueva_poblacion=5)
+
+def test_buscar_pais_ignora_tildes_con_y_sin_indice():
+    for paises in (PAISES, PaisTable.desde_dicts(PAISES)):
+        assert [p["nombre"] for p in buscar_pais(paises, "PON")] == ["Japón"]
+        assert [p["nombre"] for p in buscar_pais(paises, "e")] == ["Perú", "Chile"]
+        assert buscar_pais(paises, "xyz") == []
+
+def test_autocompletar_ordena_por_poblacion():
+    tabla = PaisTable.desde_dicts(PAISES)
+    agregar_pais(tabla, "Chipre", 900, 1, "Europa")
+    assert [p["nombre"] for p in autocompletar_pais(tabla, "chi")] == ["Chipre", "Chile"]
+    assert [p["nombre"] for p in autocompletar_pais(tabla, "chi", limite=1)] == ["Chipre"]
+
+def test_ordenar_con_limite_y_desplazamiento():
+    tabla = PaisTable.desde_dicts(PAISES)
+    for paises in (PAISES, tabla, tabla):
+        assert [p["nombre"] for p in ordenar_por_poblacion(paises, limite=2)] == ["Japón", "Chile"]
+        assert [p["nombre"] for p in ordenar_por_nombre(paises, limite=1, desplazamiento=1)] == ["Japón"]
+
+def test_permutacion_cacheada_se_invalida_al_actualizar():
+    tabla = PaisTable.desde_dicts(PAISES)
+    ordenar_por_superficie(tabla)
+    actualizar_pais(tabla, "Perú", nueva_superficie=99)
+    assert ordenar_por_superficie(tabla, limite=1)[0]["nombre"] == "Perú"
+
+def test_agregar_paises_lote_es_atomico_y_reporta_por_fila():
+    for paises in ([dict(p) for p in PAISES], PaisTable.desde_dicts(PAISES)):
+        lote = [
+            {"nombre": "Fiyi", "poblacion": "900", "superficie": 18, "continente": "oceania"},
+            {"nombre": "FIYI", "poblacion": 1, "superficie": 1, "continente": "Oceanía"},
+            {"nombre": "Perú", "poblacion": 1, "superficie": 1, "continente": "América"},
+            {"nombre": "", "poblacion": 0, "superficie": 1, "continente": "Antártida"},
+        ]
+        exito, cantidad, errores = agregar_paises_lote(paises, lote)
+        assert (exito, cantidad) == (False, 0) and len(paises) == 3
+        assert [posicion for posicion, _ in errores] == [1, 2, 3]
+        assert len(errores[2][1]) == 3
+
+        exito, cantidad, errores = agregar_paises_lote(paises, lote[:1])
+        assert (exito, cantidad, errores) == (True, 1, [])
+        assert dict(paises[3]) == {"nombre": "Fiyi", "poblacion": 900, "superficie": 18, "continente": "Oceanía"}
+
+def test_actualizar_paises_lote_aplica_todo_o_nada():
+    for paises in ([dict(p) for p in PAISES], PaisTable.desde_dicts(PAISES)):
+        exito, _, errores = actualizar_paises_lote(paises, [
+            {"nombre": "peru", "poblacion": 5}, {"nombre": "Narnia", "superficie": 1}
+        ])
+        assert not exito and errores == [(1, ["No se encontró el país Narnia"])]
+        assert paises[0]["poblacion"] == 100
+
+        assert actualizar_paises_lote(paises, [
+            {"nombre": "peru", "poblacion": 5}, {"nombre": "JAPON", "superficie": 7}
+        ]) == (True, 2, [])
+        assert (paises[0]["poblacion"], paises[1]["superficie"]) == (5, 7)
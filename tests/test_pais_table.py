@@ -0,0 +1,46 @@
+from src.models.pais import PaisTable
+
+PAISES = [
+    {"nombre": "Perú", "poblacion": 100, "superficie": 10, "continente": "América"},
+    {"nombre": "Japón", "poblacion": 300, "superficie": 20, "continente": "Asia"},
+    {"nombre": "Chile", "poblacion": 200, "superficie": 30, "continente": "América"},
+]
+
+def test_tabla_se_comporta_como_lista_de_dicts():
+    tabla = PaisTable.desde_dicts(PAISES)
+    assert len(tabla) == 3
+    assert [dict(p) for p in tabla] == PAISES
+    assert tabla[-1]["nombre"] == "Chile"
+    assert tabla.categorias() == ["América", "Asia"]
+
+def test_asignar_en_fila_actualiza_la_columna():
+    tabla = PaisTable.desde_dicts(PAISES)
+    tabla[1]["poblacion"] = 999
+    assert tabla.columna("poblacion")[1] == 999
+
+def test_filtro_por_rango_usa_indice_mantenido_en_altas_y_cambios():
+    tabla = PaisTable.desde_dicts(PAISES)
+    assert [p["nombre"] for p in tabla.filtrar_rango("poblacion", 150, 300)] == ["Japón", "Chile"]
+
+    tabla.append({"nombre": "Fiyi", "poblacion": 250, "superficie": 5, "continente": "Oceanía"})
+    tabla[1]["poblacion"] = 10
+    assert [p["nombre"] for p in tabla.filtrar_rango("poblacion", 150, 300)] == ["Chile", "Fiyi"]
+    assert tabla.indice_ordenado("poblacion").contar_rango(0, float("inf")) == 4
+
+def test_copiar_es_independiente_y_conserva_la_version():
+    tabla = PaisTable.desde_dicts(PAISES)
+    copia = tabla.copiar()
+    copia[0]["poblacion"] = 1
+    copia.append({"nombre": "Fiyi", "poblacion": 250, "superficie": 5, "continente": "Oceanía"})
+    assert [dict(p) for p in tabla] == PAISES
+    assert tabla.version == 3 and copia.version == 5
+    assert copia.buscar_id("fiyi") == 3 and tabla.buscar_id("fiyi") is None
+
+def test_orden_por_nombre_usa_la_columna_en_minusculas_mantenida():
+    tabla = PaisTable.desde_dicts(PAISES)
+    assert [p["nombre"] for p in tabla.ordenar("nombre")] == ["Chile", "Japón", "Perú"]
+    minusculas = tabla.nombres_minusculas()
+
+    tabla.append({"nombre": "argentina", "poblacion": 1, "superficie": 1, "continente": "América"})
+    assert tabla.nombres_minusculas() is minusculas and minusculas[-1] == "argentina"
+    assert [p["nombre"] for p in tabla.ordenar("nombre", limite=2)] == ["argentina", "Chile"]
@@ -0,0 +1,54 @@
+from src.services import pais_service
+from src.utils import csv_handler, profiling, statistics
+import src.paises as app
+
+PAISES = [
+    {"nombre": "Perú", "poblacion": 100, "superficie": 10, "continente": "América"},
+    {"nombre": "Japón", "poblacion": 300, "superficie": 20, "continente": "Asia"},
+]
+
+def test_activar_mide_y_desactivar_restaura():
+    original = statistics.resumen_estadistico
+    original_carga = csv_handler.cargar_paises
+    profiling.activar(memoria=True)
+    try:
+        assert statistics.resumen_estadistico is not original
+        assert app.cargar_paises is csv_handler.cargar_paises is not original_carga
+        assert pais_service.ordenar_por_nombre(PAISES, limite=1)[0]["nombre"] == "Japón"
+        statistics.resumen_estadistico(PAISES)
+        metricas = profiling.reporte()
+        assert metricas["src.services.pais_service.ordenar_por_nombre"]["llamadas"] == 1
+        assert metricas["src.services.pais_service.ordenar_por_nombre"]["filas"] == 2
+        assert metricas["src.utils.statistics.resumen_estadistico"]["p99_s"] > 0
+        assert 'paises_llamadas_total{funcion="src.utils.statistics.resumen_estadistico"} 1' \
+            in profiling.reporte_prometheus()
+    finally:
+        profiling.desactivar()
+        profiling.reiniciar()
+    assert statistics.resumen_estadistico is original
+    # Los módulos que importaron la función por nombre también vuelven a la original
+    assert app.cargar_paises is original_carga
+    assert profiling.reporte() == {}
+
+def test_las_llamadas_que_fallan_tambien_se_miden():
+    profiling.activar()
+    try:
+        try:
+            pais_service.ordenar_por_nombre(PAISES, limite="uno")
+        except TypeError:
+            pass
+        metrica = profiling.reporte()["src.services.pais_service.ordenar_por_nombre"]
+        assert metrica["llamadas"] == 1 and metrica["segundos_total"] > 0
+    finally:
+        profiling.desactivar()
+        profiling.reiniciar()
+
+def test_opcion_profile_usa_las_variables_de_entorno(monkeypatch):
+    import src.main
+    opciones = []
+    monkeypatch.setattr(profiling, "activar", lambda **kwargs: opciones.append(kwargs))
+    monkeypatch.setattr("builtins.input", lambda *_: "9")
+    monkeypatch.setenv("PAISES_PROFILE_MEMORIA", "1")
+    monkeypatch.setenv("PAISES_PROFILE_SALIDA", "reporte.prom")
+    src.main.main(["--profile"])
+    assert opciones == [{"memoria": True, "salida": "reporte.prom"}]
@@ -0,0 +1,31 @@
+import io
+
+from src.models.pais import PaisTable
+from src.utils.render import escribir_tabla, paginar
+
+PAISES = [
+    {"nombre": "Perú", "poblacion": 100, "superficie": 10, "continente": "América"},
+    {"nombre": "República Democrática del Congo", "poblacion": 1_234_567, "superficie": 20, "continente": "África"},
+    {"nombre": "Chile", "poblacion": 200, "superficie": 30, "continente": "América"},
+]
+
+def test_tabla_alineada_en_bloques():
+    salida = io.StringIO()
+    escribir_tabla(PaisTable.desde_dicts(PAISES), salida, filas_por_escritura=2)
+    lineas = salida.getvalue().splitlines()
+    assert len(lineas) == 5
+    assert len({len(linea) for linea in lineas}) == 1
+    assert "1,234,567" in lineas[3]
+
+def test_tabla_vacia():
+    salida = io.StringIO()
+    escribir_tabla([], salida)
+    assert salida.getvalue() == "No hay países para mostrar.\n"
+
+def test_paginar_avanza_y_retrocede():
+    salida = io.StringIO()
+    ordenes = iter(["s", "a", "q"])
+    paginar(PAISES, 2, salida, entrada=lambda _: next(ordenes))
+    texto = salida.getvalue()
+    assert [linea for linea in texto.splitlines() if linea.startswith("Página")] == \
+        ["Página 1 de 2", "Página 2 de 2", "Página 1 de 2"]
@@ -0,0 +1,70 @@
+import gzip
+import http.client
+import json
+import os
+import threading
+
+from src.server import crear_servidor
+from src.utils.csv_handler import cargar_paises
+
+RUTA_CSV = os.path.join(os.path.dirname(__file__), "..", "data", "paises.csv")
+
+def levantar(paises):
+    servidor = crear_servidor(paises, puerto=0)
+    servidor.silencioso = True
+    threading.Thread(target=servidor.serve_forever, daemon=True).start()
+    return servidor
+
+def pedir(conexion, ruta, **cabeceras):
+    conexion.request("GET", ruta, headers=cabeceras)
+    respuesta = conexion.getresponse()
+    return respuesta, respuesta.read()
+
+def test_endpoints_etag_y_gzip_sobre_una_conexion():
+    paises = cargar_paises(RUTA_CSV)
+    servidor = levantar(paises)
+    try:
+        conexion = http.client.HTTPConnection(*servidor.server_address[:2])
+        respuesta, cuerpo = pedir(conexion, "/ordenar?campo=poblacion&descendente=1&limite=3")
+        assert respuesta.status == 200
+        assert [p["nombre"] for p in json.loads(cuerpo)] == \
+            [p["nombre"] for p in sorted(paises, key=lambda p: -p["poblacion"])[:3]]
+
+        etag = respuesta.getheader("ETag")
+        respuesta, cuerpo = pedir(conexion, "/buscar?q=argen", **{"If-None-Match": etag})
+        assert respuesta.status == 304 and cuerpo == b""
+
+        respuesta, cuerpo = pedir(conexion, "/paises", **{"Accept-Encoding": "gzip"})
+        assert respuesta.getheader("Content-Encoding") == "gzip"
+        assert len(json.loads(gzip.decompress(cuerpo))) == len(paises)
+
+        paises[0]["poblacion"] += 1
+        respuesta, _ = pedir(conexion, "/buscar?q=argen", **{"If-None-Match": etag})
+        assert respuesta.status == 200 and respuesta.getheader("ETag") != etag
+
+        respuesta, cuerpo = pedir(conexion, "/filtrar?min_poblacion=abc")
+        assert respuesta.status == 400 and "min_poblacion" in json.loads(cuerpo)["error"]
+        assert pedir(conexion, "/nada")[0].status == 404
+        conexion.close()
+    finally:
+        servidor.shutdown()
+        servidor.server_close()
+
+
+def test_parametros_invalidos_dan_400_aunque_coincida_el_etag():
+    paises = cargar_paises(RUTA_CSV)
+    servidor = levantar(paises)
+    try:
+        conexion = http.client.HTTPConnection(*servidor.server_address[:2])
+        etag = pedir(conexion, "/paises?limite=1")[0].getheader("ETag")
+
+        respuesta, cuerpo = pedir(conexion, "/filtrar?min_poblacion=abc", **{"If-None-Match": etag})
+        assert respuesta.status == 400 and "min_poblacion" in json.loads(cuerpo)["error"]
+        for ruta in ("/paises?desplazamiento=-1", "/paises?limite=-2", "/ordenar?campo=nombre&limite=-1"):
+            respuesta, cuerpo = pedir(conexion, ruta)
+            assert respuesta.status == 400, ruta
+        assert pedir(conexion, "/paises?limite=1", **{"If-None-Match": etag})[0].status == 304
+        conexion.close()
+    finally:
+        servidor.shutdown()
+        servidor.server_close()
@@ -0,0 +1,76 @@
+import os
+import threading
+
+import pytest
+
+from src.services import pais_service
+from src.utils import statistics
+from src.utils.csv_handler import cargar_paises
+from src.utils.sqlite_store import SqliteStore
+
+RUTA_CSV = os.path.join(os.path.dirname(__file__), "..", "data", "paises.csv")
+
+def como_dicts(paises):
+    return [dict(p) for p in paises]
+
+def test_consultas_sql_coinciden_con_los_servicios(tmp_path):
+    paises = como_dicts(cargar_paises(RUTA_CSV))
+    with SqliteStore(str(tmp_path / "paises.db")) as store:
+        assert store.importar_csv(RUTA_CSV, tamano_lote=7) == len(paises)
+        assert como_dicts(store.cargar_paises()) == paises
+        assert store.filtrar_por_continente("ÁFRICA") == pais_service.filtrar_por_continente(paises, "ÁFRICA")
+        assert store.filtrar_por_poblacion(1_000_000, 50_000_000) == \
+            pais_service.filtrar_por_poblacion(paises, 1_000_000, 50_000_000)
+        assert store.buscar_pais("pai") == pais_service.buscar_pais(paises, "pai")
+        assert store.ordenar_por_nombre(True, limite=5) == pais_service.ordenar_por_nombre(paises, True, limite=5)
+        assert store.promedio_poblacion() == statistics.promedio_poblacion(paises)
+        assert store.pais_mas_pequeno() == statistics.pais_mas_pequeno(paises)
+        assert store.estadisticas_continente("asia") == statistics.estadisticas_continente(paises, "asia")
+
+def test_altas_y_modificaciones(tmp_path):
+    with SqliteStore(str(tmp_path / "paises.db")) as store:
+        assert store.agregar_pais("Perú", 100, 10, "América")
+        assert not store.agregar_pais("PERU", 1, 1, "América")
+        assert store.actualizar_pais("peru", nueva_superficie=20)
+        assert not store.actualizar_pais("Narnia", nueva_poblacion=1)
+        assert store.pais_mas_grande() == {
+            "nombre": "Perú", "poblacion": 100, "superficie": 20, "continente": "América"
+        }
+
+def test_lector_de_otro_hilo_no_ve_ni_espera_una_escritura_en_curso(tmp_path):
+    with SqliteStore(str(tmp_path / "paises.db")) as store:
+        store.importar_csv(RUTA_CSV)
+        cantidad = len(store)
+        en_curso, seguir = threading.Event(), threading.Event()
+
+        def filas_lentas():
+            # La transacción de guardar_paises queda abierta (ya borró todo) hasta que se lea
+            yield {"nombre": "Perú", "poblacion": 1, "superficie": 1, "continente": "América"}
+            en_curso.set()
+            seguir.wait(5)
+
+        escritor = threading.Thread(target=store.guardar_paises, args=(filas_lentas(),))
+        escritor.start()
+        assert en_curso.wait(5)
+        vistos = []
+        lector = threading.Thread(target=lambda: vistos.append((len(store), store.pais_mas_poblado())))
+        lector.start()
+        lector.join(5)
+        seguir.set()
+        escritor.join()
+
+        assert vistos and vistos[0][0] == cantidad and vistos[0][1]["poblacion"] > 1
+        assert len(store) == 1
+
+def test_base_en_memoria_se_rechaza():
+    with pytest.raises(ValueError, match="memoria"):
+        SqliteStore(":memory:")
+
+def test_estadisticas_continente_leen_en_una_sola_transaccion(tmp_path):
+    with SqliteStore(str(tmp_path / "paises.db")) as store:
+        store.importar_csv(RUTA_CSV)
+        sentencias = []
+        store._conexion.set_trace_callback(sentencias.append)
+        assert store.estadisticas_continente("asia")["total_paises"] > 0
+        assert sentencias[0] == "BEGIN" and sentencias[-1] == "COMMIT"
+        assert sum(s.startswith("SELECT") for s in sentencias) == 3
@@ -0,0 +1,77 @@
+import pytest
+
+from src.utils import statistics
+from src.models.pais import PaisTable
+from src.utils.statistics import (
+    agrupar_por, densidad_poblacional, densidades, estadisticas_continente, estadisticas_por_continente, pais_mas_grande, pais_mas_pequeno, pais_mas_poblado,
+    pais_menos_poblado, promedio_poblacion, promedio_superficie, resumen_estadistico
+)
+
+PAISES = [
+    {"nombre": "A", "poblacion": 100, "superficie": 10, "continente": "X"},
+    {"nombre": "B", "poblacion": 300, "superficie": 0, "continente": "Y"},
+    {"nombre": "C", "poblacion": 300, "superficie": 40, "continente": "X"},
+    {"nombre": "D", "poblacion": 50, "superficie": 40, "continente": "Y"},
+]
+
+def test_resumen_coincide_con_las_funciones_individuales():
+    for paises in (PAISES, PaisTable.desde_dicts(PAISES)):
+        resumen = resumen_estadistico(paises)
+        assert resumen["promedio_poblacion"] == promedio_poblacion(paises)
+        assert resumen["promedio_superficie"] == promedio_superficie(paises)
+        assert resumen["pais_mas_poblado"] == pais_mas_poblado(paises)
+        assert resumen["pais_menos_poblado"] == pais_menos_poblado(paises)
+        assert resumen["pais_mas_grande"] == pais_mas_grande(paises)
+        assert resumen["pais_mas_pequeno"] == pais_mas_pequeno(paises)
+        assert list(densidades(paises)) == [densidad_poblacional(p) for p in paises]
+
+def test_resumen_de_lista_vacia():
+    assert resumen_estadistico([])["pais_mas_poblado"] is None
+
+def test_agrupar_por_calcula_todos_los_grupos_en_una_pasada():
+    grupos = agrupar_por(PaisTable.desde_dicts(PAISES), "continente")
+    assert list(grupos) == ["X", "Y"]
+    assert grupos["X"]["cantidad"] == 2
+    assert grupos["X"]["poblacion"] == {
+        "suma": 400, "promedio": 200, "minimo": 100, "maximo": 300, "argmax": PAISES[2]
+    }
+    assert grupos["Y"]["superficie"]["argmax"]["nombre"] == "D"
+
+def test_estadisticas_continente_ignora_mayusculas():
+    estadisticas = estadisticas_continente(PAISES, "x")
+    assert estadisticas["continente"] == "x"
+    assert estadisticas["total_paises"] == 2
+    assert estadisticas["pais_mas_poblado"]["nombre"] == "C"
+    assert estadisticas_continente(PAISES, "Z") is None
+
+def test_agregados_mantenidos_siguen_las_actualizaciones():
+    tabla = PaisTable.desde_dicts(PAISES)
+    assert pais_mas_poblado(tabla)["nombre"] == "B"
+    tabla[1]["poblacion"] = 1
+    tabla.append({"nombre": "E", "poblacion": 1000, "superficie": 1, "continente": "X"})
+    assert pais_mas_poblado(tabla)["nombre"] == "E"
+    assert pais_menos_poblado(tabla)["nombre"] == "B"
+    assert promedio_poblacion(tabla) == (100 + 1 + 300 + 50 + 1000) / 5
+    assert estadisticas_continente(tabla, "x")["poblacion_total"] == 1400
+
+def test_estadisticas_por_continente_muestran_la_escritura_original():
+    paises = PAISES + [{"nombre": "E", "poblacion": 1, "superficie": 1, "continente": "x"}]
+    for coleccion in (paises, PaisTable.desde_dicts(paises)):
+        estadisticas = estadisticas_por_continente(coleccion)
+        assert list(estadisticas) == ["x", "y"]
+        assert [e["continente"] for e in estadisticas.values()] == ["X", "Y"]
+        assert estadisticas["x"]["total_paises"] == 3
+
+def test_motor_numpy_coincide_con_python_puro(monkeypatch):
+    pytest.importorskip("numpy")
+    # Empates en máximos y mínimos (gana el primero) y superficies en 0
+    paises = PAISES + [
+        {"nombre": "E", "poblacion": 50, "superficie": 0, "continente": "Z"},
+        {"nombre": "F", "poblacion": 0, "superficie": 40, "continente": "Z"},
+    ]
+    for coleccion in (paises, PaisTable.desde_dicts(paises)):
+        assert statistics._resumen_numpy(coleccion) == statistics._resumen_python(coleccion)
+        vectorizadas = densidades.__wrapped__(coleccion)
+        with monkeypatch.context() as m:
+            m.setattr(statistics, "np", None)
+            assert list(vectorizadas) == densidades.__wrapped__(coleccion)
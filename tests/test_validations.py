@@ -0,0 +1,21 @@
+from src.utils.validations import normalizar, validar_datos_pais, validar_entero_positivo, validar_pais
+
+def test_normalizar_con_y_sin_tildes():
+    assert normalizar("  ÁFRICA ") == "africa"
+    assert normalizar("Perú") == normalizar("PERU") == "peru"
+    assert normalizar("Côte d'Ivoire") == "cote d'ivoire"
+
+def test_entero_positivo_rechaza_cero_y_tipos_invalidos():
+    assert validar_entero_positivo("12", "Población") == (True, 12, None)
+    assert not validar_entero_positivo(0, "Población")[0]
+    assert not validar_entero_positivo(None, "Población")[0]
+
+def test_validar_pais_por_esquema():
+    assert validar_pais({"nombre": " Chile ", "poblacion": "5", "superficie": 7, "continente": "america"}) == \
+        (True, {"nombre": "Chile", "poblacion": 5, "superficie": 7, "continente": "América"}, [])
+    es_valido, datos, errores = validar_pais({"nombre": "", "poblacion": -1, "continente": "Antártida"})
+    assert not es_valido and datos is None and len(errores) == 4
+
+def test_validar_datos_pais_capitaliza_el_nombre():
+    assert validar_datos_pais("nueva zelanda", 5, 268_000, "oceania") == \
+        (True, {"nombre": "Nueva Zelanda", "poblacion": 5, "superficie": 268_000, "continente": "Oceanía"}, None)